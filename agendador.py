@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+🧩 AGENDADOR DE ETAPAS (DAG) COM CACHE POR HASH DAS ENTRADAS
+============================================================
+
+O workflow rodava scraping → reorganização → histórico → email inteiro mesmo
+quando os dados coletados eram os mesmos de ontem:
+✅ Cada etapa declara dependências, entradas e saídas (tipos do manifesto)
+✅ Hash das entradas pelo conteúdo (sem campos voláteis como timestamp e data_coleta)
+   + hash do script da etapa
+✅ Etapa com entradas inalteradas é pulada e as saídas em cache são reaproveitadas
+✅ --force [etapa...] força a execução; --explicar mostra o que rodaria e por quê, sem executar
+✅ Scripts executados no mesmo processo (runpy), com a saída ao vivo
+✅ Cada etapa recebe uma fatia (peso) do orçamento de tempo da execução (prazos.py)
+✅ --resume pula as etapas concluídas na execução interrompida e repassa a
+   retomada aos scripts (checkpoints.py)
+
+Uso: python agendador.py [etapa...] [--force [etapa...]] [--explicar] [--resume]
+"""
+
+import os
+import sys
+import json
+import runpy
+import shutil
+import hashlib
+import traceback
+from datetime import datetime
+
+from armazenamento import carregar_mais_recente
+from manifesto import artefato, registrar_artefato, hash_arquivo
+from snapshots import estado_de_dados, hash_conteudo
+from prazos import etapa_com_prazo, prazo_da_execucao
+from checkpoints import Checkpoint
+
+DIRETORIO_CACHE = os.getenv('SCRAPER_CACHE_DAG', '.cache_dag')
+
+
+class Tarefa:
+    """Etapa do DAG: um script executado com 'argumentos'; entradas/saídas são tipos do manifesto
+
+    peso: fatia do tempo restante da execução reservada para a etapa, relativa às etapas seguintes.
+    """
+
+    def __init__(self, nome, script, argumentos=(), depende=(), entradas=(), saidas=(), sempre=False, peso=1):
+        self.nome = nome
+        self.script = script
+        self.argumentos = list(argumentos)
+        self.depende = list(depende)
+        self.entradas = list(entradas)
+        self.saidas = list(saidas)
+        self.sempre = sempre
+        self.peso = peso
+
+
+# Etapas do workflow (.github/workflows/scraper.yml)
+TAREFAS = [
+    # Estratégias padrão de fontes.py: scraper rápido (UFMG, FAPEMIG, CNPq), CNPq detalhado e inteligente
+    Tarefa('coleta', 'coletar.py',
+           saidas=['editais_rapidos', 'chamadas_cnpq_detalhadas', 'chamadas_cnpq_inteligentes'],
+           sempre=True, peso=7),
+    Tarefa('reorganizar', 'reorganizar_dados.py',
+           depende=['coleta'],
+           entradas=['editais_rapidos', 'chamadas_cnpq_detalhadas'],
+           saidas=['dados_reorganizados_com_pdfs']),
+    Tarefa('historico', 'arquivo_historico.py', argumentos=['compactar', '*_2*.json'],
+           depende=['reorganizar'], sempre=True),
+    Tarefa('indice', 'indice_historico.py', argumentos=['construir'], depende=['historico'], sempre=True),
+    Tarefa('email', 'enviar_email_simples.py',
+           depende=['reorganizar', 'indice'],
+           entradas=['editais_rapidos', 'chamadas_cnpq_detalhadas', 'chamadas_cnpq_inteligentes',
+                     'dados_reorganizados_com_pdfs']),
+]
+
+
+def hash_dados(dados):
+    """Hash estável do conteúdo: registros sem campos voláteis; metadados (timestamp etc.) ignorados"""
+    registros, _ = estado_de_dados(dados)
+    sha = hashlib.sha256()
+    for chave in sorted(registros):
+        sha.update(f"{chave}={hash_conteudo(registros[chave])}\n".encode('utf-8'))
+    return sha.hexdigest()
+
+
+def hash_entradas(tarefa):
+    """Hash do script da etapa + conteúdo de cada entrada. Retorna (hash, {entrada: hash})"""
+    partes = {'script': hash_arquivo(tarefa.script) if os.path.exists(tarefa.script) else 'ausente',
+              'argumentos': ' '.join(tarefa.argumentos)}
+    for tipo in tarefa.entradas:
+        dados, _ = carregar_mais_recente(tipo)
+        partes[tipo] = hash_dados(dados) if dados is not None else 'ausente'
+    texto = json.dumps(partes, sort_keys=True)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest(), partes
+
+
+def ordenar(tarefas, alvos=None):
+    """Ordem topológica das tarefas (só os alvos e suas dependências, se houver alvos)"""
+    por_nome = {tarefa.nome: tarefa for tarefa in tarefas}
+    ordem = []
+    visitando = set()
+
+    def visitar(nome):
+        if nome in ordem:
+            return
+        if nome in visitando:
+            raise ValueError(f"Ciclo no DAG envolvendo '{nome}'")
+        if nome not in por_nome:
+            raise ValueError(f"Etapa desconhecida: '{nome}'")
+        visitando.add(nome)
+        for dependencia in por_nome[nome].depende:
+            visitar(dependencia)
+        visitando.discard(nome)
+        ordem.append(nome)
+
+    for nome in (alvos or por_nome):
+        visitar(nome)
+    return [por_nome[nome] for nome in ordem]
+
+
+class AgendadorDAG:
+    """Executa as tarefas em ordem topológica, pulando as que têm entradas inalteradas"""
+
+    def __init__(self, tarefas=TAREFAS, diretorio_cache=DIRETORIO_CACHE):
+        self.tarefas = tarefas
+        self.diretorio_cache = diretorio_cache
+        self.caminho_estado = os.path.join(diretorio_cache, 'estado.json')
+        self.estado = self._ler_estado()
+
+    def _ler_estado(self):
+        try:
+            with open(self.caminho_estado, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _gravar_estado(self):
+        os.makedirs(self.diretorio_cache, exist_ok=True)
+        temporario = f"{self.caminho_estado}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(self.estado, f, ensure_ascii=False, indent=2)
+        os.replace(temporario, self.caminho_estado)
+
+    def _guardar_saidas(self, tarefa):
+        # Cópia das saídas no cache, para reaproveitar mesmo em um checkout novo (CI)
+        os.makedirs(self.diretorio_cache, exist_ok=True)
+        saidas = {}
+        for tipo in tarefa.saidas:
+            entrada = artefato(tipo)
+            if not entrada or not os.path.exists(entrada['caminho']):
+                continue
+            copia = os.path.join(self.diretorio_cache, os.path.basename(entrada['caminho']))
+            shutil.copyfile(entrada['caminho'], copia)
+            saidas[tipo] = {'caminho': entrada['caminho'], 'copia': copia, 'sha256': entrada['sha256'],
+                            'registros': entrada.get('registros')}
+        return saidas
+
+    def _restaurar_saidas(self, tarefa):
+        """Recoloca no manifesto as saídas em cache. Retorna False se alguma se perdeu"""
+        for tipo, saida in self.estado[tarefa.nome].get('saidas', {}).items():
+            atual = artefato(tipo)
+            if atual and atual['sha256'] == saida['sha256'] and os.path.exists(atual['caminho']):
+                continue
+            if not os.path.exists(saida['copia']):
+                return False
+            if not os.path.exists(saida['caminho']):
+                shutil.copyfile(saida['copia'], saida['caminho'])
+            registrar_artefato(tipo, saida['caminho'], saida.get('registros'))
+        return True
+
+    def decidir(self, tarefa, forcadas, executadas):
+        """(executar?, motivo, hash das entradas)"""
+        if tarefa.nome in forcadas or '*' in forcadas:
+            return True, "forçada (--force)", None
+        if tarefa.sempre:
+            return True, "sempre executa (dados externos ou etapa idempotente)", None
+
+        anterior = self.estado.get(tarefa.nome)
+        if not anterior:
+            return True, "sem execução anterior registrada", None
+
+        pendentes = [d for d in tarefa.depende if d in executadas and executadas[d] is None]
+        if pendentes:
+            return True, f"depende de {', '.join(pendentes)}, que será executada", None
+
+        atual, partes = hash_entradas(tarefa)
+        if atual != anterior['hash']:
+            mudaram = [nome for nome, valor in partes.items() if anterior.get('partes', {}).get(nome) != valor]
+            return True, f"entradas mudaram: {', '.join(mudaram) or 'hash'}", atual
+        return False, f"entradas inalteradas desde {anterior['executada_em'][:19]}", atual
+
+    def executar_tarefa(self, tarefa, pesos_restantes=None):
+        """Roda o script da tarefa no processo atual. Retorna True se terminou sem erro"""
+        argv = sys.argv
+        sys.argv = [tarefa.script] + tarefa.argumentos
+        try:
+            with etapa_com_prazo(tarefa.nome, tarefa.peso, pesos_restantes or tarefa.peso) as prazo:
+                print(f"⏳ Prazo da etapa: {prazo.restante():.0f}s")
+                runpy.run_path(tarefa.script, run_name='__main__')
+            return True
+        except SystemExit as e:
+            return e.code in (None, 0)
+        except Exception as e:
+            print(f"❌ Erro em {tarefa.nome}: {e}")
+            traceback.print_exc()
+            return False
+        finally:
+            sys.argv = argv
+
+    def executar(self, alvos=None, forcadas=(), explicar=False, retomar=False):
+        """Executa (ou só explica) o DAG. Retorna True se todas as tarefas tiveram sucesso"""
+        if hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(line_buffering=True)
+
+        forcadas = set(forcadas)
+        ordem = ordenar(self.tarefas, alvos)
+        checkpoint = None
+        if not explicar:
+            print(f"⏳ Orçamento de tempo: {prazo_da_execucao().restante():.0f}s")
+            checkpoint = Checkpoint('agendador', retomar=retomar)
+            if retomar:
+                # Os scripts das etapas também retomam dos seus checkpoints
+                os.environ['SCRAPER_RETOMAR'] = '1'
+        # nome -> None (executaria, no modo explicar), True/False (resultado) ou 'pulada'
+        executadas = {}
+        sucesso = True
+
+        for indice, tarefa in enumerate(ordem):
+            falhas = [d for d in tarefa.depende if executadas.get(d) is False]
+            if falhas:
+                print(f"⏭️ {tarefa.nome}: não executada (falha em {', '.join(falhas)})")
+                executadas[tarefa.nome] = False
+                continue
+
+            if checkpoint and checkpoint.etapa_concluida(tarefa.nome) and tarefa.nome not in forcadas:
+                print(f"💾 {tarefa.nome}: concluída na execução interrompida (checkpoint)")
+                executadas[tarefa.nome] = 'pulada'
+                continue
+
+            executar, motivo, hash_atual = self.decidir(tarefa, forcadas, executadas)
+
+            if not executar and not explicar and not self._restaurar_saidas(tarefa):
+                executar, motivo = True, "saídas em cache não encontradas"
+
+            if explicar:
+                print(f"{'▶️ executaria' if executar else '⏭️ pularia'} {tarefa.nome}: {motivo}")
+                # Etapas 'sempre' não mudam a previsão: as seguintes são avaliadas com os dados atuais
+                executadas[tarefa.nome] = None if executar and not tarefa.sempre else 'pulada'
+                continue
+
+            if not executar:
+                print(f"⏭️ {tarefa.nome}: pulada ({motivo})")
+                executadas[tarefa.nome] = 'pulada'
+                continue
+
+            print(f"\n▶️ {tarefa.nome}: executando ({motivo})")
+            print("-" * 60)
+            ok = self.executar_tarefa(tarefa, sum(seguinte.peso for seguinte in ordem[indice:]))
+            executadas[tarefa.nome] = ok
+            if not ok:
+                print(f"❌ {tarefa.nome} falhou")
+                sucesso = False
+                continue
+            checkpoint.concluir_etapa(tarefa.nome)
+
+            if not tarefa.sempre:
+                hash_atual, partes = hash_entradas(tarefa)
+                self.estado[tarefa.nome] = {
+                    'hash': hash_atual,
+                    'partes': partes,
+                    'executada_em': datetime.now().isoformat(),
+                    'saidas': self._guardar_saidas(tarefa)
+                }
+                self._gravar_estado()
+
+        if checkpoint and sucesso:
+            checkpoint.limpar()
+        return sucesso
+
+
+def main():
+    print("🧩 AGENDADOR DE ETAPAS (DAG)")
+    print("=" * 50)
+
+    argumentos = sys.argv[1:]
+    explicar = '--explicar' in argumentos
+    retomar = '--resume' in argumentos
+    forcadas = []
+    alvos = []
+    lendo_forcadas = False
+    for argumento in argumentos:
+        if argumento in ('--explicar', '--resume'):
+            continue
+        if argumento == '--force':
+            lendo_forcadas = True
+            continue
+        (forcadas if lendo_forcadas else alvos).append(argumento)
+    if lendo_forcadas and not forcadas:
+        forcadas = ['*']
+
+    sucesso = AgendadorDAG().executar(alvos or None, forcadas, explicar, retomar)
+    return 0 if sucesso else 1
+
+
+if __name__ == "__main__":
+    exit(main())
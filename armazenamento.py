@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+🗄️ ARMAZENAMENTO DOS RESULTADOS EM SQLITE
+=========================================
+
+Um único banco SQLite (modo WAL) no lugar da busca pelo "*_AAAAMMDD_HHMMSS.json
+mais recente" em cada leitor:
+✅ Tabelas de execuções, chamadas, anexos e links
+✅ Índices por fonte, número, prazo e execução
+✅ Gravação em lotes dentro de uma única transação por execução
+✅ Consultas indexadas: "chamadas abertas por prazo", "última execução por fonte"
+✅ Leitores resolvem o mais recente pelo manifesto (manifesto.py) e pelo banco,
+   e só procuram nos arquivos JSON quando nenhum dos dois conhece o tipo
+✅ Cada execução também vira um delta em snapshots/ (snapshots.py), que guarda o
+   histórico: o banco mantém só a última execução de cada tipo (e as que ainda
+   são a mais recente de alguma fonte)
+✅ Leitores recebem a cópia interna compacta (serializacao.py) quando ela existe
+"""
+
+import os
+import re
+import glob
+import json
+from datetime import datetime, date
+
+from deduplicacao import normalizar_numero
+from modelos import CHAVES_LISTAS, Chamada, texto_de
+from manifesto import ler_manifesto, registrar_artefato, artefato, caminho_artefato, contar_registros
+from serializacao import salvar_interno, carregar_arquivo
+from snapshots import registrar_snapshot
+from importacao import preguicoso
+
+# Só carregado por quem usa o banco
+sqlite3 = preguicoso('sqlite3')
+
+CAMINHO_PADRAO = os.getenv('SCRAPER_DB', 'resultados_scrapers.db')
+TAMANHO_LOTE = 500
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tipo TEXT NOT NULL,
+    arquivo TEXT,
+    criada_em TEXT NOT NULL,
+    total_chamadas INTEGER NOT NULL DEFAULT 0,
+    metadados TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS chamadas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id) ON DELETE CASCADE,
+    lista TEXT,
+    posicao INTEGER NOT NULL,
+    fonte TEXT,
+    numero TEXT,
+    titulo TEXT,
+    prazo TEXT,
+    link TEXT,
+    dados TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS anexos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    chamada_id INTEGER NOT NULL REFERENCES chamadas(id) ON DELETE CASCADE,
+    nome TEXT,
+    url TEXT,
+    tipo TEXT
+);
+CREATE TABLE IF NOT EXISTS links (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    chamada_id INTEGER NOT NULL REFERENCES chamadas(id) ON DELETE CASCADE,
+    texto TEXT,
+    url TEXT,
+    tipo TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_execucoes_tipo ON execucoes(tipo, id);
+CREATE INDEX IF NOT EXISTS idx_chamadas_execucao ON chamadas(execucao_id, lista, posicao);
+CREATE INDEX IF NOT EXISTS idx_chamadas_fonte ON chamadas(fonte, execucao_id);
+CREATE INDEX IF NOT EXISTS idx_chamadas_numero ON chamadas(numero);
+CREATE INDEX IF NOT EXISTS idx_chamadas_prazo ON chamadas(prazo);
+CREATE INDEX IF NOT EXISTS idx_anexos_chamada ON anexos(chamada_id);
+CREATE INDEX IF NOT EXISTS idx_links_chamada ON links(chamada_id);
+"""
+
+
+def _em_lotes(itens, tamanho=TAMANHO_LOTE):
+    lote = []
+    for item in itens:
+        lote.append(item)
+        if len(lote) >= tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def _lista_de_registros(valor):
+    return isinstance(valor, list) and bool(valor) and all(isinstance(item, dict) for item in valor)
+
+
+class ArmazenamentoResultados:
+    """Banco SQLite com todas as execuções dos scrapers e etapas seguintes"""
+
+    def __init__(self, caminho=CAMINHO_PADRAO):
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.row_factory = sqlite3.Row
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.execute("PRAGMA foreign_keys=ON")
+        self.conexao.executescript(ESQUEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+    def fechar(self):
+        self.conexao.close()
+
+    def registrar_execucao(self, tipo, dados, arquivo=None):
+        """Grava uma execução completa (o mesmo dict salvo no JSON) em uma transação"""
+        metadados = {}
+        if _lista_de_registros(dados):
+            listas = {'': dados}
+        else:
+            listas = {}
+            for chave, valor in dados.items():
+                if chave in CHAVES_LISTAS and _lista_de_registros(valor):
+                    listas[chave] = valor
+                else:
+                    metadados[chave] = valor
+
+        with self.conexao:
+            cursor = self.conexao.execute(
+                "INSERT INTO execucoes (tipo, arquivo, criada_em, total_chamadas, metadados) VALUES (?, ?, ?, ?, ?)",
+                (tipo, arquivo, datetime.now().isoformat(), sum(len(v) for v in listas.values()),
+                 json.dumps(metadados, ensure_ascii=False))
+            )
+            execucao_id = cursor.lastrowid
+
+            for lista, registros in listas.items():
+                fonte_lista = CHAVES_LISTAS.get(lista)
+                for lote in _em_lotes(enumerate(registros)):
+                    self._gravar_lote(execucao_id, lista, fonte_lista, lote)
+
+            self._descartar_anteriores(tipo, execucao_id)
+
+        return execucao_id
+
+    def _descartar_anteriores(self, tipo, execucao_id):
+        # Execuções passadas ficam nos snapshots; uma cópia completa por execução no
+        # banco só o faria crescer. Anexos e links saem junto (ON DELETE CASCADE)
+        self.conexao.execute(
+            "DELETE FROM execucoes WHERE tipo = ? AND id < ? AND id NOT IN ("
+            "  SELECT MAX(execucao_id) FROM chamadas WHERE fonte != '' GROUP BY fonte"
+            ")",
+            (tipo, execucao_id)
+        )
+
+    def _gravar_lote(self, execucao_id, lista, fonte_lista, lote):
+        anexos = []
+        links = []
+        for posicao, registro in lote:
+            chamada = Chamada.from_dict(registro, fonte=fonte_lista)
+            cursor = self.conexao.execute(
+                "INSERT INTO chamadas (execucao_id, lista, posicao, fonte, numero, titulo, prazo, link, dados) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (execucao_id, lista, posicao, texto_de(chamada.fonte), normalizar_numero(chamada.numero),
+                 chamada.titulo, chamada.prazo_iso, chamada.link, json.dumps(registro, ensure_ascii=False))
+            )
+            chamada_id = cursor.lastrowid
+            anexos.extend((chamada_id, a.nome, a.url, texto_de(a.tipo)) for a in chamada.anexos)
+            links.extend((chamada_id, l.texto, l.url, texto_de(l.tipo)) for l in chamada.links_importantes)
+
+        self.conexao.executemany("INSERT INTO anexos (chamada_id, nome, url, tipo) VALUES (?, ?, ?, ?)", anexos)
+        self.conexao.executemany("INSERT INTO links (chamada_id, texto, url, tipo) VALUES (?, ?, ?, ?)", links)
+
+    def ultima_execucao(self, tipo):
+        """Execução mais recente de um tipo (ex.: 'editais_rapidos'), ou None
+
+        Como o glob '<tipo>_*.json', 'dados_reorganizados' também casa com
+        'dados_reorganizados_com_pdfs' e 'dados_reorganizados_solucao_definitiva'.
+        """
+        prefixo = tipo.replace('\\', '\\\\').replace('_', '\\_').replace('%', '\\%') + '\\_%'
+        linha = self.conexao.execute(
+            "SELECT * FROM execucoes WHERE tipo = ? OR tipo LIKE ? ESCAPE '\\' ORDER BY id DESC LIMIT 1",
+            (tipo, prefixo)
+        ).fetchone()
+        return dict(linha) if linha else None
+
+    def ultimas_execucoes_por_fonte(self):
+        """Execução mais recente que trouxe chamadas de cada fonte: {fonte: execução}"""
+        linhas = self.conexao.execute(
+            "SELECT u.fonte, e.* FROM ("
+            "  SELECT fonte, MAX(execucao_id) AS execucao_id FROM chamadas"
+            "  WHERE fonte != '' GROUP BY fonte"
+            ") u JOIN execucoes e ON e.id = u.execucao_id"
+        ).fetchall()
+        return {linha['fonte']: dict(linha) for linha in linhas}
+
+    def carregar_execucao(self, execucao_id):
+        """Reconstrói o dict original de uma execução"""
+        execucao = self.conexao.execute("SELECT * FROM execucoes WHERE id = ?", (execucao_id,)).fetchone()
+        if execucao is None:
+            return None
+
+        dados = json.loads(execucao['metadados'])
+        linhas = self.conexao.execute(
+            "SELECT lista, dados FROM chamadas WHERE execucao_id = ? ORDER BY lista, posicao", (execucao_id,)
+        )
+        for linha in linhas:
+            dados.setdefault(linha['lista'], []).append(json.loads(linha['dados']))
+
+        if list(dados) == ['']:
+            return dados['']
+        return dados
+
+    def carregar_ultimo(self, tipo):
+        """Dict da execução mais recente de um tipo, ou None"""
+        execucao = self.ultima_execucao(tipo)
+        return self.carregar_execucao(execucao['id']) if execucao else None
+
+    def chamadas_abertas(self, hoje=None, fonte=None):
+        """Chamadas da última execução de cada fonte com prazo a partir de hoje, por prazo"""
+        hoje = hoje or date.today().isoformat()
+        consulta = (
+            "SELECT c.* FROM chamadas c JOIN ("
+            "  SELECT fonte, MAX(execucao_id) AS execucao_id FROM chamadas GROUP BY fonte"
+            ") u ON c.fonte = u.fonte AND c.execucao_id = u.execucao_id "
+            "WHERE c.prazo >= ?"
+        )
+        parametros = [hoje]
+        if fonte:
+            consulta += " AND c.fonte = ?"
+            parametros.append(texto_de(fonte))
+        consulta += " ORDER BY c.prazo, c.titulo"
+        return [dict(linha) for linha in self.conexao.execute(consulta, parametros)]
+
+
+def salvar_execucao(tipo, dados, arquivo=None, caminho=CAMINHO_PADRAO):
+    """Registra a execução no manifesto, nos snapshots e no banco sem interromper o script em caso de erro"""
+    if arquivo:
+        # Cópia compacta para a próxima etapa; o JSON formatado fica só como artefato publicado
+        interno = None
+        try:
+            interno = salvar_interno(dados, arquivo)
+        except Exception as e:
+            print(f"⚠️ Cópia interna não gravada: {e}")
+
+        try:
+            registrar_artefato(tipo, arquivo, contar_registros(dados), interno=interno)
+        except Exception as e:
+            print(f"❌ Erro ao atualizar o manifesto: {e}")
+
+    registrar_snapshot(tipo, dados)
+
+    try:
+        with ArmazenamentoResultados(caminho) as armazenamento:
+            execucao_id = armazenamento.registrar_execucao(tipo, dados, arquivo)
+        print(f"🗄️ Execução {execucao_id} registrada em: {caminho}")
+        return execucao_id
+    except Exception as e:
+        print(f"❌ Erro ao registrar execução no banco: {e}")
+        return None
+
+
+def _arquivo_mais_recente_glob(padrao):
+    # Último recurso para arquivos anteriores ao manifesto: o timestamp do nome
+    # ordena as execuções (ctimes são todos iguais em um checkout do CI)
+    arquivos = glob.glob(padrao)
+    if not arquivos:
+        return None
+
+    def ordem(arquivo):
+        match = re.search(r'(\d{8}_\d{6})', os.path.basename(arquivo))
+        return (match.group(1) if match else '', os.path.getmtime(arquivo))
+
+    return max(arquivos, key=ordem)
+
+
+def localizar_mais_recente(tipo, padrao=None, caminho=CAMINHO_PADRAO):
+    """Caminho do arquivo mais recente de um tipo: manifesto, banco, ou busca nos arquivos"""
+    arquivo = caminho_artefato(tipo)
+    if arquivo:
+        return arquivo
+
+    if os.path.exists(caminho):
+        try:
+            with ArmazenamentoResultados(caminho) as armazenamento:
+                execucao = armazenamento.ultima_execucao(tipo)
+            if execucao and execucao['arquivo'] and os.path.exists(execucao['arquivo']):
+                return execucao['arquivo']
+        except sqlite3.Error as e:
+            print(f"⚠️ Banco indisponível ({e}), procurando arquivos...")
+    return _arquivo_mais_recente_glob(padrao or f'{tipo}_*.json')
+
+
+def localizar_mais_recente_da_fonte(fonte, padrao, caminho=CAMINHO_PADRAO):
+    """Arquivo da última execução que trouxe chamadas de uma fonte, ou o glob 'padrao'"""
+    if os.path.exists(caminho):
+        try:
+            with ArmazenamentoResultados(caminho) as armazenamento:
+                execucao = armazenamento.ultimas_execucoes_por_fonte().get(texto_de(fonte))
+            if execucao and execucao['arquivo'] and os.path.exists(execucao['arquivo']):
+                return execucao['arquivo']
+        except sqlite3.Error as e:
+            print(f"⚠️ Banco indisponível ({e}), procurando arquivos...")
+    return _arquivo_mais_recente_glob(padrao)
+
+
+def carregar_mais_recente(tipo, padrao=None, caminho=CAMINHO_PADRAO):
+    """Dados mais recentes de um tipo: (dados, origem). Manifesto, banco, ou busca nos arquivos"""
+    entrada = artefato(tipo)
+    if entrada and entrada.get('interno') and os.path.exists(entrada['interno']):
+        try:
+            return carregar_arquivo(entrada['interno']), entrada['interno']
+        except Exception as e:
+            print(f"⚠️ Cópia interna ilegível ({e}), lendo o JSON publicado")
+
+    arquivo = caminho_artefato(tipo)
+
+    if not arquivo and os.path.exists(caminho):
+        try:
+            with ArmazenamentoResultados(caminho) as armazenamento:
+                execucao = armazenamento.ultima_execucao(tipo)
+                if execucao:
+                    return armazenamento.carregar_execucao(execucao['id']), f"{caminho}#{execucao['id']}"
+        except sqlite3.Error as e:
+            print(f"⚠️ Banco indisponível ({e}), procurando arquivos...")
+
+    arquivo = arquivo or _arquivo_mais_recente_glob(padrao or f'{tipo}_*.json')
+    if not arquivo:
+        return None, None
+    return carregar_arquivo(arquivo), arquivo
+
+
+def main():
+    """Importa para o banco e o manifesto os arquivos JSON já existentes e mostra as chamadas abertas"""
+    print("🗄️ ARMAZENAMENTO SQLITE DOS RESULTADOS")
+    print("=" * 50)
+
+    tipos = [
+        'editais_rapidos', 'chamadas_cnpq_detalhadas', 'chamadas_cnpq_inteligentes',
+        'fapemig_solucao_definitiva', 'cnpq_solucao_definitiva', 'scraper_unificado_real',
+        'dados_reorganizados_com_pdfs', 'dados_reorganizados_solucao_definitiva'
+    ]
+
+    with ArmazenamentoResultados() as armazenamento:
+        for tipo in tipos:
+            ja_importados = {linha['arquivo'] for linha in armazenamento.conexao.execute(
+                "SELECT arquivo FROM execucoes WHERE tipo = ?", (tipo,))}
+            # Timestamp no nome preserva a ordem das execuções; o banco só guarda a última
+            arquivos = sorted(glob.glob(f'{tipo}_2*.json'))
+            for arquivo in arquivos[-1:]:
+                if arquivo in ja_importados:
+                    continue
+                try:
+                    with open(arquivo, 'r', encoding='utf-8') as f:
+                        dados = json.load(f)
+                    execucao_id = armazenamento.registrar_execucao(tipo, dados, arquivo)
+                    print(f"   📥 {arquivo} -> execução {execucao_id}")
+                except Exception as e:
+                    print(f"   ❌ Erro ao importar {arquivo}: {e}")
+
+            # Tipos ainda fora do manifesto passam a apontar para o arquivo mais novo
+            if arquivos and tipo not in ler_manifesto()['artefatos']:
+                try:
+                    with open(arquivos[-1], 'r', encoding='utf-8') as f:
+                        registrar_artefato(tipo, arquivos[-1], contar_registros(json.load(f)))
+                    print(f"   📒 Manifesto: {tipo} -> {arquivos[-1]}")
+                except Exception as e:
+                    print(f"   ❌ Erro ao atualizar o manifesto: {e}")
+
+        print("\n📅 Última execução por fonte:")
+        for fonte, execucao in armazenamento.ultimas_execucoes_por_fonte().items():
+            print(f"   {fonte}: {execucao['tipo']} ({execucao['arquivo']})")
+
+        abertas = armazenamento.chamadas_abertas()
+        print(f"\n🟢 Chamadas abertas: {len(abertas)}")
+        for chamada in abertas:
+            print(f"   {chamada['prazo']} [{chamada['fonte']}] {chamada['titulo'][:60]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+🗃️ ARQUIVO HISTÓRICO COMPACTADO COM ÍNDICE DE BLOCOS
+====================================================
+
+Meses de execuções diárias consultáveis localmente, sem abrir milhares de JSONs
+formatados:
+✅ Um arquivo com blocos NDJSON comprimidos (gzip), um bloco por execução e fonte
+✅ Índice lateral: execução, fonte, offset em bytes, total de registros, prazo mínimo/máximo
+✅ As entradas de uma execução entram no índice de uma vez, depois que todos os blocos
+   estão no disco; uma execução interrompida no meio não conta como arquivada
+✅ Consultas ("FAPEMIG vistas no 2º trimestre") só descomprimem os blocos relevantes
+✅ Compactação: 'python arquivo_historico.py compactar' incorpora os *_2025*.json
+"""
+
+import os
+import re
+import sys
+import glob
+import gzip
+import json
+import uuid
+from datetime import datetime
+
+from modelos import CHAVES_LISTAS, Chamada, texto_de
+
+CAMINHO_ARQUIVO = os.getenv('SCRAPER_ARQUIVO', 'historico_chamadas.ndjson.gz')
+TAMANHO_BLOCO = 1000
+PADRAO_COMPACTACAO = '*_2025*.json'
+
+
+def caminho_indice(caminho_arquivo):
+    return f"{caminho_arquivo}.idx"
+
+
+def execucao_do_arquivo(arquivo, dados=None):
+    """(id da execução, data ISO) a partir do nome '<tipo>_AAAAMMDD_HHMMSS.json'"""
+    nome = os.path.basename(arquivo)
+    match = re.search(r'(\d{8})_(\d{6})', nome)
+    if match:
+        data = datetime.strptime(''.join(match.groups()), '%Y%m%d%H%M%S')
+        return os.path.splitext(nome)[0], data.isoformat()
+
+    # Sem timestamp no nome: usa o 'timestamp' do próprio JSON ou o mtime
+    data = dados.get('timestamp') if isinstance(dados, dict) else None
+    if not data:
+        data = datetime.fromtimestamp(os.path.getmtime(arquivo)).isoformat()
+    return os.path.splitext(nome)[0], data
+
+
+def registros_por_fonte(dados):
+    """{fonte: [(registro original, prazo ISO)]} de um JSON em qualquer layout"""
+    if isinstance(dados, list):
+        listas = {'': dados}
+    else:
+        listas = {chave: valor for chave, valor in dados.items() if chave in CHAVES_LISTAS}
+
+    fontes = {}
+    for chave, valor in listas.items():
+        for registro in valor or []:
+            if not isinstance(registro, dict):
+                continue
+            chamada = Chamada.from_dict(registro, fonte=CHAVES_LISTAS.get(chave))
+            fonte = texto_de(chamada.fonte) or 'desconhecida'
+            fontes.setdefault(fonte, []).append((registro, chamada.prazo_iso))
+    return fontes
+
+
+class ArquivoHistorico:
+    """Arquivo de blocos gzip independentes + índice NDJSON com uma linha por bloco"""
+
+    def __init__(self, caminho=CAMINHO_ARQUIVO):
+        self.caminho = caminho
+        self.caminho_indice = caminho_indice(caminho)
+        self._indice = None
+
+    def indice(self):
+        """Entradas do índice (lidas uma vez); um bloco sem entrada é ignorado, e também as
+        entradas de um lote incompleto (gravação interrompida: a execução será arquivada de novo)"""
+        if self._indice is None:
+            entradas = []
+            if os.path.exists(self.caminho_indice):
+                with open(self.caminho_indice, 'r', encoding='utf-8') as f:
+                    for linha in f:
+                        try:
+                            entradas.append(json.loads(linha))
+                        except json.JSONDecodeError:
+                            print(f"⚠️ {self.caminho_indice}: linha incompleta ignorada")
+
+            por_lote = {}
+            for entrada in entradas:
+                if 'lote' in entrada:
+                    por_lote[entrada['lote']] = por_lote.get(entrada['lote'], 0) + 1
+            # Entradas sem 'lote' são de antes da gravação em lote e valem como completas
+            self._indice = [entrada for entrada in entradas
+                            if 'lote' not in entrada or por_lote[entrada['lote']] == entrada['blocos']]
+            if len(self._indice) < len(entradas):
+                print(f"⚠️ {self.caminho_indice}: {len(entradas) - len(self._indice)} entrada(s) "
+                      f"de execução interrompida ignorada(s)")
+        return self._indice
+
+    def execucoes(self):
+        """Ids das execuções já arquivadas"""
+        return {entrada['execucao'] for entrada in self.indice()}
+
+    def _gravar_bloco(self, arquivo, entrada, registros):
+        linhas = ''.join(json.dumps(registro, ensure_ascii=False, separators=(',', ':')) + '\n'
+                         for registro in registros)
+        bloco = gzip.compress(linhas.encode('utf-8'))
+
+        arquivo.seek(0, os.SEEK_END)
+        entrada['offset'] = arquivo.tell()
+        entrada['tamanho'] = len(bloco)
+        arquivo.write(bloco)
+        return entrada
+
+    def _gravar_entradas(self, arquivo, entradas):
+        """Índice da execução inteira num lote só, depois dos blocos: o índice só aponta para
+        blocos que já estão no disco, e 'lote'/'blocos' permitem reconhecer um lote cortado"""
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+
+        lote = uuid.uuid4().hex[:12]
+        for entrada in entradas:
+            entrada['lote'] = lote
+            entrada['blocos'] = len(entradas)
+        with open(self.caminho_indice, 'a', encoding='utf-8') as indice:
+            indice.write(''.join(json.dumps(entrada, ensure_ascii=False) + '\n' for entrada in entradas))
+            indice.flush()
+            os.fsync(indice.fileno())
+        self.indice().extend(entradas)
+
+    def adicionar_execucao(self, execucao, tipo, data, dados):
+        """Arquiva uma execução (um bloco por fonte). Retorna o total de registros gravados"""
+        if execucao in self.execucoes():
+            return 0
+
+        total = 0
+        entradas = []
+        with open(self.caminho, 'ab') as arquivo:
+            for fonte, itens in sorted(registros_por_fonte(dados).items()):
+                for inicio in range(0, len(itens), TAMANHO_BLOCO):
+                    lote = itens[inicio:inicio + TAMANHO_BLOCO]
+                    prazos = [prazo for _, prazo in lote if prazo]
+                    entrada = {
+                        'execucao': execucao,
+                        'tipo': tipo,
+                        'data': data,
+                        'fonte': fonte,
+                        'registros': len(lote),
+                        'prazo_min': min(prazos) if prazos else '',
+                        'prazo_max': max(prazos) if prazos else ''
+                    }
+                    entradas.append(self._gravar_bloco(arquivo, entrada, [registro for registro, _ in lote]))
+                    total += len(lote)
+
+            if not total:
+                # Execução sem registros: a entrada vazia evita reprocessá-la a cada compactação
+                entrada = {'execucao': execucao, 'tipo': tipo, 'data': data, 'fonte': '',
+                           'registros': 0, 'prazo_min': '', 'prazo_max': ''}
+                entradas.append(self._gravar_bloco(arquivo, entrada, []))
+
+            self._gravar_entradas(arquivo, entradas)
+        return total
+
+    def blocos(self, fonte=None, desde=None, ate=None, prazo_de=None, prazo_ate=None, tipo=None):
+        """Entradas do índice que podem conter registros do filtro (datas em ISO)"""
+        for entrada in self.indice():
+            if not entrada['registros']:
+                continue
+            if fonte and entrada['fonte'].lower() != fonte.lower():
+                continue
+            if tipo and entrada['tipo'] != tipo:
+                continue
+            if desde and entrada['data'][:len(desde)] < desde:
+                continue
+            if ate and entrada['data'][:len(ate)] > ate:
+                continue
+            if prazo_de and (not entrada['prazo_max'] or entrada['prazo_max'] < prazo_de):
+                continue
+            if prazo_ate and (not entrada['prazo_min'] or entrada['prazo_min'] > prazo_ate):
+                continue
+            yield entrada
+
+    def ler_bloco(self, entrada, arquivo=None):
+        """Descomprime só o bloco da entrada e gera os registros"""
+        if arquivo is None:
+            with open(self.caminho, 'rb') as arquivo:
+                yield from self.ler_bloco(entrada, arquivo)
+            return
+
+        arquivo.seek(entrada['offset'])
+        conteudo = gzip.decompress(arquivo.read(entrada['tamanho'])).decode('utf-8')
+        for linha in conteudo.splitlines():
+            yield json.loads(linha)
+
+    def consultar(self, fonte=None, desde=None, ate=None, prazo_de=None, prazo_ate=None, tipo=None):
+        """Gera (entrada do bloco, registro) dos registros que atendem ao filtro"""
+        blocos = list(self.blocos(fonte, desde, ate, prazo_de, prazo_ate, tipo))
+        if not blocos:
+            return
+
+        with open(self.caminho, 'rb') as arquivo:
+            for entrada in blocos:
+                for registro in self.ler_bloco(entrada, arquivo):
+                    if prazo_de or prazo_ate:
+                        prazo = Chamada.from_dict(registro).prazo_iso
+                        if not prazo or (prazo_de and prazo < prazo_de) or (prazo_ate and prazo > prazo_ate):
+                            continue
+                    yield entrada, registro
+
+
+def compactar(padrao=PADRAO_COMPACTACAO, caminho=CAMINHO_ARQUIVO, remover=False):
+    """Incorpora ao arquivo os JSONs do padrão ainda não arquivados. Retorna (execuções, registros)"""
+    historico = ArquivoHistorico(caminho)
+    execucoes = 0
+    registros = 0
+
+    for arquivo in sorted(glob.glob(padrao)):
+        try:
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+            execucao, data = execucao_do_arquivo(arquivo, dados)
+            tipo = re.sub(r'_\d{8}_\d{6}$', '', execucao)
+            if execucao in historico.execucoes():
+                print(f"⏭️ {arquivo}: já arquivado")
+            else:
+                total = historico.adicionar_execucao(execucao, tipo, data, dados)
+                execucoes += 1
+                registros += total
+                print(f"✅ {arquivo}: {total} registros arquivados")
+            if remover:
+                os.remove(arquivo)
+        except Exception as e:
+            print(f"❌ Erro ao compactar {arquivo}: {e}")
+
+    return execucoes, registros
+
+
+def main():
+    """Uso: python arquivo_historico.py compactar [padrão] [--remover]
+            python arquivo_historico.py consultar [--fonte F] [--desde AAAA-MM-DD] [--ate AAAA-MM-DD]
+                                                  [--prazo-de AAAA-MM-DD] [--prazo-ate AAAA-MM-DD]"""
+    print("🗃️ ARQUIVO HISTÓRICO DE CHAMADAS")
+    print("=" * 50)
+
+    argumentos = sys.argv[1:]
+    comando = argumentos.pop(0) if argumentos else 'consultar'
+
+    if comando == 'compactar':
+        remover = '--remover' in argumentos
+        padroes = [a for a in argumentos if a != '--remover'] or [PADRAO_COMPACTACAO]
+        for padrao in padroes:
+            execucoes, registros = compactar(padrao, remover=remover)
+            print(f"📦 {padrao}: {execucoes} execuções e {registros} registros incorporados em {CAMINHO_ARQUIVO}")
+        return
+
+    filtros = {}
+    for opcao in ('fonte', 'desde', 'ate', 'prazo-de', 'prazo-ate', 'tipo'):
+        if f"--{opcao}" in argumentos:
+            filtros[opcao.replace('-', '_')] = argumentos[argumentos.index(f"--{opcao}") + 1]
+
+    historico = ArquivoHistorico()
+    blocos = list(historico.blocos(**filtros))
+    total = 0
+    for entrada, registro in historico.consultar(**filtros):
+        total += 1
+        print(f"• [{entrada['fonte']}] {entrada['data'][:10]} {registro.get('titulo', '')[:80]}")
+    print(f"\n📊 {total} registros em {len(blocos)} de {len(historico.indice())} blocos")
+
+
+if __name__ == "__main__":
+    main()
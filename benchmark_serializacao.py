@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK DE SERIALIZAÇÃO
+============================
+
+Compara codificação e decodificação dos formatos de serializacao.py com os
+registros reais dos arquivos *_2*.json (replicados até o tamanho pedido):
+✅ JSON formatado (indent=2), o formato dos artefatos publicados
+✅ Cada formato interno disponível (msgpack, orjson, json compacto)
+✅ Tamanho em bytes e vazão em registros/s
+
+Uso: python benchmark_serializacao.py [total_de_registros] [repeticoes]
+"""
+
+import sys
+import glob
+import json
+import time
+
+from modelos import CHAVES_LISTAS
+from serializacao import FORMATOS
+
+
+def registros_reais(padrao='*_2*.json'):
+    """Todos os registros (dicts) dos JSONs de resultados encontrados"""
+    registros = []
+    for arquivo in sorted(glob.glob(padrao)):
+        try:
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+        except Exception:
+            continue
+        listas = [dados] if isinstance(dados, list) else [v for k, v in dados.items() if k in CHAVES_LISTAS]
+        for lista in listas:
+            registros.extend(item for item in lista or [] if isinstance(item, dict))
+    return registros
+
+
+def medir(funcao, argumento, repeticoes):
+    """Melhor tempo (segundos) entre as repetições"""
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(argumento)
+        duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, resultado
+
+
+def main():
+    print("⏱️ BENCHMARK DE SERIALIZAÇÃO")
+    print("=" * 50)
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    base = registros_reais()
+    if not base:
+        print("❌ Nenhum registro encontrado em *_2*.json")
+        return
+
+    # Mesmo layout dos arquivos das etapas: listas por fonte + metadados
+    registros = [base[i % len(base)] for i in range(total)]
+    dados = {'chamadas': registros, 'timestamp': '2025-08-17T20:00:00', 'total': total}
+    print(f"📊 {total} registros ({len(base)} formatos reais distintos), melhor de {repeticoes}\n")
+
+    formatos = {
+        'json indent=2 (publicado)': (
+            lambda d: json.dumps(d, ensure_ascii=False, indent=2).encode('utf-8'),
+            json.loads
+        )
+    }
+    for nome, (_, codificar, decodificar) in FORMATOS.items():
+        formatos[f"{nome} (interno)"] = (codificar, decodificar)
+
+    print(f"{'formato':<28}{'bytes':>12}{'codificar reg/s':>18}{'decodificar reg/s':>20}")
+    for nome, (codificar, decodificar) in formatos.items():
+        tempo_codificar, conteudo = medir(codificar, dados, repeticoes)
+        tempo_decodificar, _ = medir(decodificar, conteudo, repeticoes)
+        print(f"{nome:<28}{len(conteudo):>12}{total / tempo_codificar:>18,.0f}"
+              f"{total / tempo_decodificar:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+💾 CHECKPOINTS PARA RETOMAR EXECUÇÕES INTERROMPIDAS
+===================================================
+
+Se a execução morria depois da FAPEMIG e antes do fim do CNPq, a tentativa
+seguinte começava do zero e pagava de novo todos os carregamentos de página:
+✅ Etapas concluídas (agendador e pipeline), com o resultado de cada uma
+✅ Fontes concluídas e o stream parcial de registros de cada fonte (NDJSON)
+✅ URLs já processadas por fonte
+✅ --resume (ou SCRAPER_RETOMAR=1) continua do último checkpoint; sem ele a
+   execução começa do zero e grava um checkpoint novo
+✅ Checkpoint mais velho que SCRAPER_CHECKPOINT_VALIDADE (segundos) é descartado
+✅ Execução concluída com sucesso apaga o seu checkpoint
+
+Uso: python checkpoints.py [listar|limpar]
+"""
+
+import os
+import sys
+import json
+import glob
+from datetime import datetime
+
+from saida_ndjson import ler_ndjson
+
+DIRETORIO_CHECKPOINTS = os.getenv('SCRAPER_CHECKPOINTS', '.checkpoints')
+VALIDADE_PADRAO = 6 * 3600
+
+
+def retomar_ativo():
+    """True se a execução foi chamada com --resume (ou SCRAPER_RETOMAR=1, repassado aos scripts filhos)"""
+    return '--resume' in sys.argv or os.getenv('SCRAPER_RETOMAR') == '1'
+
+
+def validade_checkpoints():
+    return float(os.getenv('SCRAPER_CHECKPOINT_VALIDADE', VALIDADE_PADRAO))
+
+
+class UrlsProcessadas:
+    """URLs que uma fonte já processou; cada URL nova é avisada a 'ao_marcar'"""
+
+    def __init__(self, urls=(), ao_marcar=None):
+        self.urls = set(urls)
+        self.ao_marcar = ao_marcar
+
+    def __contains__(self, url):
+        return url in self.urls
+
+    def marcar(self, url):
+        if url in self.urls:
+            return
+        self.urls.add(url)
+        if self.ao_marcar:
+            self.ao_marcar(url)
+
+
+class Checkpoint:
+    """Checkpoint de uma execução: '<nome>.json' (estado) + '<nome>.<fonte>.ndjson' (registros)"""
+
+    def __init__(self, nome, retomar=None, validade=None, diretorio=DIRETORIO_CHECKPOINTS):
+        self.nome = nome
+        self.diretorio = diretorio
+        self.caminho = os.path.join(diretorio, f"{nome}.json")
+        self.retomar = retomar_ativo() if retomar is None else retomar
+        self.validade = validade_checkpoints() if validade is None else validade
+        self.estado = self._carregar() if self.retomar else None
+
+        if self.estado is None:
+            self.limpar()
+            self.estado = {'nome': nome, 'criado_em': datetime.now().isoformat(),
+                           'etapas': {}, 'fontes': {}, 'urls': {}}
+        else:
+            concluidas = [fonte for fonte, info in self.estado['fontes'].items() if info.get('concluida')]
+            print(f"💾 Retomando '{nome}' do checkpoint de {self.estado['criado_em'][:19]}: "
+                  f"{len(self.estado['etapas'])} etapa(s) e {len(concluidas)} fonte(s) concluída(s)")
+
+    def _carregar(self):
+        try:
+            with open(self.caminho, 'r', encoding='utf-8') as f:
+                estado = json.load(f)
+        except FileNotFoundError:
+            print(f"💾 Nenhum checkpoint de '{self.nome}' para retomar, começando do zero")
+            return None
+        except json.JSONDecodeError as e:
+            print(f"⚠️ Checkpoint de '{self.nome}' inválido ({e}), começando do zero")
+            return None
+
+        idade = (datetime.now() - datetime.fromisoformat(estado['criado_em'])).total_seconds()
+        if idade > self.validade:
+            print(f"⚠️ Checkpoint de '{self.nome}' expirado ({idade / 3600:.1f}h), começando do zero")
+            return None
+        return estado
+
+    def _gravar(self):
+        os.makedirs(self.diretorio, exist_ok=True)
+        self.estado['atualizado_em'] = datetime.now().isoformat()
+        temporario = f"{self.caminho}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(self.estado, f, ensure_ascii=False, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, self.caminho)
+
+    def _caminho_registros(self, fonte):
+        return os.path.join(self.diretorio, f"{self.nome}.{fonte}.ndjson")
+
+    # Etapas
+
+    def etapa_concluida(self, etapa):
+        return etapa in self.estado['etapas']
+
+    def resultado_etapa(self, etapa):
+        return self.estado['etapas'].get(etapa)
+
+    def concluir_etapa(self, etapa, resultado=True):
+        self.estado['etapas'][etapa] = resultado
+        self._gravar()
+
+    # Fontes
+
+    def fonte_concluida(self, fonte):
+        return self.estado['fontes'].get(fonte, {}).get('concluida', False)
+
+    def registros_da_fonte(self, fonte):
+        """{lista: registros} já recebidos da fonte (completa ou parcial)"""
+        listas = {}
+        caminho = self._caminho_registros(fonte)
+        if os.path.exists(caminho):
+            for objeto in ler_ndjson(caminho):
+                listas.setdefault(objeto['lista'], []).append(objeto['dados'])
+        return listas
+
+    def registrar_registro(self, fonte, lista, registro):
+        """Acrescenta um registro ao stream parcial da fonte"""
+        os.makedirs(self.diretorio, exist_ok=True)
+        with open(self._caminho_registros(fonte), 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'lista': lista, 'dados': registro}, ensure_ascii=False,
+                               separators=(',', ':'), default=str) + '\n')
+
+    def concluir_fonte(self, fonte, situacao='ok'):
+        self.estado['fontes'][fonte] = {'concluida': True, 'situacao': situacao,
+                                        'concluida_em': datetime.now().isoformat()}
+        self._gravar()
+
+    # URLs
+
+    def urls_processadas(self, fonte):
+        return self.estado['urls'].get(fonte, [])
+
+    def marcar_url(self, fonte, url):
+        urls = self.estado['urls'].setdefault(fonte, [])
+        if url not in urls:
+            urls.append(url)
+            self._gravar()
+
+    def urls_da_fonte(self, fonte):
+        """UrlsProcessadas da fonte, gravando no checkpoint cada URL nova"""
+        return UrlsProcessadas(self.urls_processadas(fonte), lambda url: self.marcar_url(fonte, url))
+
+    def limpar(self):
+        """Apaga o checkpoint (estado e streams de registros)"""
+        for caminho in [self.caminho] + glob.glob(os.path.join(self.diretorio, f"{self.nome}.*.ndjson")):
+            if os.path.exists(caminho):
+                os.remove(caminho)
+
+
+def main():
+    comando = sys.argv[1] if len(sys.argv) > 1 else 'listar'
+    arquivos = sorted(glob.glob(os.path.join(DIRETORIO_CHECKPOINTS, '*.json')))
+
+    if comando == 'limpar':
+        for caminho in arquivos:
+            Checkpoint(os.path.basename(caminho)[:-len('.json')], retomar=False)
+        print(f"🧹 {len(arquivos)} checkpoint(s) removido(s)")
+        return
+
+    if not arquivos:
+        print("💾 Nenhum checkpoint")
+        return
+    for caminho in arquivos:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            estado = json.load(f)
+        fontes = [f"{fonte} ({info['situacao']})" for fonte, info in estado['fontes'].items()]
+        print(f"💾 {estado['nome']}: criado em {estado['criado_em'][:19]}")
+        print(f"   Etapas concluídas: {', '.join(estado['etapas']) or '-'}")
+        print(f"   Fontes concluídas: {', '.join(fontes) or '-'}")
+        print(f"   URLs processadas: {sum(len(urls) for urls in estado['urls'].values())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🔗 COLEÇÃO ORDENADA DE LINKS COM URLs CANÔNICAS
+===============================================
+
+Coleção usada por chamada para PDFs e links importantes:
+✅ Canonicaliza URLs (esquema, host, relativos, fragmentos, parâmetros de rastreio)
+✅ Mantém a ordem de inserção com verificação de pertinência em O(1)
+✅ Mescla o método e o tipo de links duplicados (proveniência)
+"""
+
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Parâmetros de rastreamento que não mudam o documento apontado
+PARAMETROS_RASTREIO = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', '_ga', '_gl'}
+
+PORTAS_PADRAO = {'http': '80', 'https': '443'}
+
+
+def canonicalizar_url(url, base=None):
+    """Gera a forma canônica de uma URL, usada apenas como chave de comparação"""
+    if not url:
+        return ""
+
+    url = url.strip()
+    if base:
+        url = urljoin(base, url)
+
+    partes = urlsplit(url)
+    esquema = partes.scheme.lower()
+    if esquema in PORTAS_PADRAO:
+        # http e https apontam para o mesmo documento nos sites das agências
+        esquema = 'https'
+
+    host = (partes.hostname or '').lower()
+    porta = partes.port
+    if porta and str(porta) not in PORTAS_PADRAO.values():
+        host = f"{host}:{porta}"
+
+    caminho = partes.path or '/'
+    if len(caminho) > 1:
+        caminho = caminho.rstrip('/') or '/'
+
+    parametros = [
+        (chave, valor) for chave, valor in parse_qsl(partes.query, keep_blank_values=True)
+        if not chave.lower().startswith('utm_') and chave.lower() not in PARAMETROS_RASTREIO
+    ]
+    consulta = urlencode(sorted(parametros))
+
+    return urlunsplit((esquema, host, caminho, consulta, ''))
+
+
+def resolver_url(url, base=None):
+    """Resolve URLs relativas e remove o fragmento, preservando o esquema original"""
+    if not url:
+        return ""
+    url = url.strip()
+    if base:
+        url = urljoin(base, url)
+    return urlunsplit(urlsplit(url)._replace(fragment=''))
+
+
+class ColecaoLinks:
+    """Conjunto ordenado de links (dicts com 'url') indexado pela URL canônica"""
+
+    def __init__(self, itens=None, base=None):
+        self.base = base
+        self.itens = {}
+        if itens:
+            self.extend(itens)
+
+    def chave(self, item):
+        """Chave de identidade de um link"""
+        chave_url = canonicalizar_url(item.get('url', ''), self.base)
+        if item.get('instrucoes'):
+            # Link de instrução aponta para a página da chamada, não para o arquivo:
+            # vários arquivos mencionados compartilham a mesma URL e diferem pelo nome
+            nome = item.get('nome') or item.get('texto') or ''
+            return (chave_url, nome.strip().lower())
+        return chave_url
+
+    def adicionar(self, item):
+        """Adiciona um link. Retorna True se for novo, False se foi mesclado a um existente"""
+        if not item or not item.get('url'):
+            return False
+
+        chave = self.chave(item)
+        existente = self.itens.get(chave)
+
+        if existente is None:
+            novo = dict(item)
+            novo['url'] = resolver_url(item['url'], self.base)
+            self.itens[chave] = novo
+            return True
+
+        self.mesclar_proveniencia(existente, item)
+        return False
+
+    def mesclar_proveniencia(self, existente, item):
+        """Registra em 'metodos'/'tipos' todos os métodos e tipos que encontraram o link"""
+        for campo, campo_lista in (('metodo', 'metodos'), ('tipo', 'tipos')):
+            valores = list(existente.get(campo_lista) or [])
+            for valor in (existente.get(campo), item.get(campo)):
+                if valor and valor not in valores:
+                    valores.append(valor)
+            for valor in item.get(campo_lista) or []:
+                if valor not in valores:
+                    valores.append(valor)
+            if len(valores) > 1:
+                existente[campo_lista] = valores
+
+        # Preenche campos vazios com o que o duplicado trouxer (ex.: nome do link)
+        for campo, valor in item.items():
+            if campo not in existente or not existente[campo]:
+                existente[campo] = valor
+
+    def extend(self, itens):
+        """Adiciona vários links, retornando quantos eram novos"""
+        return sum(1 for item in itens if self.adicionar(item))
+
+    def __contains__(self, url):
+        if isinstance(url, dict):
+            return self.chave(url) in self.itens
+        return canonicalizar_url(url, self.base) in self.itens
+
+    def __iter__(self):
+        return iter(self.itens.values())
+
+    def __len__(self):
+        return len(self.itens)
+
+    def para_lista(self):
+        """Lista de dicts pronta para serialização em JSON"""
+        return list(self.itens.values())
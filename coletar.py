@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+🕷️ COLETA UNIFICADA (UM PROCESSO, UM NAVEGADOR)
+===============================================
+
+O workflow chamava scraper_rapido.py, scraper_cnpq_detalhado.py e
+scraper_cnpq_inteligente.py em processos separados, e cada um importava o
+Selenium e abria o Chrome de novo:
+✅ Fontes e estratégias escolhidas na linha de comando (registro em fontes.py)
+✅ Todas as estratégias no mesmo processo, com um único Chrome compartilhado
+✅ Cada scraper grava o mesmo arquivo/artefato que o seu script gravaria
+✅ Etapas com prazo (prazos.py) e retomáveis com --resume (checkpoints.py)
+
+Uso: python coletar.py [fonte[:estrategia[+estrategia]] ...] [--listar] [--resume]
+Ex.: python coletar.py                      (estratégias padrão de todas as fontes)
+     python coletar.py fapemig cnpq:inteligente
+"""
+
+import sys
+from datetime import datetime
+
+from fontes import REGISTRO, selecionar, agrupar
+from pipeline import Etapa, Pipeline
+from checkpoints import Checkpoint
+
+ESPERA_IMPLICITA_PADRAO = 10
+
+
+class NavegadorCompartilhado:
+    """Um Chrome para todos os scrapers da execução, aberto pelo primeiro que precisar"""
+
+    def __init__(self):
+        self.driver = None
+        self.wait = None
+        self.espera_implicita = ESPERA_IMPLICITA_PADRAO
+
+    def preparar(self, scraper):
+        """Entrega o navegador ao scraper. Retorna False se não foi possível abrir o Chrome"""
+        if self.driver is None:
+            if not scraper.configurar_navegador():
+                return False
+            self.driver = scraper.driver
+            self.wait = scraper.wait
+            prazo = getattr(scraper, 'prazo', None)
+            if prazo and prazo.espera_implicita is not None:
+                self.espera_implicita = prazo.espera_implicita
+            return True
+
+        scraper.driver = self.driver
+        scraper.wait = self.wait
+        if getattr(scraper, 'prazo', None):
+            scraper.prazo.aplicar(self.driver, self.espera_implicita)
+        return True
+
+    def fechar(self):
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+            print("🔒 Navegador fechado")
+
+
+def etapa_de_coleta(estrategias, navegador):
+    """Função de etapa: um scraper, os métodos de cada estratégia e salvar_resultados"""
+
+    def executar(contexto):
+        scraper = estrategias[0].carregar_classe()()
+        if any(estrategia.navegador for estrategia in estrategias) and not navegador.preparar(scraper):
+            return None
+
+        # Fora dos processos de fonte os métodos de extração já gravam cada registro em
+        # self.saida logo após o append (receber_resultado só é usado pelo processo principal)
+        prazo = getattr(scraper, 'prazo', None)
+        for estrategia in estrategias:
+            for metodo in estrategia.metodos:
+                if prazo and prazo.esgotado():
+                    print(f"⏰ {estrategia.chave}: prazo esgotado antes de {metodo}")
+                    break
+                getattr(scraper, metodo)()
+
+        if prazo:
+            scraper.resultados['parcial'] = prazo.estourado
+        if not scraper.salvar_resultados():
+            return None
+        return scraper.resultados
+
+    return executar
+
+
+def listar():
+    for fonte, estrategias in REGISTRO.items():
+        print(f"\n📚 {fonte.upper()}")
+        for estrategia in estrategias.values():
+            marca = '⭐' if estrategia.padrao else '  '
+            print(f"   {marca} {estrategia.chave:<30} {estrategia.descricao}")
+    print("\n⭐ = estratégia padrão")
+
+
+def main():
+    print("🕷️ COLETA UNIFICADA")
+    print("=" * 50)
+
+    argumentos = [argumento for argumento in sys.argv[1:] if not argumento.startswith('--')]
+    if '--listar' in sys.argv:
+        listar()
+        return 0
+
+    try:
+        estrategias = selecionar(argumentos)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    print(f"⏰ Início: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+    print(f"📋 Estratégias: {', '.join(estrategia.chave for estrategia in estrategias)}")
+
+    navegador = NavegadorCompartilhado()
+    etapas = []
+    for modulo, classe, grupo in agrupar(estrategias):
+        etapas.append(Etapa(
+            f"{modulo}.{classe}",
+            f"Coleta {', '.join(estrategia.chave for estrategia in grupo)}",
+            etapa_de_coleta(grupo, navegador),
+            obrigatoria=False,
+            peso=3 if any(estrategia.navegador for estrategia in grupo) else 1
+        ))
+
+    pipeline = Pipeline(etapas, Checkpoint('coleta'))
+    try:
+        pipeline.executar()
+    finally:
+        navegador.fechar()
+
+    concluidas = [etapa.nome for etapa in etapas if etapa.nome in pipeline.contexto]
+    print(f"\n📊 {len(concluidas)}/{len(etapas)} coletas concluídas")
+    print("\n".join(pipeline.resumo_duracoes()))
+    return 0 if concluidas else 1
+
+
+if __name__ == "__main__":
+    exit(main())
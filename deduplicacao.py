@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+🧬 ÍNDICE DE DEDUPLICAÇÃO POR CHAVE CANÔNICA
+============================================
+
+Índice compartilhado pelos métodos de busca dos scrapers:
+✅ Identifica cada chamada por (fonte, número normalizado, hash do título)
+✅ Inserção ou mesclagem em O(1) via dicionário
+✅ Ignora campos voláteis como data_coleta
+✅ Mescla os campos mais ricos (mais PDFs, descrição mais longa)
+✅ Opcionalmente mescla quase-duplicatas (SimHash) de mesmo número e entrada
+"""
+
+import re
+import hashlib
+import unicodedata
+
+from colecao_links import ColecaoLinks
+
+# Campos que mudam a cada coleta e não identificam a chamada
+CAMPOS_VOLATEIS = {'data_coleta'}
+
+# Listas de PDFs/links que devem ser unidas na mesclagem
+CAMPOS_LISTA = ['pdfs_disponiveis', 'links_importantes', 'links_video', 'anexos']
+
+# Totais recalculados a partir das listas após a mesclagem
+CAMPOS_TOTAIS = {
+    'total_pdfs': 'pdfs_disponiveis',
+    'total_links': 'links_importantes'
+}
+
+
+def normalizar_texto(texto):
+    """Remove acentos, pontuação e espaços extras de um texto"""
+    if not texto:
+        return ""
+    texto = unicodedata.normalize('NFKD', str(texto))
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    texto = re.sub(r'[^a-z0-9]+', ' ', texto.lower())
+    return texto.strip()
+
+
+def normalizar_numero(numero):
+    """Normaliza o número da chamada: '011/2025' e '11/2025' viram '11/2025'"""
+    if not numero:
+        return ""
+    match = re.search(r'(\d{1,4})\s*/\s*(\d{4})', str(numero))
+    if match:
+        return f"{int(match.group(1))}/{match.group(2)}"
+    return normalizar_texto(numero)
+
+
+def hash_titulo(titulo):
+    """Hash curto e estável do título normalizado"""
+    return hashlib.sha1(normalizar_texto(titulo).encode('utf-8')).hexdigest()[:16]
+
+
+def marcador_entrada(titulo):
+    """Identifica reentradas ('2ª ENTRADA'), que são chamadas distintas
+
+    Exige o ordinal ('ª' vira 'a' na normalização): em '005/2025 ENTRADA CONTÍNUA'
+    o ano não é marcador de entrada.
+    """
+    match = re.search(r'\b(\d{1,2}) ?a entrada\b', normalizar_texto(titulo))
+    return match.group(1) if match else ''
+
+
+def texto_do_registro(registro):
+    """Texto usado na assinatura de quase-duplicatas: título + descrição"""
+    titulo = registro.get('titulo', '') or ''
+    descricao = registro.get('descricao', '') or ''
+    if normalizar_texto(descricao) == normalizar_texto(titulo):
+        descricao = ''
+    return f"{titulo} {descricao}"
+
+
+def chave_canonica(registro, fonte=None):
+    """Calcula a identidade canônica (fonte, número, hash do título) de um registro"""
+    fonte = fonte or registro.get('fonte', '')
+    return (
+        normalizar_texto(fonte),
+        normalizar_numero(registro.get('numero', '')),
+        hash_titulo(registro.get('titulo', ''))
+    )
+
+
+def mesclar_registros(existente, novo):
+    """Incorpora ao registro existente os campos mais ricos do novo registro"""
+    for campo, valor in novo.items():
+        if campo in CAMPOS_VOLATEIS or campo in CAMPOS_TOTAIS:
+            continue
+
+        atual = existente.get(campo)
+
+        if campo in CAMPOS_LISTA and isinstance(valor, list):
+            # Links são unidos pela URL canônica; itens sem URL (ex.: nomes de anexos) por igualdade
+            colecao = ColecaoLinks()
+            outros = []
+            for item in list(atual or []) + valor:
+                if isinstance(item, dict) and item.get('url'):
+                    colecao.adicionar(item)
+                elif item not in outros:
+                    outros.append(item)
+            existente[campo] = colecao.para_lista() + outros
+        elif isinstance(valor, str):
+            # Texto mais longo costuma ser o mais completo
+            if len(valor) > len(atual or ''):
+                existente[campo] = valor
+        elif isinstance(valor, bool):
+            existente[campo] = bool(atual) or valor
+        elif atual in (None, '', [], {}):
+            existente[campo] = valor
+
+    for campo_total, campo_lista in CAMPOS_TOTAIS.items():
+        if campo_total in existente:
+            existente[campo_total] = len(existente.get(campo_lista) or [])
+
+    return existente
+
+
+def numero_do_registro(registro):
+    """Número normalizado do registro, buscando no título quando o campo está vazio"""
+    numero = normalizar_numero(registro.get('numero', ''))
+    if not numero:
+        match = re.search(r'(\d{1,4})\s*/\s*(\d{4})', registro.get('titulo', '') or '')
+        numero = normalizar_numero(match.group(0)) if match else ''
+    return numero
+
+
+def mesma_chamada(registro_a, registro_b):
+    """Quase-duplicatas só são a mesma chamada se número e entrada não divergirem"""
+    numero_a = numero_do_registro(registro_a)
+    numero_b = numero_do_registro(registro_b)
+    if numero_a and numero_b and numero_a != numero_b:
+        return False
+    return marcador_entrada(registro_a.get('titulo', '')) == marcador_entrada(registro_b.get('titulo', ''))
+
+
+class IndiceDeduplicacao:
+    """Índice de deduplicação por chave canônica com inserção ou mesclagem em O(1)
+
+    Com 'similares' (quase_duplicatas.IndiceQuaseDuplicatas), registros cuja chave
+    exata não existe ainda são comparados por SimHash com os já vistos.
+    'ao_gravar' é chamado com o registro inserido ou mesclado (ex.: saída NDJSON).
+    """
+
+    def __init__(self, registros=None, fonte=None, similares=None, ao_gravar=None):
+        # A lista é compartilhada: os scrapers continuam lendo self.resultados normalmente
+        self.registros = registros if registros is not None else []
+        self.fonte = fonte
+        self.similares = similares
+        self.ao_gravar = ao_gravar
+        self.indice = {}
+        self.total_mesclados = 0
+        self.total_quase_duplicatas = 0
+
+        for registro in self.registros:
+            chave = chave_canonica(registro, self.fonte)
+            if chave not in self.indice:
+                self._indexar(chave, registro)
+
+    def _indexar(self, chave, registro):
+        self.indice[chave] = registro
+        if self.similares is not None:
+            self.similares.adicionar(chave, texto_do_registro(registro))
+
+    def _quase_duplicata(self, registro):
+        """Registro já indexado que é quase-duplicata do novo, se houver"""
+        if self.similares is None:
+            return None
+        for chave, _ in self.similares.candidatos(texto_do_registro(registro)):
+            existente = self.indice[chave]
+            if mesma_chamada(existente, registro):
+                return existente
+        return None
+
+    def adicionar(self, registro):
+        """Insere um registro novo ou mescla com o já existente. Retorna True se for novo"""
+        if not registro:
+            return False
+
+        chave = chave_canonica(registro, self.fonte)
+        existente = self.indice.get(chave)
+
+        if existente is None:
+            existente = self._quase_duplicata(registro)
+            if existente is None:
+                self._indexar(chave, registro)
+                self.registros.append(registro)
+                if self.ao_gravar:
+                    self.ao_gravar(registro)
+                return True
+            # A variação do título passa a apontar direto para o registro mesclado
+            self.indice[chave] = existente
+            self.total_quase_duplicatas += 1
+
+        mesclar_registros(existente, registro)
+        self.total_mesclados += 1
+        if self.ao_gravar:
+            self.ao_gravar(existente)
+        return False
+
+    def __contains__(self, registro):
+        return chave_canonica(registro, self.fonte) in self.indice
+
+    def __len__(self):
+        return len(self.registros)
@@ -7,7 +7,8 @@ Use este script para identificar exatamente o que está faltando
 
 import os
 import sys
-import glob
+
+from armazenamento import localizar_mais_recente
 
 def verificar_variaveis_ambiente():
     """Verifica todas as variáveis de ambiente relacionadas ao email"""
@@ -127,21 +128,20 @@ def verificar_arquivos_json():
     print("\n📁 VERIFICAÇÃO DOS ARQUIVOS DE DADOS:")
     print("-" * 40)
     
-    padroes = [
-        'editais_rapidos_*.json',
-        'chamadas_cnpq_detalhadas_*.json',
-        'chamadas_cnpq_inteligentes_*.json',
-        'dados_reorganizados_com_pdfs_*.json'
+    tipos = [
+        'editais_rapidos',
+        'chamadas_cnpq_detalhadas',
+        'chamadas_cnpq_inteligentes',
+        'dados_reorganizados_com_pdfs'
     ]
     
-    for padrao in padroes:
-        arquivos = glob.glob(padrao)
-        if arquivos:
-            arquivo_mais_recente = max(arquivos, key=lambda x: os.path.getctime(x))
+    for tipo in tipos:
+        arquivo_mais_recente = localizar_mais_recente(tipo)
+        if arquivo_mais_recente:
             tamanho = os.path.getsize(arquivo_mais_recente)
-            print(f"✅ {padrao}: {arquivo_mais_recente} ({tamanho} bytes)")
+            print(f"✅ {tipo}: {arquivo_mais_recente} ({tamanho} bytes)")
         else:
-            print(f"❌ {padrao}: Nenhum arquivo encontrado")
+            print(f"❌ {tipo}: Nenhum arquivo encontrado")
 
 def main():
     """Função principal"""
@@ -7,13 +7,15 @@ Data: 2025
 """
 
 import os
-import json
-import glob
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-import pytz
+
+from importacao import preguicoso
+from armazenamento import carregar_mais_recente
+
+# Só carregados na hora de enviar
+smtplib = preguicoso('smtplib')
+mime_texto = preguicoso('email.mime.text')
+mime_multipart = preguicoso('email.mime.multipart')
 
 def validar_configuracao_email():
     """Valida se todas as variáveis de email estão configuradas"""
@@ -71,18 +73,14 @@ def carregar_dados_recentes():
         'dados_reorganizados': None
     }
     
-    # Buscar arquivos mais recentes
+    # Buscar dados mais recentes (banco SQLite, ou arquivos JSON se ele não existir)
     for tipo in dados.keys():
-        arquivos = glob.glob(f'{tipo}_*.json')
-        if arquivos:
-            # Pegar o arquivo mais recente baseado no timestamp no nome
-            arquivo_mais_recente = max(arquivos, key=lambda x: os.path.getctime(x))
-            try:
-                with open(arquivo_mais_recente, 'r', encoding='utf-8') as f:
-                    dados[tipo] = json.load(f)
-                print(f"✅ {tipo}: {arquivo_mais_recente}")
-            except Exception as e:
-                print(f"❌ Erro ao carregar {tipo}: {e}")
+        try:
+            dados[tipo], origem = carregar_mais_recente(tipo)
+            if origem:
+                print(f"✅ {tipo}: {origem}")
+        except Exception as e:
+            print(f"❌ Erro ao carregar {tipo}: {e}")
     
     return dados
 
@@ -159,13 +157,13 @@ def enviar_email(destinatario, assunto, corpo):
             return False
         
         # Criar mensagem
-        msg = MIMEMultipart()
+        msg = mime_multipart.MIMEMultipart()
         msg['From'] = email_from
         msg['To'] = destinatario
         msg['Subject'] = assunto
         
         # Adicionar corpo do email
-        msg.attach(MIMEText(corpo, 'plain', 'utf-8'))
+        msg.attach(mime_texto.MIMEText(corpo, 'plain', 'utf-8'))
         
         # Conectar e enviar
         print(f"🔗 Conectando ao servidor SMTP: {smtp_server}:{smtp_port}")
@@ -6,13 +6,17 @@ Usa apenas EMAIL_USER e EMAIL_PASS - Muito mais simples!
 """
 
 import os
-import json
-import glob
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 
+from importacao import preguicoso
+from armazenamento import carregar_mais_recente
+from indice_historico import abrir_indice
+
+# Só carregados na hora de enviar
+smtplib = preguicoso('smtplib')
+mime_texto = preguicoso('email.mime.text')
+mime_multipart = preguicoso('email.mime.multipart')
+
 def carregar_dados_recentes():
     """Carrega os dados mais recentes dos scrapers"""
     dados = {
@@ -22,17 +26,14 @@ def carregar_dados_recentes():
         'dados_reorganizados': None
     }
     
-    # Buscar arquivos mais recentes
+    # Buscar dados mais recentes (banco SQLite, ou arquivos JSON se ele não existir)
     for tipo in dados.keys():
-        arquivos = glob.glob(f'{tipo}_*.json')
-        if arquivos:
-            arquivo_mais_recente = max(arquivos, key=lambda x: os.path.getctime(x))
-            try:
-                with open(arquivo_mais_recente, 'r', encoding='utf-8') as f:
-                    dados[tipo] = json.load(f)
-                print(f"✅ {tipo}: {arquivo_mais_recente}")
-            except Exception as e:
-                print(f"❌ Erro ao carregar {tipo}: {e}")
+        try:
+            dados[tipo], origem = carregar_mais_recente(tipo)
+            if origem:
+                print(f"✅ {tipo}: {origem}")
+        except Exception as e:
+            print(f"❌ Erro ao carregar {tipo}: {e}")
     
     return dados
 
@@ -77,9 +78,14 @@ def criar_resumo_email(dados):
         dados_reorg = dados['dados_reorganizados']
         resumo.append("🔧 DADOS REORGANIZADOS:")
         total = 0
+        # Novas x recorrentes pelo índice do histórico (se ele já existir)
+        indice = abrir_indice()
         for fonte, itens in dados_reorg.items():
             if isinstance(itens, list) and fonte != 'timestamp' and fonte != 'status':
                 resumo.append(f"   📄 {fonte.upper()}: {len(itens)} itens com PDFs")
+                if indice:
+                    novas = sum(1 for item in itens if indice.situacao(item, fonte)[0] == 'nova')
+                    resumo.append(f"      🆕 {novas} novas | 🔁 {len(itens) - novas} recorrentes")
                 total += len(itens)
         resumo.append(f"   📊 TOTAL: {total} oportunidades")
         resumo.append("")
@@ -100,13 +106,13 @@ def enviar_email_simples(email_user, email_pass, destinatario, assunto, corpo):
         server.login(email_user, email_pass)
         
         # Criar mensagem
-        msg = MIMEMultipart()
+        msg = mime_multipart.MIMEMultipart()
         msg['From'] = email_user
         msg['To'] = destinatario
         msg['Subject'] = assunto
         
         # Adicionar corpo do email
-        msg.attach(MIMEText(corpo, 'plain', 'utf-8'))
+        msg.attach(mime_texto.MIMEText(corpo, 'plain', 'utf-8'))
         
         print(f"📤 Enviando email para: {destinatario}")
         server.send_message(msg)
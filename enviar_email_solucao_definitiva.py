@@ -9,13 +9,16 @@ e todas as informações detalhadas dos editais.
 """
 
 import os
-import json
-import glob
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-import pytz
+
+from importacao import preguicoso
+from modelos import Fonte, chamadas_de_dados, texto_de
+from armazenamento import carregar_mais_recente
+
+# Só carregados na hora de enviar
+smtplib = preguicoso('smtplib')
+mime_texto = preguicoso('email.mime.text')
+mime_multipart = preguicoso('email.mime.multipart')
 
 def validar_configuracao_email():
     """Valida se todas as variáveis de email estão configuradas"""
@@ -63,27 +66,27 @@ def validar_configuracao_email():
     print("✅ Todas as variáveis estão configuradas corretamente!")
     return True
 
-def carregar_dados_solucao_definitiva():
-    """Carrega os dados da SOLUÇÃO DEFINITIVA"""
+def carregar_dados_solucao_definitiva(carregados=None):
+    """Carrega os dados da SOLUÇÃO DEFINITIVA (os já recebidos em memória não são relidos)"""
     dados = {
         'fapemig_solucao_definitiva': None,
         'dados_reorganizados_solucao_definitiva': None,
         'editais_rapidos': None,
         'chamadas_cnpq_detalhadas': None
     }
+    dados.update(carregados or {})
     
-    # Buscar arquivos mais recentes
+    # Buscar dados mais recentes (banco SQLite, ou arquivos JSON se ele não existir)
     for tipo in dados.keys():
-        arquivos = glob.glob(f'{tipo}_*.json')
-        if arquivos:
-            # Pegar o arquivo mais recente baseado no timestamp no nome
-            arquivo_mais_recente = max(arquivos, key=lambda x: os.path.getctime(x))
-            try:
-                with open(arquivo_mais_recente, 'r', encoding='utf-8') as f:
-                    dados[tipo] = json.load(f)
-                print(f"✅ {tipo}: {arquivo_mais_recente}")
-            except Exception as e:
-                print(f"❌ Erro ao carregar {tipo}: {e}")
+        if dados[tipo] is not None:
+            print(f"✅ {tipo}: recebido em memória")
+            continue
+        try:
+            dados[tipo], origem = carregar_mais_recente(tipo)
+            if origem:
+                print(f"✅ {tipo}: {origem}")
+        except Exception as e:
+            print(f"❌ Erro ao carregar {tipo}: {e}")
     
     return dados
 
@@ -112,30 +115,31 @@ def criar_email_solucao_definitiva(dados):
         email_content.append("📋 DETALHES COMPLETOS DOS EDITAIS FAPEMIG:")
         email_content.append("-" * 50)
         
-        for i, edital in enumerate(fapemig['fapemig'], 1):
-            email_content.append(f"{i}. {edital['titulo']}")
-            email_content.append(f"   📊 Número: {edital['numero']}")
-            email_content.append(f"   📅 Data Inclusão: {edital['data_inclusao']}")
-            email_content.append(f"   ⏰ Prazo Final: {edital['prazo_final']}")
-            email_content.append(f"   📄 Total PDFs: {edital['total_pdfs']}")
+        editais = [edital for edital in chamadas_de_dados(fapemig) if edital.fonte == Fonte.FAPEMIG]
+        for i, edital in enumerate(editais, 1):
+            email_content.append(f"{i}. {edital.titulo}")
+            email_content.append(f"   📊 Número: {edital.numero}")
+            email_content.append(f"   📅 Data Inclusão: {edital.data_inclusao}")
+            email_content.append(f"   ⏰ Prazo Final: {edital.prazo_final}")
+            email_content.append(f"   📄 Total PDFs: {len(edital.anexos)}")
             
             # 🔥 TODOS OS PDFs DISPONÍVEIS
-            if edital['pdfs_disponiveis']:
+            if edital.anexos:
                 email_content.append("   📄 PDFs Disponíveis:")
-                for j, pdf in enumerate(edital['pdfs_disponiveis'], 1):
-                    email_content.append(f"      {j}. {pdf['nome']}")
-                    email_content.append(f"         🔗 URL: {pdf['url']}")
-                    email_content.append(f"         📝 Tipo: {pdf['tipo']}")
-                    if pdf.get('instrucoes'):
-                        email_content.append(f"         💡 Instruções: {pdf['instrucoes']}")
+                for j, pdf in enumerate(edital.anexos, 1):
+                    email_content.append(f"      {j}. {pdf.nome}")
+                    email_content.append(f"         🔗 URL: {pdf.url}")
+                    email_content.append(f"         📝 Tipo: {texto_de(pdf.tipo)}")
+                    if pdf.instrucoes:
+                        email_content.append(f"         💡 Instruções: {pdf.instrucoes}")
             else:
                 email_content.append("   📄 PDFs: Acesse a página para encontrar os PDFs")
             
             # Links de vídeo se existirem
-            if edital.get('links_video'):
+            if edital.links_video:
                 email_content.append("   🎥 Vídeos Explicativos:")
-                for video in edital['links_video']:
-                    email_content.append(f"      🔗 {video['plataforma']}: {video['url']}")
+                for video in edital.links_video:
+                    email_content.append(f"      🔗 {video.get('plataforma', 'Vídeo')}: {video.get('url', '')}")
             
             email_content.append("")
     
@@ -151,25 +155,26 @@ def criar_email_solucao_definitiva(dados):
         email_content.append("📋 DETALHES DOS EDITAIS FAPEMIG:")
         email_content.append("-" * 50)
         
-        for i, edital in enumerate(dados_reorg['fapemig'], 1):
-            email_content.append(f"{i}. {edital['titulo']}")
-            email_content.append(f"   📊 Número: {edital['numero']}")
-            email_content.append(f"   📅 Data Inclusão: {edital['data_inclusao']}")
-            email_content.append(f"   ⏰ Prazo Final: {edital['prazo_final']}")
-            email_content.append(f"   📄 Total PDFs: {edital['total_pdfs']}")
+        editais = [edital for edital in chamadas_de_dados(dados_reorg) if edital.fonte == Fonte.FAPEMIG]
+        for i, edital in enumerate(editais, 1):
+            email_content.append(f"{i}. {edital.titulo}")
+            email_content.append(f"   📊 Número: {edital.numero}")
+            email_content.append(f"   📅 Data Inclusão: {edital.data_inclusao}")
+            email_content.append(f"   ⏰ Prazo Final: {edital.prazo_final}")
+            email_content.append(f"   📄 Total PDFs: {len(edital.anexos)}")
             
             # PDFs disponíveis
-            if edital['pdfs_disponiveis']:
+            if edital.anexos:
                 email_content.append("   📄 PDFs Disponíveis:")
-                for j, pdf in enumerate(edital['pdfs_disponiveis'], 1):
-                    email_content.append(f"      {j}. {pdf['nome']}")
-                    email_content.append(f"         🔗 URL: {pdf['url']}")
-                    email_content.append(f"         📝 Tipo: {pdf['tipo']}")
-                    if pdf.get('instrucoes'):
-                        email_content.append(f"         💡 Instruções: {pdf['instrucoes']}")
+                for j, pdf in enumerate(edital.anexos, 1):
+                    email_content.append(f"      {j}. {pdf.nome}")
+                    email_content.append(f"         🔗 URL: {pdf.url}")
+                    email_content.append(f"         📝 Tipo: {texto_de(pdf.tipo)}")
+                    if pdf.instrucoes:
+                        email_content.append(f"         💡 Instruções: {pdf.instrucoes}")
             
-            email_content.append(f"   🔗 Link Principal: {edital['link_principal']}")
-            email_content.append(f"   🔗 Link Alternativo: {edital['link_alternativo']}")
+            email_content.append(f"   🔗 Link Principal: {edital.link}")
+            email_content.append(f"   🔗 Link Alternativo: {edital.link_alternativo}")
             email_content.append("")
     
     # UFMG
@@ -244,13 +249,13 @@ def enviar_email_solucao_definitiva(destinatario, assunto, corpo):
             return False
         
         # Criar mensagem
-        msg = MIMEMultipart()
+        msg = mime_multipart.MIMEMultipart()
         msg['From'] = email_from
         msg['To'] = destinatario
         msg['Subject'] = assunto
         
         # Adicionar corpo do email
-        msg.attach(MIMEText(corpo, 'plain', 'utf-8'))
+        msg.attach(mime_texto.MIMEText(corpo, 'plain', 'utf-8'))
         
         # Conectar e enviar
         print(f"🔗 Conectando ao servidor SMTP: {smtp_server}:{smtp_port}")
@@ -271,8 +276,8 @@ def enviar_email_solucao_definitiva(destinatario, assunto, corpo):
         print(f"❌ Erro ao enviar email: {e}")
         return False
 
-def main():
-    """Função principal"""
+def main(carregados=None):
+    """Função principal (carregados: dados já em memória, vindos do pipeline)"""
     print("🔥 INICIANDO ENVIO DE EMAIL COM SOLUÇÃO DEFINITIVA")
     print("=" * 60)
     
@@ -286,7 +291,7 @@ def main():
     
     # Carregar dados da SOLUÇÃO DEFINITIVA
     print("\n📂 Carregando dados da SOLUÇÃO DEFINITIVA...")
-    dados = carregar_dados_solucao_definitiva()
+    dados = carregar_dados_solucao_definitiva(carregados)
     
     # Criar email com SOLUÇÃO DEFINITIVA
     print("🔥 Criando email com SOLUÇÃO DEFINITIVA...")
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+🔀 EXECUÇÃO PARALELA POR FONTE
+==============================
+
+FAPEMIG, CNPq e UFMG são independentes, mas os scrapers percorriam as três em
+sequência com um único navegador:
+✅ Um processo por fonte, cada um com o seu próprio navegador
+✅ Registros enviados ao processo principal assim que são extraídos (fila)
+✅ Prazo por fonte: uma página travada da FAPEMIG não segura CNPq e UFMG
+✅ Prazo da fonte limitado ao da etapa (prazos.py) e repassado ao scraper filho,
+   que para sozinho pouco antes e devolve o que tem como parcial
+✅ Fonte que estoura o prazo é encerrada (navegador fechado) e mantém o que já enviou
+✅ Com checkpoint (checkpoints.py): fonte concluída não roda de novo, e a fonte
+   interrompida recomeça com os registros e URLs que já tinha
+✅ Tempo total ≈ tempo da fonte mais lenta
+"""
+
+import os
+import json
+import time
+import queue
+import signal
+import multiprocessing
+from collections import Counter
+
+from prazos import Prazo, prazo_da_etapa
+from checkpoints import UrlsProcessadas
+
+PRAZOS_PADRAO = {'fapemig': 180, 'cnpq': 180, 'ufmg': 120}
+PRAZO_GERAL = 180
+INTERVALO_ESPERA = 0.5
+# O filho para sozinho este tempo antes do prazo; o terminate é só para quem travou
+MARGEM_ENCERRAMENTO = 5
+
+
+def prazo_da_fonte(fonte, prazos=None):
+    """Prazo em segundos: SCRAPER_PRAZO_<FONTE>, depois 'prazos', depois o padrão"""
+    valor = os.getenv(f"SCRAPER_PRAZO_{fonte.upper()}")
+    if valor:
+        return float(valor)
+    return (prazos or PRAZOS_PADRAO).get(fonte, PRAZO_GERAL)
+
+
+def _conteudo(registro):
+    return json.dumps(registro, ensure_ascii=False, sort_keys=True, default=str)
+
+
+class ListaTransmitida(list):
+    """Lista de resultados que envia cada append ao processo principal. 'enviados' conta
+    (por conteúdo) o que o principal já tem: os itens iniciais (checkpoint) e cada append"""
+
+    def __init__(self, fila, fonte, lista, itens=()):
+        super().__init__(itens)
+        self.fila = fila
+        self.fonte = fonte
+        self.lista = lista
+        self.enviados = Counter(_conteudo(registro) for registro in self)
+
+    def append(self, registro):
+        super().append(registro)
+        self.enviados[_conteudo(registro)] += 1
+        self.fila.put(('registro', self.fonte, (self.lista, registro)))
+
+    def nao_enviados(self, registros):
+        """Registros de 'registros' que o principal ainda não tem (ex.: lista atribuída de uma
+        vez no fim, com ou sem os do checkpoint, em qualquer ordem)"""
+        restantes = Counter(self.enviados)
+        novos = []
+        for registro in registros:
+            chave = _conteudo(registro)
+            if restantes[chave] > 0:
+                restantes[chave] -= 1
+            else:
+                novos.append(registro)
+        return novos
+
+
+class _SaidaNula:
+    # No processo filho a gravação em disco é feita pelo processo principal
+    def escrever(self, lista, registro):
+        pass
+
+
+def fontes_parciais(situacao):
+    """Fontes cujo resultado ficou incompleto por causa do prazo"""
+    return [fonte for fonte, estado in situacao.items() if 'prazo' in estado]
+
+
+def _trabalhador(fabrica, metodo, fonte, fila, fim, anteriores=None, urls=()):
+    scraper = fabrica()
+    scraper.prazo = Prazo(fim=fim - MARGEM_ENCERRAMENTO, nome=fonte)
+    scraper.urls_processadas = UrlsProcessadas(urls, lambda url: fila.put(('url', fonte, url)))
+
+    def encerrar(*args):
+        # Prazo estourado: fecha o navegador antes de sair para não deixar o Chrome órfão
+        if getattr(scraper, 'driver', None):
+            try:
+                scraper.driver.quit()
+            except Exception:
+                pass
+        os._exit(1)
+
+    signal.signal(signal.SIGTERM, encerrar)
+
+    # Registros do checkpoint entram na lista sem serem reenviados (o principal já os tem)
+    for lista, registros in (anteriores or {}).items():
+        scraper.resultados.setdefault(lista, []).extend(registros)
+    transmitidas = {}
+    for lista, valor in list(scraper.resultados.items()):
+        if isinstance(valor, list):
+            scraper.resultados[lista] = transmitidas[lista] = ListaTransmitida(fila, fonte, lista, valor)
+    if hasattr(scraper, 'saida'):
+        scraper.saida = _SaidaNula()
+
+    try:
+        if not scraper.configurar_navegador():
+            fila.put(('erro', fonte, 'navegador não configurado'))
+            return
+        getattr(scraper, metodo)()
+        # O que não foi enviado por append (lista atribuída de uma vez, extend...) segue no 'fim'
+        novos = {}
+        for lista, valor in scraper.resultados.items():
+            if not isinstance(valor, list):
+                continue
+            transmitida = transmitidas.get(lista)
+            novos[lista] = transmitida.nao_enviados(valor) if transmitida is not None else list(valor)
+        fila.put(('fim', fonte, {'listas': novos, 'parcial': scraper.prazo.estourado}))
+    except Exception as e:
+        fila.put(('erro', fonte, str(e)))
+    finally:
+        if getattr(scraper, 'driver', None):
+            try:
+                scraper.driver.quit()
+            except Exception:
+                pass
+
+
+def executar_fontes_em_paralelo(fabrica, metodos, ao_receber=None, prazos=None, checkpoint=None):
+    """Executa metodos {fonte: nome do método} de instâncias de 'fabrica', um processo por fonte
+
+    ao_receber(lista, registro) é chamado no processo principal a cada registro recebido.
+    checkpoint: Checkpoint onde ficam as fontes concluídas, os registros e as URLs de cada fonte.
+    Retorna ({lista: registros}, {fonte: 'ok' | 'parcial (prazo esgotado)' | 'prazo esgotado' | 'erro: ...'}).
+    """
+    contexto = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+    fila = contexto.Queue()
+    resultados = {}
+    situacao = {}
+
+    def receber(lista, registro, fonte=None):
+        resultados.setdefault(lista, []).append(registro)
+        if ao_receber:
+            ao_receber(lista, registro)
+        if checkpoint and fonte:
+            checkpoint.registrar_registro(fonte, lista, registro)
+
+    etapa = prazo_da_etapa()
+    processos = {}
+    limites = {}
+    inicio = time.monotonic()
+    for fonte, metodo in metodos.items():
+        anteriores = checkpoint.registros_da_fonte(fonte) if checkpoint else {}
+        for lista, registros in anteriores.items():
+            for registro in registros:
+                receber(lista, registro)
+        if checkpoint and checkpoint.fonte_concluida(fonte):
+            situacao[fonte] = 'ok (checkpoint)'
+            print(f"💾 {fonte.upper()}: concluída no checkpoint "
+                  f"({sum(len(registros) for registros in anteriores.values())} registros)")
+            continue
+
+        urls = checkpoint.urls_processadas(fonte) if checkpoint else ()
+        limites[fonte] = etapa.dividir(fonte, segundos=prazo_da_fonte(fonte, prazos))
+        processo = contexto.Process(target=_trabalhador,
+                                    args=(fabrica, metodo, fonte, fila, limites[fonte].fim, anteriores, urls),
+                                    name=f"scraper-{fonte}", daemon=True)
+        processo.start()
+        processos[fonte] = processo
+        print(f"🔀 {fonte.upper()}: processo {processo.pid} (prazo {limites[fonte].restante():.0f}s)")
+
+    while len(situacao) < len(metodos):
+        try:
+            tipo, chave, conteudo = fila.get(timeout=INTERVALO_ESPERA)
+        except queue.Empty:
+            tipo = None
+
+        if tipo == 'registro':
+            lista, registro = conteudo
+            receber(lista, registro, chave)
+        elif tipo == 'url':
+            if checkpoint:
+                checkpoint.marcar_url(chave, conteudo)
+        elif tipo == 'fim':
+            # O filho já separou o que não tinha sido enviado por append nem veio do checkpoint
+            for lista, novos in conteudo['listas'].items():
+                for registro in novos:
+                    receber(lista, registro, chave)
+            if conteudo['parcial']:
+                situacao[chave] = 'parcial (prazo esgotado)'
+                print(f"⏰ {chave.upper()}: prazo esgotado, resultados parciais em {time.monotonic() - inicio:.1f}s")
+            else:
+                situacao[chave] = 'ok'
+                if checkpoint:
+                    checkpoint.concluir_fonte(chave)
+                print(f"✅ {chave.upper()} concluída em {time.monotonic() - inicio:.1f}s")
+        elif tipo == 'erro':
+            situacao[chave] = f"erro: {conteudo}"
+            print(f"❌ {chave.upper()}: {conteudo}")
+
+        for fonte, processo in processos.items():
+            if fonte in situacao:
+                continue
+            if limites[fonte].esgotado():
+                processo.terminate()
+                situacao[fonte] = 'prazo esgotado'
+                print(f"⏰ {fonte.upper()}: prazo esgotado, mantendo os resultados parciais")
+            elif not processo.is_alive() and fila.empty():
+                situacao[fonte] = f"erro: processo terminou com código {processo.exitcode}"
+                print(f"❌ {fonte.upper()}: processo terminou com código {processo.exitcode}")
+
+    for processo in processos.values():
+        processo.join(timeout=5)
+        if processo.is_alive():
+            processo.kill()
+
+    return resultados, situacao
@@ -18,55 +18,49 @@ RESOLVE TODOS OS PROBLEMAS:
 
 import os
 import sys
-import subprocess
-import time
 from datetime import datetime
 
-def executar_comando(comando, descricao):
-    """Executa um comando e retorna o resultado"""
-    print(f"\n🚀 EXECUTANDO: {descricao}")
-    print(f"📋 Comando: {comando}")
-    print("-" * 60)
-    
-    try:
-        resultado = subprocess.run(comando, shell=True, capture_output=True, text=True, encoding='utf-8')
-        
-        if resultado.returncode == 0:
-            print(f"✅ {descricao} executado com sucesso!")
-            if resultado.stdout:
-                print("📤 Saída:")
-                print(resultado.stdout)
-        else:
-            print(f"❌ {descricao} falhou!")
-            if resultado.stderr:
-                print("❌ Erro:")
-                print(resultado.stderr)
-            return False
-            
-        return True
-        
-    except Exception as e:
-        print(f"❌ Erro ao executar {descricao}: {e}")
-        return False
+from armazenamento import localizar_mais_recente
+from pipeline import Etapa, Pipeline
+from checkpoints import Checkpoint
+import scraper_fapemig_solucao_definitiva
+import reorganizar_dados_mega_ultra_melhorado
+import enviar_email_solucao_definitiva
+
+def enviar_email(contexto):
+    """Etapa de email: recebe em memória os dados das etapas anteriores"""
+    carregados = {
+        'fapemig_solucao_definitiva': contexto.get('fapemig'),
+        'dados_reorganizados_solucao_definitiva': contexto.get('reorganizacao')
+    }
+    return enviar_email_solucao_definitiva.main(carregados) == 0
+
+def criar_pipeline(checkpoint=None):
+    """Etapas da SOLUÇÃO DEFINITIVA, executadas no mesmo processo (retomáveis com --resume)"""
+    return Pipeline([
+        Etapa('fapemig', "Scraper MEGA-ULTRA-MELHORADO da FAPEMIG", scraper_fapemig_solucao_definitiva.executar, peso=4),
+        Etapa('reorganizacao', "Reorganização MEGA-ULTRA-MELHORADA dos dados", reorganizar_dados_mega_ultra_melhorado.executar),
+        Etapa('verificacao', "Verificação dos arquivos gerados", lambda contexto: verificar_arquivos_gerados()),
+        Etapa('email', "Email MEGA-ULTRA-MELHORADO com SOLUÇÃO DEFINITIVA", enviar_email)
+    ], checkpoint)
 
 def verificar_arquivos_gerados():
     """Verifica se os arquivos foram gerados corretamente"""
     print("\n🔍 VERIFICANDO ARQUIVOS GERADOS:")
     print("=" * 40)
     
-    arquivos_esperados = [
-        'fapemig_solucao_definitiva_*.json',
-        'dados_reorganizados_solucao_definitiva_*.json'
+    tipos_esperados = [
+        'fapemig_solucao_definitiva',
+        'dados_reorganizados_solucao_definitiva'
     ]
     
-    for padrao in arquivos_esperados:
-        arquivos = glob.glob(padrao)
-        if arquivos:
-            arquivo_mais_recente = max(arquivos, key=lambda x: os.path.getctime(x))
+    for tipo in tipos_esperados:
+        arquivo_mais_recente = localizar_mais_recente(tipo)
+        if arquivo_mais_recente:
             tamanho = os.path.getsize(arquivo_mais_recente)
-            print(f"✅ {padrao}: {arquivo_mais_recente} ({tamanho} bytes)")
+            print(f"✅ {tipo}: {arquivo_mais_recente} ({tamanho} bytes)")
         else:
-            print(f"❌ {padrao}: NÃO ENCONTRADO")
+            print(f"❌ {tipo}: NÃO ENCONTRADO")
             return False
     
     return True
@@ -98,38 +92,17 @@ def main():
     print("🔥 Resolvendo TODOS os problemas dos scrapers!")
     print("")
     
-    # Passo 1: Executar scraper MEGA-ULTRA-MELHORADO da FAPEMIG
-    if not executar_comando("python scraper_fapemig_solucao_definitiva.py", 
-                           "Scraper MEGA-ULTRA-MELHORADO da FAPEMIG"):
-        print("❌ Falha no scraper da FAPEMIG!")
-        return 1
-    
-    # Aguardar um pouco para garantir que o arquivo foi salvo
-    time.sleep(3)
-    
-    # Passo 2: Executar reorganização MEGA-ULTRA-MELHORADA
-    if not executar_comando("python reorganizar_dados_mega_ultra_melhorado.py", 
-                           "Reorganização MEGA-ULTRA-MELHORADA dos dados"):
-        print("❌ Falha na reorganização dos dados!")
-        return 1
-    
-    # Aguardar um pouco para garantir que o arquivo foi salvo
-    time.sleep(3)
-    
-    # Passo 3: Verificar se os arquivos foram gerados
-    if not verificar_arquivos_gerados():
-        print("❌ Arquivos não foram gerados corretamente!")
+    # Etapas em sequência, no mesmo processo: scrapers -> reorganização -> verificação -> email
+    pipeline = criar_pipeline(Checkpoint('solucao_definitiva'))
+    if not pipeline.executar():
+        print("❌ Falha na SOLUÇÃO DEFINITIVA!")
+        print("\n".join(pipeline.resumo_duracoes()))
         return 1
     
-    # Passo 4: Executar envio de email com SOLUÇÃO DEFINITIVA
-    if not executar_comando("python enviar_email_solucao_definitiva.py", 
-                           "Email MEGA-ULTRA-MELHORADO com SOLUÇÃO DEFINITIVA"):
-        print("❌ Falha no envio do email!")
-        return 1
-    
-    # Passo 5: Mostrar resumo final
+    # Resumo final
     mostrar_resumo_final()
     
+    print("\n".join(pipeline.resumo_duracoes()))
     print(f"\n⏰ Fim: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
     print("🎉 SOLUÇÃO DEFINITIVA CONCLUÍDA COM SUCESSO!")
     
@@ -139,7 +112,4 @@ if __name__ == "__main__":
     # Adicionar o diretório atual ao PATH para importar módulos
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     
-    # Importar glob aqui para evitar erro de importação
-    import glob
-    
     exit(main())
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+📬 FILA DE TAREFAS COM ARRENDAMENTO (BACKEND SQLITE)
+====================================================
+
+Com mais agências e páginas de detalhe, um único runner não dá conta. A coleta
+passa a poder ser dividida em tarefas que N trabalhadores consomem:
+✅ Tarefas de busca de página ('buscar'), extração por estratégia ('extrair',
+   registro de fontes.py) e download de PDF ('pdf')
+✅ Trabalhadores arrendam tarefas em lotes com prazo de visibilidade: tarefa
+   de um trabalhador que morreu volta para a fila quando o prazo vence
+✅ Enquanto o trabalhador está vivo, uma pulsação renova o arrendamento do que ele
+   segura (um 'extrair' de vários minutos não é entregue a outro); tarefas longas
+   (TIPOS_LONGOS) são arrendadas uma a uma
+✅ Enfileirar e concluir são idempotentes dentro de uma rodada (chave única por
+   tarefa e rodada; o primeiro resultado vence, repetições são ignoradas). A rodada
+   é o dia (ou SCRAPER_RODADA / --rodada): a coleta de amanhã enfileira de novo
+✅ Tentativas limitadas com espera crescente; esgotadas, a tarefa fica 'falhou'
+✅ Backend plugável (BackendFila): SQLite local hoje, uma fila em rede depois,
+   escolhida por SCRAPER_FILA=esquema://destino
+
+O SQLite serve para vários processos na mesma máquina. Para vários hosts, o
+arquivo num disco de rede não é confiável: registre um backend em rede.
+
+Uso: python fila_tarefas.py estado
+     python fila_tarefas.py enfileirar extrair fapemig:rapido cnpq:inteligente [--rodada R]
+     python fila_tarefas.py enfileirar buscar|pdf <url> [<url> ...]
+     python fila_tarefas.py enfileirar pdfs        (PDFs dos dados reorganizados mais recentes)
+     python fila_tarefas.py trabalhar [N] [--tipos buscar,pdf] [--continuo]
+     python fila_tarefas.py resultados [tipo] [--rodada R|todas]
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import threading
+import sqlite3
+import hashlib
+import multiprocessing
+from datetime import date
+from urllib.request import urlopen, Request
+
+FILA_PADRAO = os.getenv('SCRAPER_FILA', 'sqlite://fila_tarefas.db')
+DIRETORIO_DOWNLOADS = os.getenv('SCRAPER_DOWNLOADS', '.fila')
+VISIBILIDADE_PADRAO = 300
+MAX_TENTATIVAS = 3
+ESPERA_NOVA_TENTATIVA = 30
+TAMANHO_ARRENDAMENTO = 4
+# Tipos que rodam um scraper inteiro: não prendem um lote de outras tarefas enquanto rodam
+TIPOS_LONGOS = ('extrair',)
+ESPERA_OCIOSA = 2
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def rodada_atual():
+    """Rodada das tarefas enfileiradas agora: SCRAPER_RODADA ou a data de hoje"""
+    return os.getenv('SCRAPER_RODADA') or date.today().isoformat()
+
+
+def chave_da_tarefa(tipo, carga, rodada=''):
+    """Chave estável: a mesma tarefa enfileirada duas vezes na mesma rodada é uma só"""
+    texto = json.dumps({'tipo': tipo, 'carga': carga, 'rodada': rodada}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(texto.encode('utf-8')).hexdigest()
+
+
+def nome_trabalhador():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class TarefaArrendada:
+    """Tarefa entregue a um trabalhador; 'arrendamento' identifica esta entrega"""
+
+    def __init__(self, id, chave, tipo, carga, tentativas, arrendamento):
+        self.id = id
+        self.chave = chave
+        self.tipo = tipo
+        self.carga = carga
+        self.tentativas = tentativas
+        self.arrendamento = arrendamento
+
+    def __repr__(self):
+        return f"<tarefa {self.id} {self.tipo} tentativa {self.tentativas}>"
+
+
+class BackendFila:
+    """Interface dos backends de fila. Um backend em rede implementa estes métodos e
+    se registra com registrar_backend('esquema', Classe)"""
+
+    def enfileirar(self, tipo, carga, chave=None, prioridade=0, max_tentativas=MAX_TENTATIVAS, rodada=None):
+        """Acrescenta a tarefa à rodada (padrão: rodada_atual()); ignorada se a chave já existe.
+        True se ela é nova"""
+        raise NotImplementedError
+
+    def enfileirar_varias(self, tarefas, prioridade=0, max_tentativas=MAX_TENTATIVAS, rodada=None):
+        """Enfileira [(tipo, carga)]. Retorna quantas eram novas (backends podem usar uma transação só)"""
+        return sum(self.enfileirar(tipo, carga, prioridade=prioridade, max_tentativas=max_tentativas,
+                                   rodada=rodada)
+                   for tipo, carga in tarefas)
+
+    def arrendar(self, trabalhador, quantidade=1, tipos=None, visibilidade=VISIBILIDADE_PADRAO):
+        """Até 'quantidade' tarefas visíveis, invisíveis para os outros por 'visibilidade' segundos"""
+        raise NotImplementedError
+
+    def estender(self, tarefa, visibilidade=VISIBILIDADE_PADRAO):
+        """Renova o arrendamento de uma tarefa longa. False se ele já foi perdido"""
+        raise NotImplementedError
+
+    def concluir(self, tarefa, resultado):
+        """Grava o resultado. False se a tarefa já tinha sido concluída (repetição ignorada)"""
+        raise NotImplementedError
+
+    def falhar(self, tarefa, erro):
+        """Devolve a tarefa à fila com espera, ou a marca 'falhou' se as tentativas acabaram"""
+        raise NotImplementedError
+
+    def resultados(self, tipo=None, rodada=None):
+        """[(chave, carga, resultado)] das tarefas concluídas (de uma rodada, ou de todas)"""
+        raise NotImplementedError
+
+    def estatisticas(self):
+        """{tipo: {estado: quantidade}}"""
+        raise NotImplementedError
+
+    def fechar(self):
+        pass
+
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tarefas (
+    id INTEGER PRIMARY KEY,
+    chave TEXT NOT NULL UNIQUE,
+    tipo TEXT NOT NULL,
+    carga TEXT NOT NULL,
+    rodada TEXT NOT NULL DEFAULT '',
+    prioridade INTEGER NOT NULL DEFAULT 0,
+    estado TEXT NOT NULL DEFAULT 'pendente',
+    tentativas INTEGER NOT NULL DEFAULT 0,
+    max_tentativas INTEGER NOT NULL,
+    visivel_em REAL NOT NULL,
+    arrendamento TEXT,
+    trabalhador TEXT,
+    resultado TEXT,
+    erro TEXT,
+    criada_em REAL NOT NULL,
+    concluida_em REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tarefas_disponiveis ON tarefas(estado, visivel_em);
+"""
+
+
+class FilaSQLite(BackendFila):
+    """Fila num arquivo SQLite (modo WAL); arrendamentos em transações BEGIN IMMEDIATE"""
+
+    def __init__(self, caminho='fila_tarefas.db'):
+        self.caminho = caminho
+        # Autocommit: as transações são abertas explicitamente
+        self.conexao = sqlite3.connect(caminho, timeout=30, isolation_level=None)
+        self.conexao.row_factory = sqlite3.Row
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.executescript(ESQUEMA)
+        # Filas criadas antes da coluna rodada
+        colunas = {linha['name'] for linha in self.conexao.execute("PRAGMA table_info(tarefas)")}
+        if 'rodada' not in colunas:
+            self.conexao.execute("ALTER TABLE tarefas ADD COLUMN rodada TEXT NOT NULL DEFAULT ''")
+
+    def _transacao(self, operacao):
+        self.conexao.execute("BEGIN IMMEDIATE")
+        try:
+            resultado = operacao()
+        except Exception:
+            self.conexao.execute("ROLLBACK")
+            raise
+        self.conexao.execute("COMMIT")
+        return resultado
+
+    def enfileirar(self, tipo, carga, chave=None, prioridade=0, max_tentativas=MAX_TENTATIVAS, rodada=None):
+        rodada = rodada or rodada_atual()
+        chave = chave or chave_da_tarefa(tipo, carga, rodada)
+        return self._inserir([(chave, tipo, carga)], prioridade, max_tentativas, rodada) == 1
+
+    def enfileirar_varias(self, tarefas, prioridade=0, max_tentativas=MAX_TENTATIVAS, rodada=None):
+        """Enfileira [(tipo, carga)] numa transação. Retorna quantas eram novas"""
+        rodada = rodada or rodada_atual()
+        return self._inserir([(chave_da_tarefa(tipo, carga, rodada), tipo, carga) for tipo, carga in tarefas],
+                             prioridade, max_tentativas, rodada)
+
+    def _inserir(self, linhas, prioridade, max_tentativas, rodada):
+        agora = time.time()
+
+        def inserir():
+            antes = self.conexao.total_changes
+            self.conexao.executemany(
+                "INSERT OR IGNORE INTO tarefas "
+                "(chave, tipo, carga, rodada, prioridade, max_tentativas, visivel_em, criada_em) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(chave, tipo, json.dumps(carga, ensure_ascii=False), rodada, prioridade, max_tentativas,
+                  agora, agora)
+                 for chave, tipo, carga in linhas])
+            return self.conexao.total_changes - antes
+
+        return self._transacao(inserir)
+
+    def arrendar(self, trabalhador, quantidade=1, tipos=None, visibilidade=VISIBILIDADE_PADRAO):
+        agora = time.time()
+        filtro_tipos = f" AND tipo IN ({', '.join('?' * len(tipos))})" if tipos else ''
+
+        def arrendar():
+            # 'arrendada' com visivel_em vencido = trabalhador que sumiu
+            linhas = self.conexao.execute(
+                "SELECT id, chave, tipo, carga, tentativas, max_tentativas, estado FROM tarefas "
+                f"WHERE estado IN ('pendente', 'arrendada') AND visivel_em <= ?{filtro_tipos} "
+                "ORDER BY prioridade DESC, id LIMIT ?",
+                [agora] + list(tipos or []) + [quantidade]).fetchall()
+
+            arrendadas = []
+            for linha in linhas:
+                if linha['tentativas'] >= linha['max_tentativas']:
+                    self.conexao.execute(
+                        "UPDATE tarefas SET estado = 'falhou', erro = ? WHERE id = ?",
+                        ("prazo de visibilidade vencido na última tentativa", linha['id']))
+                    continue
+                arrendamento = uuid.uuid4().hex
+                self.conexao.execute(
+                    "UPDATE tarefas SET estado = 'arrendada', arrendamento = ?, trabalhador = ?, "
+                    "tentativas = tentativas + 1, visivel_em = ? WHERE id = ?",
+                    (arrendamento, trabalhador, agora + visibilidade, linha['id']))
+                arrendadas.append(TarefaArrendada(linha['id'], linha['chave'], linha['tipo'],
+                                                  json.loads(linha['carga']), linha['tentativas'] + 1,
+                                                  arrendamento))
+            return arrendadas
+
+        return self._transacao(arrendar)
+
+    def estender(self, tarefa, visibilidade=VISIBILIDADE_PADRAO):
+        cursor = self.conexao.execute(
+            "UPDATE tarefas SET visivel_em = ? WHERE id = ? AND arrendamento = ? AND estado = 'arrendada'",
+            (time.time() + visibilidade, tarefa.id, tarefa.arrendamento))
+        return cursor.rowcount == 1
+
+    def concluir(self, tarefa, resultado):
+        # Sem conferir o arrendamento: o resultado de quem perdeu o prazo mas terminou
+        # primeiro vale tanto quanto o de quem pegou a tarefa depois
+        cursor = self.conexao.execute(
+            "UPDATE tarefas SET estado = 'concluida', resultado = ?, erro = NULL, concluida_em = ? "
+            "WHERE id = ? AND estado != 'concluida'",
+            (json.dumps(resultado, ensure_ascii=False, default=str), time.time(), tarefa.id))
+        return cursor.rowcount == 1
+
+    def falhar(self, tarefa, erro):
+        def falhar():
+            linha = self.conexao.execute(
+                "SELECT tentativas, max_tentativas, estado, arrendamento FROM tarefas WHERE id = ?",
+                (tarefa.id,)).fetchone()
+            # Outro trabalhador já pegou (ou concluiu) a tarefa: esta falha não vale mais
+            if linha['estado'] != 'arrendada' or linha['arrendamento'] != tarefa.arrendamento:
+                return False
+            if linha['tentativas'] >= linha['max_tentativas']:
+                self.conexao.execute("UPDATE tarefas SET estado = 'falhou', erro = ? WHERE id = ?",
+                                     (str(erro), tarefa.id))
+            else:
+                espera = ESPERA_NOVA_TENTATIVA * 2 ** (linha['tentativas'] - 1)
+                self.conexao.execute(
+                    "UPDATE tarefas SET estado = 'pendente', erro = ?, visivel_em = ? WHERE id = ?",
+                    (str(erro), time.time() + espera, tarefa.id))
+            return True
+
+        return self._transacao(falhar)
+
+    def resultados(self, tipo=None, rodada=None):
+        consulta = "SELECT chave, carga, resultado FROM tarefas WHERE estado = 'concluida'"
+        parametros = []
+        if tipo:
+            consulta += " AND tipo = ?"
+            parametros.append(tipo)
+        if rodada:
+            consulta += " AND rodada = ?"
+            parametros.append(rodada)
+        return [(linha['chave'], json.loads(linha['carga']), json.loads(linha['resultado']))
+                for linha in self.conexao.execute(consulta + " ORDER BY id", parametros)]
+
+    def estatisticas(self):
+        contagens = {}
+        for linha in self.conexao.execute("SELECT tipo, estado, COUNT(*) AS n FROM tarefas GROUP BY tipo, estado"):
+            contagens.setdefault(linha['tipo'], {})[linha['estado']] = linha['n']
+        return contagens
+
+    def fechar(self):
+        self.conexao.close()
+
+
+# esquema de SCRAPER_FILA -> classe do backend (recebe o destino)
+BACKENDS = {'sqlite': FilaSQLite}
+
+
+def registrar_backend(esquema, classe):
+    BACKENDS[esquema] = classe
+
+
+def abrir_fila(endereco=None):
+    """Backend de 'esquema://destino' (padrão: SCRAPER_FILA ou sqlite://fila_tarefas.db)"""
+    endereco = endereco or FILA_PADRAO
+    esquema, separador, destino = endereco.partition('://')
+    if not separador or esquema not in BACKENDS:
+        raise ValueError(f"Fila desconhecida: '{endereco}' (esquemas: {', '.join(BACKENDS)})")
+    return BACKENDS[esquema](destino)
+
+
+# Tratadores: carga -> resultado (JSON). Exceção = tentativa falhou
+
+def _baixar(url):
+    with urlopen(Request(url, headers={'User-Agent': USER_AGENT}), timeout=60) as resposta:
+        return resposta.status, resposta.read()
+
+
+def _guardar(conteudo, subdiretorio, nome):
+    diretorio = os.path.join(DIRETORIO_DOWNLOADS, subdiretorio)
+    os.makedirs(diretorio, exist_ok=True)
+    caminho = os.path.join(diretorio, nome)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, 'wb') as f:
+        f.write(conteudo)
+    os.replace(temporario, caminho)
+    return caminho
+
+
+def tratar_buscar(carga, contexto):
+    status, conteudo = _baixar(carga['url'])
+    impressao = hashlib.sha1(conteudo).hexdigest()
+    caminho = _guardar(conteudo, 'paginas', f"{impressao}.html")
+    return {'url': carga['url'], 'status': status, 'tamanho': len(conteudo), 'sha1': impressao, 'caminho': caminho}
+
+
+def tratar_pdf(carga, contexto):
+    nome = f"{hashlib.sha1(carga['url'].encode('utf-8')).hexdigest()}.pdf"
+    caminho = os.path.join(DIRETORIO_DOWNLOADS, 'pdfs', nome)
+    if os.path.exists(caminho):
+        # Tarefa repetida depois de um prazo vencido: o arquivo já está lá
+        with open(caminho, 'rb') as f:
+            conteudo = f.read()
+    else:
+        _, conteudo = _baixar(carga['url'])
+        caminho = _guardar(conteudo, 'pdfs', nome)
+    return {'url': carga['url'], 'caminho': caminho, 'tamanho': len(conteudo),
+            'sha256': hashlib.sha256(conteudo).hexdigest()}
+
+
+def tratar_extrair(carga, contexto):
+    """Estratégias de fontes.py no processo do trabalhador, reaproveitando o seu Chrome"""
+    from fontes import selecionar, agrupar
+    from coletar import NavegadorCompartilhado, etapa_de_coleta
+
+    if 'navegador' not in contexto:
+        contexto['navegador'] = NavegadorCompartilhado()
+    resultados = {}
+    for modulo, classe, grupo in agrupar(selecionar(carga['estrategias'])):
+        resultado = etapa_de_coleta(grupo, contexto['navegador'])({})
+        if resultado is None:
+            raise RuntimeError(f"{modulo}.{classe}: coleta falhou")
+        resultados[f"{modulo}.{classe}"] = resultado
+    return resultados
+
+
+TRATADORES = {'buscar': tratar_buscar, 'pdf': tratar_pdf, 'extrair': tratar_extrair}
+
+
+class Pulsacao(threading.Thread):
+    """Renova a cada terço da visibilidade o arrendamento das tarefas que o trabalhador segura.
+    Usa conexão própria (a do laço principal fica na thread dele)"""
+
+    def __init__(self, endereco, visibilidade):
+        super().__init__(name='pulsacao-fila', daemon=True)
+        self.endereco = endereco
+        self.visibilidade = visibilidade
+        self.tarefas = []
+        self.trava = threading.Lock()
+        self.parar = threading.Event()
+
+    def segurar(self, tarefas):
+        with self.trava:
+            self.tarefas.extend(tarefas)
+
+    def soltar(self, tarefa):
+        with self.trava:
+            if tarefa in self.tarefas:
+                self.tarefas.remove(tarefa)
+
+    def run(self):
+        fila = abrir_fila(self.endereco)
+        try:
+            while not self.parar.wait(self.visibilidade / 3):
+                with self.trava:
+                    tarefas = list(self.tarefas)
+                for tarefa in tarefas:
+                    if not fila.estender(tarefa, self.visibilidade):
+                        # Outro trabalhador já a pegou ou concluiu: o resultado que chegar primeiro vale
+                        print(f"⚠️ {tarefa}: arrendamento perdido")
+                        self.soltar(tarefa)
+        finally:
+            fila.fechar()
+
+
+def trabalhar(endereco=None, tipos=None, tratadores=None, ocioso_max=None, visibilidade=VISIBILIDADE_PADRAO):
+    """Laço de um trabalhador: arrenda um lote, executa, conclui/falha. Sai depois de
+    'ocioso_max' segundos sem tarefas (None = nunca). Retorna quantas tarefas concluiu"""
+    tratadores = tratadores or TRATADORES
+    tipos = tipos or list(tratadores)
+    fila = abrir_fila(endereco)
+    trabalhador = nome_trabalhador()
+    contexto = {}
+    concluidas = 0
+    ocioso_desde = time.monotonic()
+    pulsacao = Pulsacao(endereco, visibilidade)
+    pulsacao.start()
+    curtos = [tipo for tipo in tipos if tipo not in TIPOS_LONGOS]
+    try:
+        while True:
+            tarefas = fila.arrendar(trabalhador, 1, tipos, visibilidade)
+            # Lote só de tarefas curtas; uma tarefa longa vem sozinha
+            if tarefas and tarefas[0].tipo not in TIPOS_LONGOS and curtos and TAMANHO_ARRENDAMENTO > 1:
+                tarefas += fila.arrendar(trabalhador, TAMANHO_ARRENDAMENTO - 1, curtos, visibilidade)
+            if not tarefas:
+                if ocioso_max is not None and time.monotonic() - ocioso_desde >= ocioso_max:
+                    break
+                time.sleep(ESPERA_OCIOSA)
+                continue
+
+            pulsacao.segurar(tarefas)
+            for tarefa in tarefas:
+                # Confere que a tarefa ainda é deste trabalhador antes de começar
+                if not fila.estender(tarefa, visibilidade):
+                    pulsacao.soltar(tarefa)
+                    continue
+                try:
+                    resultado = tratadores[tarefa.tipo](tarefa.carga, contexto)
+                except Exception as e:
+                    print(f"⚠️ [{trabalhador}] {tarefa}: {e}")
+                    fila.falhar(tarefa, e)
+                    continue
+                finally:
+                    pulsacao.soltar(tarefa)
+                if fila.concluir(tarefa, resultado):
+                    concluidas += 1
+            ocioso_desde = time.monotonic()
+    finally:
+        pulsacao.parar.set()
+        pulsacao.join(timeout=5)
+        if 'navegador' in contexto:
+            contexto['navegador'].fechar()
+        fila.fechar()
+    return concluidas
+
+
+def _processo_trabalhador(endereco, tipos, ocioso_max, retorno):
+    retorno.put(trabalhar(endereco, tipos, ocioso_max=ocioso_max))
+
+
+def trabalhar_em_paralelo(quantidade, endereco=None, tipos=None, ocioso_max=None):
+    """N processos trabalhadores nesta máquina. Retorna o total de tarefas concluídas"""
+    retorno = multiprocessing.Queue()
+    processos = [multiprocessing.Process(target=_processo_trabalhador,
+                                         args=(endereco, tipos, ocioso_max, retorno))
+                 for _ in range(quantidade)]
+    for processo in processos:
+        processo.start()
+    for processo in processos:
+        processo.join()
+    return sum(retorno.get() for processo in processos if processo.exitcode == 0)
+
+
+def tarefas_de_pdfs():
+    """Tarefas 'pdf' para os anexos dos dados reorganizados mais recentes"""
+    from armazenamento import carregar_mais_recente
+    from modelos import chamadas_de_dados
+
+    dados, arquivo = carregar_mais_recente('dados_reorganizados_com_pdfs')
+    if dados is None:
+        return []
+    print(f"📂 Anexos de {arquivo}")
+    urls = []
+    for chamada in chamadas_de_dados(dados):
+        urls.extend(anexo.url for anexo in chamada.anexos if anexo.url and anexo.url not in urls)
+    return [('pdf', {'url': url}) for url in urls]
+
+
+def mostrar_estado(fila):
+    estatisticas = fila.estatisticas()
+    if not estatisticas:
+        print("📭 Fila vazia")
+        return
+    for tipo, estados in sorted(estatisticas.items()):
+        resumo = ', '.join(f"{estado}: {quantidade}" for estado, quantidade in sorted(estados.items()))
+        print(f"📬 {tipo}: {resumo}")
+
+
+def main():
+    print("📬 FILA DE TAREFAS")
+    print("=" * 50)
+
+    argumentos = sys.argv[1:]
+    rodada = rodada_atual()
+    if '--rodada' in argumentos:
+        posicao = argumentos.index('--rodada')
+        rodada = argumentos[posicao + 1]
+        del argumentos[posicao:posicao + 2]
+    comando = argumentos[0] if argumentos else 'estado'
+
+    if comando == 'trabalhar':
+        tipos = None
+        if '--tipos' in argumentos:
+            tipos = argumentos[argumentos.index('--tipos') + 1].split(',')
+        numeros = [argumento for argumento in argumentos[1:] if argumento.isdigit()]
+        quantidade = int(numeros[0]) if numeros else 1
+        print(f"👷 {quantidade} trabalhador(es) em {FILA_PADRAO}")
+        # Sem --continuo, encerra quando a fila fica vazia
+        ocioso_max = None if '--continuo' in argumentos else ESPERA_OCIOSA * 3
+        concluidas = trabalhar_em_paralelo(quantidade, tipos=tipos, ocioso_max=ocioso_max)
+        print(f"✅ {concluidas} tarefa(s) concluída(s)")
+        mostrar_estado(abrir_fila())
+        return 0
+
+    fila = abrir_fila()
+    try:
+        if comando == 'enfileirar':
+            tipo = argumentos[1] if len(argumentos) > 1 else ''
+            valores = argumentos[2:]
+            if tipo == 'pdfs':
+                tarefas = tarefas_de_pdfs()
+            elif tipo == 'extrair':
+                from fontes import selecionar
+                try:
+                    estrategias = selecionar(valores)
+                except ValueError as e:
+                    print(f"❌ {e}")
+                    return 2
+                # Uma tarefa por estratégia: trabalhadores diferentes podem pegar cada uma
+                tarefas = [('extrair', {'estrategias': [estrategia.chave]}) for estrategia in estrategias]
+            elif tipo in ('buscar', 'pdf') and valores:
+                tarefas = [(tipo, {'url': url}) for url in valores]
+            else:
+                print("❌ Use: enfileirar extrair [estratégias] | buscar <url...> | pdf <url...> | pdfs")
+                return 2
+            novas = fila.enfileirar_varias(tarefas, rodada=rodada)
+            print(f"📥 Rodada {rodada}: {novas} tarefa(s) nova(s), {len(tarefas) - novas} já estavam na fila")
+
+        elif comando == 'resultados':
+            tipo = argumentos[1] if len(argumentos) > 1 else None
+            for chave, carga, resultado in fila.resultados(tipo, None if rodada == 'todas' else rodada):
+                print(json.dumps({'chave': chave, 'carga': carga, 'resultado': resultado}, ensure_ascii=False))
+            return 0
+
+        elif comando != 'estado':
+            print(f"❌ Comando desconhecido: {comando}")
+            return 2
+
+        mostrar_estado(fila)
+        return 0
+    finally:
+        fila.fechar()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🧩 REGISTRO DE FONTES E ESTRATÉGIAS
+===================================
+
+Cada fonte (UFMG, FAPEMIG, CNPq) pode ser coletada por várias estratégias, que
+são os scrapers existentes (rápido, detalhado, solução definitiva...):
+✅ Estratégia = módulo + classe do scraper + métodos de extração daquela fonte
+✅ Módulos importados só quando a estratégia é usada (Selenium incluso)
+✅ Estratégias da mesma classe escolhidas para várias fontes compartilham uma
+   instância e geram um único arquivo de resultados, como o script original
+✅ Estratégias padrão = o que o workflow coleta
+"""
+
+import importlib
+
+
+class Estrategia:
+    """Forma de coletar uma fonte: métodos de uma classe de scraper, seguidos de salvar_resultados"""
+
+    def __init__(self, fonte, nome, modulo, classe, metodos, descricao='', padrao=False, navegador=True):
+        self.fonte = fonte
+        self.nome = nome
+        self.modulo = modulo
+        self.classe = classe
+        self.metodos = list(metodos)
+        self.descricao = descricao
+        self.padrao = padrao
+        # False para estratégias que não abrem páginas (não precisam do Chrome)
+        self.navegador = navegador
+
+    @property
+    def chave(self):
+        return f"{self.fonte}:{self.nome}"
+
+    def carregar_classe(self):
+        return getattr(importlib.import_module(self.modulo), self.classe)
+
+
+# fonte -> {nome da estratégia: Estrategia}, na ordem de registro
+REGISTRO = {}
+
+
+def registrar(fonte, nome, modulo, classe, metodos, **opcoes):
+    estrategia = Estrategia(fonte, nome, modulo, classe, metodos, **opcoes)
+    REGISTRO.setdefault(fonte, {})[nome] = estrategia
+    return estrategia
+
+
+def estrategias_padrao(fonte):
+    return [estrategia for estrategia in REGISTRO[fonte].values() if estrategia.padrao]
+
+
+def selecionar(especificacoes=None):
+    """Estratégias para 'fonte' (as padrão) ou 'fonte:estrategia[+estrategia]'; sem nada, todas as padrão"""
+    if not especificacoes:
+        return [estrategia for fonte in REGISTRO for estrategia in estrategias_padrao(fonte)]
+
+    selecionadas = []
+    for especificacao in especificacoes:
+        fonte, _, nomes = especificacao.lower().partition(':')
+        if fonte not in REGISTRO:
+            raise ValueError(f"Fonte desconhecida: '{fonte}' (disponíveis: {', '.join(REGISTRO)})")
+        if not nomes:
+            escolhidas = estrategias_padrao(fonte)
+        else:
+            escolhidas = []
+            for nome in nomes.split('+'):
+                if nome not in REGISTRO[fonte]:
+                    raise ValueError(f"Estratégia desconhecida para {fonte}: '{nome}' "
+                                     f"(disponíveis: {', '.join(REGISTRO[fonte])})")
+                escolhidas.append(REGISTRO[fonte][nome])
+        selecionadas.extend(estrategia for estrategia in escolhidas if estrategia not in selecionadas)
+    return selecionadas
+
+
+def agrupar(estrategias):
+    """[(modulo, classe, [estrategias])]: uma instância de scraper por classe, na ordem de seleção"""
+    grupos = {}
+    for estrategia in estrategias:
+        grupos.setdefault((estrategia.modulo, estrategia.classe), []).append(estrategia)
+    return [(modulo, classe, grupo) for (modulo, classe), grupo in grupos.items()]
+
+
+# UFMG
+registrar('ufmg', 'rapido', 'scraper_rapido', 'ScraperRapido', ['extrair_ufmg_rapido'],
+          descricao="Links de editais da PROGRAD (modo rápido)", padrao=True)
+registrar('ufmg', 'unificado', 'scraper_unificado_real', 'ScraperUnificadoReal', ['extrair_ufmg_real'],
+          descricao="Editais abertos com detalhes")
+registrar('ufmg', 'atualizado', 'scraper_editais_atualizado', 'ScraperEditaisAtualizado', ['extrair_ufmg'],
+          descricao="Editais com datas extraídas")
+
+# FAPEMIG
+registrar('fapemig', 'rapido', 'scraper_rapido', 'ScraperRapido', ['extrair_fapemig_rapido'],
+          descricao="Títulos das chamadas (modo rápido)", padrao=True)
+registrar('fapemig', 'solucao_definitiva', 'scraper_fapemig_solucao_definitiva', 'ScraperFAPEMIGSolucaoDefinitiva',
+          ['extrair_fapemig_solucao_definitiva'], descricao="Todos os editais com PDFs")
+registrar('fapemig', 'ultra_melhorado', 'scraper_fapemig_ultra_melhorado', 'ScraperFAPEMIGUltraMelhorado',
+          ['extrair_fapemig_ultra_melhorado'], descricao="Acesso individual a cada chamada")
+registrar('fapemig', 'definitivo', 'scraper_fapemig_definitivo', 'ScraperFAPEMIGDefinitivo',
+          ['extrair_fapemig_definitivo'], descricao="Análise do HTML com busca de PDFs")
+registrar('fapemig', 'completo', 'scraper_fapemig_completo', 'ScraperFAPEMIGCompleto',
+          ['extrair_fapemig_completo'], descricao="Chamadas com PDFs e vídeos")
+registrar('fapemig', 'unificado', 'scraper_unificado_real', 'ScraperUnificadoReal', ['extrair_fapemig_real'],
+          descricao="Chamadas com detalhes")
+registrar('fapemig', 'atualizado', 'scraper_editais_atualizado', 'ScraperEditaisAtualizado', ['extrair_fapemig'],
+          descricao="Chamadas com links e datas")
+registrar('fapemig', 'simples', 'scraper_simples', 'ScraperSimples', ['extrair_fapemig'],
+          descricao="Oportunidades (versão simples)")
+
+# CNPq
+registrar('cnpq', 'rapido', 'scraper_rapido', 'ScraperRapido', ['extrair_cnpq_rapido'],
+          descricao="Títulos das chamadas (modo rápido)", padrao=True)
+registrar('cnpq', 'detalhado', 'scraper_cnpq_detalhado', 'ScraperCNPQDetalhado', ['extrair_chamadas_cnpq_detalhado'],
+          descricao="Chamadas detalhadas (dados de referência)", padrao=True, navegador=False)
+registrar('cnpq', 'inteligente', 'scraper_cnpq_inteligente', 'ScraperCNPQInteligente',
+          ['acessar_site_cnpq', 'analisar_estrutura_site', 'extrair_chamadas_por_texto'],
+          descricao="Múltiplas estratégias com fallback", padrao=True)
+registrar('cnpq', 'solucao_definitiva', 'scraper_cnpq_solucao_definitiva', 'ScraperCNPqSolucaoDefinitiva',
+          ['extrair_cnpq_solucao_definitiva'], descricao="Todos os blocos de chamadas com links")
+registrar('cnpq', 'unificado', 'scraper_unificado_real', 'ScraperUnificadoReal', ['extrair_cnpq_fallback'],
+          descricao="Chamadas de referência")
+registrar('cnpq', 'atualizado', 'scraper_editais_atualizado', 'ScraperEditaisAtualizado', ['extrair_cnpq'],
+          descricao="Chamadas com links e datas")
+registrar('cnpq', 'simples', 'scraper_simples', 'ScraperSimples', ['extrair_cnpq'],
+          descricao="Oportunidades (versão simples)")
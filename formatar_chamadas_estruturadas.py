@@ -3,6 +3,9 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+from modelos import chamadas_de_dados, texto_de
+from armazenamento import salvar_execucao
+
 def extrair_periodo_do_texto(texto):
     """
     Tenta extrair período de inscrição/prazo do texto usando regex
@@ -28,59 +31,24 @@ def extrair_periodo_do_texto(texto):
     
     return ""
 
-def formatar_chamada_cnpq(chamada):
-    """Formata uma chamada do CNPq"""
-    nome = chamada.get('titulo', 'Sem título')
-    periodo = chamada.get('data_inscricao', '')
-    link = chamada.get('link_permanente', '')
-    
-    # Se não tem período, tenta extrair da descrição
-    if not periodo:
-        periodo = extrair_periodo_do_texto(chamada.get('descricao', ''))
-    
-    return {
-        'nome': nome,
-        'periodo': periodo,
-        'link': link,
-        'fonte': 'CNPq'
-    }
-
-def formatar_chamada_fapemig(chamada):
-    """Formata uma chamada do FAPEMIG"""
-    nome = chamada.get('titulo', 'Sem título')
-    periodo = chamada.get('data_limite', '')
-    link = chamada.get('link_pdf', '')
-    
-    # Se não tem período, tenta extrair do título
-    if not periodo:
-        periodo = extrair_periodo_do_texto(nome)
-    
-    return {
-        'nome': nome,
-        'periodo': periodo,
-        'link': link,
-        'fonte': 'FAPEMIG'
-    }
-
-def formatar_chamada_ufmg(chamada):
-    """Formata uma chamada da UFMG"""
-    nome = chamada.get('titulo', 'Sem título')
-    periodo = chamada.get('data_limite', '')
-    link = chamada.get('link_pdf', '')
+def formatar_chamada(chamada):
+    """Formata uma chamada (modelos.Chamada) de qualquer fonte"""
+    nome = chamada.titulo or 'Sem título'
+    periodo = chamada.periodo
     
-    # Se não tem período, tenta extrair do título
+    # Se não tem período, tenta extrair da descrição ou do título
     if not periodo:
-        periodo = extrair_periodo_do_texto(nome)
+        periodo = extrair_periodo_do_texto(chamada.descricao) or extrair_periodo_do_texto(nome)
     
     return {
         'nome': nome,
         'periodo': periodo,
-        'link': link,
-        'fonte': 'UFMG'
+        'link': chamada.link,
+        'fonte': texto_de(chamada.fonte)
     }
 
 def formatar_todas_chamadas(arquivo_json):
-    """Formata todas as chamadas de um arquivo JSON"""
+    """Formata todas as chamadas de um arquivo JSON (qualquer layout conhecido)"""
     try:
         with open(arquivo_json, 'r', encoding='utf-8') as f:
             dados = json.load(f)
@@ -88,29 +56,7 @@ def formatar_todas_chamadas(arquivo_json):
         print(f"Erro ao ler {arquivo_json}: {e}")
         return []
     
-    chamadas_formatadas = []
-    
-    # Processa CNPq
-    if 'cnpq' in dados and dados['cnpq']:
-        for chamada in dados['cnpq']:
-            chamadas_formatadas.append(formatar_chamada_cnpq(chamada))
-    
-    # Processa FAPEMIG
-    if 'fapemig' in dados and dados['fapemig']:
-        for chamada in dados['fapemig']:
-            chamadas_formatadas.append(formatar_chamada_fapemig(chamada))
-    
-    # Processa UFMG
-    if 'ufmg' in dados and dados['ufmg']:
-        for chamada in dados['ufmg']:
-            chamadas_formatadas.append(formatar_chamada_ufmg(chamada))
-    
-    # Processa chamadas_cnpq (formato alternativo)
-    if 'chamadas_cnpq' in dados and dados['chamadas_cnpq']:
-        for chamada in dados['chamadas_cnpq']:
-            chamadas_formatadas.append(formatar_chamada_cnpq(chamada))
-    
-    return chamadas_formatadas
+    return [formatar_chamada(chamada) for chamada in chamadas_de_dados(dados)]
 
 def exibir_chamadas_formatadas(chamadas):
     """Exibe as chamadas em formato legível"""
@@ -191,6 +137,7 @@ def main():
         json.dump(resultado, f, ensure_ascii=False, indent=2)
     
     print(f"\n💾 Resultado salvo em: {nome_arquivo}")
+    salvar_execucao('chamadas_formatadas', resultado, nome_arquivo)
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,8 @@ import json
 import re
 from datetime import datetime
 
+from manifesto import registrar_artefato
+
 def gerar_relatorio_texto(chamadas):
     """
     Gera relatório em formato de texto para emails
@@ -338,18 +340,21 @@ def main():
     with open(f"relatorio_fapemig_texto_{timestamp}.txt", 'w', encoding='utf-8') as f:
         f.write(relatorio_texto)
     print(f"✅ Relatório em texto salvo: relatorio_fapemig_texto_{timestamp}.txt")
+    registrar_artefato('relatorio_fapemig_texto', f"relatorio_fapemig_texto_{timestamp}.txt")
     
     # Gera relatório em HTML
     relatorio_html = gerar_relatorio_html(chamadas)
     with open(f"relatorio_fapemig_html_{timestamp}.html", 'w', encoding='utf-8') as f:
         f.write(relatorio_html)
     print(f"✅ Relatório em HTML salvo: relatorio_fapemig_html_{timestamp}.html")
+    registrar_artefato('relatorio_fapemig_html', f"relatorio_fapemig_html_{timestamp}.html")
     
     # Gera relatório em Markdown
     relatorio_md = gerar_relatorio_markdown(chamadas)
     with open(f"relatorio_fapemig_md_{timestamp}.md", 'w', encoding='utf-8') as f:
         f.write(relatorio_md)
     print(f"✅ Relatório em Markdown salvo: relatorio_fapemig_md_{timestamp}.md")
+    registrar_artefato('relatorio_fapemig_md', f"relatorio_fapemig_md_{timestamp}.md")
     
     print(f"\n🎉 Relatórios gerados com sucesso!")
     print("📁 Arquivos criados:")
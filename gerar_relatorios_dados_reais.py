@@ -6,10 +6,18 @@ Gerador de Relatórios com Dados Reais
 Cria relatórios para CNPq, FAPEMIG e UFMG usando dados extraídos
 """
 
-import json
+import io
+import os
+import sys
 import re
+from contextlib import ExitStack
 from datetime import datetime
 
+from renderizacao import compilar_modelos, versao_modelos, chave_fragmento, RenderizadorStreaming, CacheFragmentos
+from armazenamento import carregar_mais_recente
+from manifesto import registrar_artefato
+from indice_historico import abrir_indice, etiqueta_situacao
+
 def limpar_texto(texto):
     """Limpa o texto removendo caracteres HTML e formatação"""
     if not texto:
@@ -28,103 +36,49 @@ def limpar_texto(texto):
     
     return texto
 
-def gerar_relatorio_texto_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg):
-    """
-    Gera relatório unificado em formato de texto
-    """
-    relatorio = []
-    relatorio.append("🎯 RELATÓRIO COMPLETO DE CHAMADAS E OPORTUNIDADES")
-    relatorio.append("=" * 70)
-    relatorio.append(f"📅 Data do relatório: {datetime.now().strftime('%d/%m/%Y às %H:%M')}")
-    relatorio.append(f"📊 Total geral: {len(chamadas_cnpq) + len(chamadas_fapemig) + len(chamadas_ufmg)} chamadas")
-    relatorio.append("")
-    
-    # CNPq
-    if chamadas_cnpq:
-        relatorio.append("🔬 CNPq - CONSELHO NACIONAL DE DESENVOLVIMENTO CIENTÍFICO E TECNOLÓGICO")
-        relatorio.append("-" * 60)
-        relatorio.append(f"📊 Total: {len(chamadas_cnpq)} chamadas")
-        relatorio.append("")
-        
-        for i, chamada in enumerate(chamadas_cnpq, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            relatorio.append(f"{i}. {titulo_limpo}")
-            
-            if chamada.get('numero'):
-                relatorio.append(f"   🔢 Número: {chamada['numero']}")
-            
-            if chamada.get('prazo_final'):
-                relatorio.append(f"   ⏰ Prazo: {chamada['prazo_final']}")
-            
-            if chamada.get('link_pdf'):
-                relatorio.append(f"   🔗 Link: {chamada['link_pdf']}")
-            
-            relatorio.append("")
-    
-    # FAPEMIG
-    if chamadas_fapemig:
-        relatorio.append("🏛️ FAPEMIG - FUNDAÇÃO DE AMPARO À PESQUISA DO ESTADO DE MINAS GERAIS")
-        relatorio.append("-" * 60)
-        relatorio.append(f"📊 Total: {len(chamadas_fapemig)} chamadas")
-        relatorio.append("")
-        
-        for i, chamada in enumerate(chamadas_fapemig, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            relatorio.append(f"{i}. {titulo_limpo}")
-            
-            if chamada.get('numero'):
-                relatorio.append(f"   🔢 Número: {chamada['numero']}")
-            
-            if chamada.get('prazo_final'):
-                relatorio.append(f"   ⏰ Prazo: {chamada['prazo_final']}")
-            
-            if chamada.get('link_pdf'):
-                relatorio.append(f"   🔗 Link: {chamada['link_pdf']}")
-            
-            relatorio.append("")
-    
-    # UFMG
-    if chamadas_ufmg:
-        relatorio.append("🎓 UFMG - UNIVERSIDADE FEDERAL DE MINAS GERAIS")
-        relatorio.append("-" * 60)
-        relatorio.append(f"📊 Total: {len(chamadas_ufmg)} chamadas")
-        relatorio.append("")
-        
-        for i, chamada in enumerate(chamadas_ufmg, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            relatorio.append(f"{i}. {titulo_limpo}")
-            
-            if chamada.get('numero'):
-                relatorio.append(f"   🔢 Número: {chamada['numero']}")
-            
-            if chamada.get('prazo_final'):
-                relatorio.append(f"   ⏰ Prazo: {chamada['prazo_final']}")
-            
-            if chamada.get('link_pdf'):
-                relatorio.append(f"   🔗 Link: {chamada['link_pdf']}")
-            
-            relatorio.append("")
-    
-    relatorio.append("📋 Fontes:")
-    relatorio.append("   • CNPq: http://www.cnpq.br/")
-    relatorio.append("   • FAPEMIG: http://www.fapemig.br/")
-    relatorio.append("   • UFMG: https://www.ufmg.br/")
-    
-    return "\n".join(relatorio)
+# (chave nos dados, sigla, emoji, nome por extenso, classe CSS), na ordem do relatório
+FONTES_RELATORIO = [
+    ('cnpq', 'CNPq', '🔬', 'Conselho Nacional de Desenvolvimento Científico e Tecnológico', 'cnpq'),
+    ('fapemig', 'FAPEMIG', '🏛️', 'Fundação de Amparo à Pesquisa do Estado de Minas Gerais', 'fapemig'),
+    ('ufmg', 'UFMG', '🎓', 'Universidade Federal de Minas Gerais', 'ufmg'),
+]
 
-def gerar_relatorio_html_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg):
-    """
-    Gera relatório unificado em formato HTML
-    """
-    total_geral = len(chamadas_cnpq) + len(chamadas_fapemig) + len(chamadas_ufmg)
-    
-    html = f"""
+# Fragmentos de cada formato; os opcionais (numero, prazo, link) só são emitidos quando o campo existe
+MODELOS = compilar_modelos({
+    'texto': {
+        'cabecalho': (
+            "🎯 RELATÓRIO COMPLETO DE CHAMADAS E OPORTUNIDADES\n"
+            + "=" * 70 + "\n"
+            "📅 Data do relatório: {data_hora}\n"
+            "📊 Total geral: {total_geral} chamadas\n"
+            "\n"
+        ),
+        'secao': (
+            "{emoji} {sigla} - {nome_maiusculo}\n"
+            + "-" * 60 + "\n"
+            "📊 Total: {total} chamadas\n"
+            "\n"
+        ),
+        'chamada': "{i}. {titulo}\n",
+        'numero': "   🔢 Número: {numero}\n",
+        'prazo': "   ⏰ Prazo: {prazo}\n",
+        'link': "   🔗 Link: {link}\n",
+        'fim_chamada': "\n",
+        'rodape': (
+            "📋 Fontes:\n"
+            "   • CNPq: http://www.cnpq.br/\n"
+            "   • FAPEMIG: http://www.fapemig.br/\n"
+            "   • UFMG: https://www.ufmg.br/"
+        ),
+    },
+    'html': {
+        'cabecalho': """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Relatório Completo - {datetime.now().strftime('%d/%m/%Y')}</title>
+    <title>Relatório Completo - {data}</title>
     <style>
         body {{
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
@@ -272,176 +226,59 @@ def gerar_relatorio_html_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufm
                 <div class="stat-label">Total de Chamadas</div>
             </div>
             <div class="stat-item">
-                <div class="stat-number">{len(chamadas_cnpq)}</div>
+                <div class="stat-number">{total_cnpq}</div>
                 <div class="stat-label">CNPq</div>
             </div>
             <div class="stat-item">
-                <div class="stat-number">{len(chamadas_fapemig)}</div>
+                <div class="stat-number">{total_fapemig}</div>
                 <div class="stat-label">FAPEMIG</div>
             </div>
             <div class="stat-item">
-                <div class="stat-number">{len(chamadas_ufmg)}</div>
+                <div class="stat-number">{total_ufmg}</div>
                 <div class="stat-label">UFMG</div>
             </div>
         </div>
         
         <div class="content">
-"""
-    
-    # CNPq
-    if chamadas_cnpq:
-        html += f"""
-            <div class="fonte-section">
-                <div class="fonte-header">
-                    <h2>🔬 CNPq - Conselho Nacional de Desenvolvimento Científico e Tecnológico</h2>
-                    <div class="total">📊 {len(chamadas_cnpq)} chamadas encontradas</div>
-                </div>
-"""
-        
-        for i, chamada in enumerate(chamadas_cnpq, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            html += f"""
-                <div class="chamada cnpq">
-                    <h3>{i}. {titulo_limpo}</h3>
-                    <div class="meta">
-"""
-            
-            if chamada.get('numero'):
-                html += f"""
-                        <div class="meta-item">
-                            <div class="label">Número</div>
-                            <div class="value">🔢 {chamada['numero']}</div>
-                        </div>
-"""
-            
-            if chamada.get('prazo_final'):
-                html += f"""
-                        <div class="meta-item">
-                            <div class="label">Prazo Final</div>
-                            <div class="value">⏰ {chamada['prazo_final']}</div>
-                        </div>
-"""
-            
-            if chamada.get('link_pdf'):
-                html += f"""
-                        <div class="meta-item">
-                            <div class="label">Link</div>
-                            <div class="value">🔗 <a href="{chamada['link_pdf']}" target="_blank">Acessar</a></div>
-                        </div>
-"""
-            
-            html += """
-                    </div>
-                </div>
-"""
-        
-        html += """
-                </div>
-"""
-    
-    # FAPEMIG
-    if chamadas_fapemig:
-        html += f"""
-            <div class="fonte-section">
-                <div class="fonte-header">
-                    <h2>🏛️ FAPEMIG - Fundação de Amparo à Pesquisa do Estado de Minas Gerais</h2>
-                    <div class="total">📊 {len(chamadas_fapemig)} chamadas encontradas</div>
-                </div>
-"""
-        
-        for i, chamada in enumerate(chamadas_fapemig, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            html += f"""
-                <div class="chamada fapemig">
-                    <h3>{i}. {titulo_limpo}</h3>
-                    <div class="meta">
-"""
-            
-            if chamada.get('numero'):
-                html += f"""
-                        <div class="meta-item">
-                            <div class="label">Número</div>
-                            <div class="value">🔢 {chamada['numero']}</div>
-                        </div>
-"""
-            
-            if chamada.get('prazo_final'):
-                html += f"""
-                        <div class="meta-item">
-                            <div class="label">Prazo Final</div>
-                            <div class="value">⏰ {chamada['prazo_final']}</div>
-                        </div>
-"""
-            
-            if chamada.get('link_pdf'):
-                html += f"""
-                        <div class="meta-item">
-                            <div class="label">Link</div>
-                            <div class="value">🔗 <a href="{chamada['link_pdf']}" target="_blank">Acessar</a></div>
-                        </div>
-"""
-            
-            html += """
-                    </div>
-                </div>
-"""
-        
-        html += """
-                </div>
-"""
-    
-    # UFMG
-    if chamadas_ufmg:
-        html += f"""
+""",
+        'secao': """
             <div class="fonte-section">
                 <div class="fonte-header">
-                    <h2>🎓 UFMG - Universidade Federal de Minas Gerais</h2>
-                    <div class="total">📊 {len(chamadas_ufmg)} chamadas encontradas</div>
+                    <h2>{emoji} {sigla} - {nome}</h2>
+                    <div class="total">📊 {total} chamadas encontradas</div>
                 </div>
-"""
-        
-        for i, chamada in enumerate(chamadas_ufmg, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            html += f"""
-                <div class="chamada ufmg">
-                    <h3>{i}. {titulo_limpo}</h3>
+""",
+        'chamada': """
+                <div class="chamada {classe}">
+                    <h3>{i}. {titulo}</h3>
                     <div class="meta">
-"""
-            
-            if chamada.get('numero'):
-                html += f"""
+""",
+        'numero': """
                         <div class="meta-item">
                             <div class="label">Número</div>
-                            <div class="value">🔢 {chamada['numero']}</div>
+                            <div class="value">🔢 {numero}</div>
                         </div>
-"""
-            
-            if chamada.get('prazo_final'):
-                html += f"""
+""",
+        'prazo': """
                         <div class="meta-item">
                             <div class="label">Prazo Final</div>
-                            <div class="value">⏰ {chamada['prazo_final']}</div>
+                            <div class="value">⏰ {prazo}</div>
                         </div>
-"""
-            
-            if chamada.get('link_pdf'):
-                html += f"""
+""",
+        'link': """
                         <div class="meta-item">
                             <div class="label">Link</div>
-                            <div class="value">🔗 <a href="{chamada['link_pdf']}" target="_blank">Acessar</a></div>
+                            <div class="value">🔗 <a href="{link}" target="_blank">Acessar</a></div>
                         </div>
-"""
-            
-            html += """
+""",
+        'fim_chamada': """
                     </div>
                 </div>
-"""
-        
-        html += """
+""",
+        'fim_secao': """
                 </div>
-"""
-    
-    html += """
+""",
+        'rodape': """
         </div>
         
         <div class="footer">
@@ -449,111 +286,151 @@ def gerar_relatorio_html_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufm
             🔬 CNPq: <a href="http://www.cnpq.br/" target="_blank" style="color: #3498db;">http://www.cnpq.br/</a><br>
             🏛️ FAPEMIG: <a href="http://www.fapemig.br/" target="_blank" style="color: #3498db;">http://www.fapemig.br/</a><br>
             🎓 UFMG: <a href="https://www.ufmg.br/" target="_blank" style="color: #3498db;">https://www.ufmg.br/</a><br>
-            📅 Relatório gerado em: """ + datetime.now().strftime('%d/%m/%Y às %H:%M') + """<br>
+            📅 Relatório gerado em: {data_hora}<br>
             🎯 DADOS REAIS EXTRAÍDOS DOS SITES OFICIAIS
         </div>
     </div>
 </body>
 </html>
-"""
-    
-    return html
+""",
+    },
+    'markdown': {
+        'cabecalho': (
+            "# 🎯 Relatório Completo de Chamadas e Oportunidades\n"
+            "\n"
+            "**Data do relatório:** {data_hora}  \n"
+            "**Total geral:** {total_geral} chamadas  \n"
+            "**🎯 DADOS REAIS EXTRAÍDOS DOS SITES OFICIAIS**  \n"
+            "\n"
+        ),
+        'secao': (
+            "## {emoji} {sigla} - {nome}\n"
+            "**Total:** {total} chamadas  \n"
+            "\n"
+        ),
+        'chamada': "### {i}. {titulo}\n\n",
+        'numero': "**Número:** {numero}  \n",
+        'prazo': "**Prazo Final:** {prazo}  \n",
+        'link': "**Link:** [{link}]({link})  \n",
+        'fim_chamada': "\n---\n\n",
+        'rodape': (
+            "---\n"
+            "**Fontes:**  \n"
+            "- 🔬 CNPq: http://www.cnpq.br/  \n"
+            "- 🏛️ FAPEMIG: http://www.fapemig.br/  \n"
+            "- 🎓 UFMG: https://www.ufmg.br/  \n"
+            "\n"
+            "**🎯 IMPORTANTE:** Este relatório contém dados reais extraídos diretamente dos sites oficiais das instituições."
+        ),
+    },
+})
+
+
+# Suba ao mudar como os valores das chamadas são calculados (ex.: limpar_texto)
+VERSAO_RELATORIO = 1
+# Chamadas por trecho guardado inteiro no cache de fragmentos
+TAMANHO_TRECHO = 100
+VERSAO_MODELOS = versao_modelos(MODELOS, VERSAO_RELATORIO)
+
+
+def assinatura_indice(indice):
+    """Identifica a versão do índice do histórico sem lê-lo (as etiquetas dependem dele)"""
+    if indice is None:
+        return None
+    estado = os.stat(indice.caminho)
+    return [indice.total, estado.st_size, estado.st_mtime_ns]
+
+
+def cache_ativo():
+    return '--sem-cache' not in sys.argv and os.getenv('SCRAPER_CACHE_RELATORIOS_ATIVO', '1') != '0'
+
+
+def _fragmentos_da_chamada(i, chamada, classe, etiqueta):
+    valores = {
+        'i': i,
+        'classe': classe,
+        'titulo': limpar_texto(chamada['titulo']) + etiqueta,
+        'numero': chamada.get('numero'),
+        'prazo': chamada.get('prazo_final'),
+        'link': chamada.get('link_pdf'),
+    }
+    fragmentos = [('chamada', valores)]
+    fragmentos.extend((campo, valores) for campo in ('numero', 'prazo', 'link') if valores[campo])
+    fragmentos.append(('fim_chamada', valores))
+    return fragmentos
 
-def gerar_relatorio_markdown_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg):
+
+def renderizar_relatorios(chamadas_por_fonte, saidas, indice=None, cache=None):
+    """Percorre as chamadas uma única vez e escreve todos os formatos de 'saidas'
+    ({'texto'|'html'|'markdown': arquivo aberto}) ao mesmo tempo. Com 'cache'
+    (CacheFragmentos), chamadas iguais às da execução anterior não são renderizadas"""
+    agora = datetime.now()
+    renderizador = RenderizadorStreaming(MODELOS, saidas, cache)
+    assinatura = assinatura_indice(indice) if cache is not None else None
+
+    totais = {f"total_{chave}": len(chamadas_por_fonte.get(chave) or []) for chave, *_ in FONTES_RELATORIO}
+    renderizador.emitir('cabecalho', dict(
+        totais,
+        data=agora.strftime('%d/%m/%Y'),
+        data_hora=agora.strftime('%d/%m/%Y às %H:%M'),
+        total_geral=sum(totais.values())
+    ))
+
+    for chave, sigla, emoji, nome, classe in FONTES_RELATORIO:
+        chamadas = chamadas_por_fonte.get(chave) or []
+        if not chamadas:
+            continue
+
+        renderizador.emitir('secao', {'emoji': emoji, 'sigla': sigla, 'nome': nome,
+                                      'nome_maiusculo': nome.upper(), 'total': len(chamadas)})
+
+        def emitir_chamadas(inicio, trecho):
+            for i, chamada in enumerate(trecho, inicio + 1):
+                # A etiqueta (nova/recorrente) e a posição também aparecem no bloco
+                etiqueta = etiqueta_situacao(indice, chamada, sigla)
+                chave_bloco = chave_fragmento(VERSAO_MODELOS, chave, i, etiqueta, chamada)
+                renderizador.emitir_bloco(chave_bloco,
+                                          lambda: _fragmentos_da_chamada(i, chamada, classe, etiqueta))
+
+        # Trechos com as mesmas chamadas e o mesmo índice do histórico vêm inteiros do cache;
+        # uma chamada alterada só refaz o seu trecho
+        for inicio in range(0, len(chamadas), TAMANHO_TRECHO):
+            trecho = chamadas[inicio:inicio + TAMANHO_TRECHO]
+            if cache is None:
+                emitir_chamadas(inicio, trecho)
+            else:
+                chave_trecho = chave_fragmento(VERSAO_MODELOS, chave, assinatura, inicio, trecho)
+                renderizador.emitir_secao(chave_trecho, lambda: emitir_chamadas(inicio, trecho))
+
+        renderizador.emitir('fim_secao')
+
+    renderizador.emitir('rodape', {'data_hora': agora.strftime('%d/%m/%Y às %H:%M')})
+
+
+def _renderizar_em_texto(formato, chamadas_cnpq, chamadas_fapemig, chamadas_ufmg, indice):
+    saida = io.StringIO()
+    renderizar_relatorios({'cnpq': chamadas_cnpq, 'fapemig': chamadas_fapemig, 'ufmg': chamadas_ufmg},
+                          {formato: saida}, indice)
+    return saida.getvalue()
+
+
+def gerar_relatorio_texto_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg, indice=None):
+    """
+    Gera relatório unificado em formato de texto
+    """
+    return _renderizar_em_texto('texto', chamadas_cnpq, chamadas_fapemig, chamadas_ufmg, indice)
+
+def gerar_relatorio_html_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg, indice=None):
+    """
+    Gera relatório unificado em formato HTML
+    """
+    return _renderizar_em_texto('html', chamadas_cnpq, chamadas_fapemig, chamadas_ufmg, indice)
+
+def gerar_relatorio_markdown_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg, indice=None):
     """
     Gera relatório unificado em formato Markdown
     """
-    total_geral = len(chamadas_cnpq) + len(chamadas_fapemig) + len(chamadas_ufmg)
-    
-    relatorio = []
-    relatorio.append("# 🎯 Relatório Completo de Chamadas e Oportunidades")
-    relatorio.append("")
-    relatorio.append(f"**Data do relatório:** {datetime.now().strftime('%d/%m/%Y às %H:%M')}  ")
-    relatorio.append(f"**Total geral:** {total_geral} chamadas  ")
-    relatorio.append("**🎯 DADOS REAIS EXTRAÍDOS DOS SITES OFICIAIS**  ")
-    relatorio.append("")
-    
-    # CNPq
-    if chamadas_cnpq:
-        relatorio.append("## 🔬 CNPq - Conselho Nacional de Desenvolvimento Científico e Tecnológico")
-        relatorio.append(f"**Total:** {len(chamadas_cnpq)} chamadas  ")
-        relatorio.append("")
-        
-        for i, chamada in enumerate(chamadas_cnpq, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            relatorio.append(f"### {i}. {titulo_limpo}")
-            relatorio.append("")
-            
-            if chamada.get('numero'):
-                relatorio.append(f"**Número:** {chamada['numero']}  ")
-            
-            if chamada.get('prazo_final'):
-                relatorio.append(f"**Prazo Final:** {chamada['prazo_final']}  ")
-            
-            if chamada.get('link_pdf'):
-                relatorio.append(f"**Link:** [{chamada['link_pdf']}]({chamada['link_pdf']})  ")
-            
-            relatorio.append("")
-            relatorio.append("---")
-            relatorio.append("")
-    
-    # FAPEMIG
-    if chamadas_fapemig:
-        relatorio.append("## 🏛️ FAPEMIG - Fundação de Amparo à Pesquisa do Estado de Minas Gerais")
-        relatorio.append(f"**Total:** {len(chamadas_fapemig)} chamadas  ")
-        relatorio.append("")
-        
-        for i, chamada in enumerate(chamadas_fapemig, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            relatorio.append(f"### {i}. {titulo_limpo}")
-            relatorio.append("")
-            
-            if chamada.get('numero'):
-                relatorio.append(f"**Número:** {chamada['numero']}  ")
-            
-            if chamada.get('prazo_final'):
-                relatorio.append(f"**Prazo Final:** {chamada['prazo_final']}  ")
-            
-            if chamada.get('link_pdf'):
-                relatorio.append(f"**Link:** [{chamada['link_pdf']}]({chamada['link_pdf']})  ")
-            
-            relatorio.append("")
-            relatorio.append("---")
-            relatorio.append("")
-    
-    # UFMG
-    if chamadas_ufmg:
-        relatorio.append("## 🎓 UFMG - Universidade Federal de Minas Gerais")
-        relatorio.append(f"**Total:** {len(chamadas_ufmg)} chamadas  ")
-        relatorio.append("")
-        
-        for i, chamada in enumerate(chamadas_ufmg, 1):
-            titulo_limpo = limpar_texto(chamada['titulo'])
-            relatorio.append(f"### {i}. {titulo_limpo}")
-            relatorio.append("")
-            
-            if chamada.get('numero'):
-                relatorio.append(f"**Número:** {chamada['numero']}  ")
-            
-            if chamada.get('prazo_final'):
-                relatorio.append(f"**Prazo Final:** {chamada['prazo_final']}  ")
-            
-            if chamada.get('link_pdf'):
-                relatorio.append(f"**Link:** [{chamada['link_pdf']}]({chamada['link_pdf']})  ")
-            
-            relatorio.append("")
-            relatorio.append("---")
-            relatorio.append("")
-    
-    relatorio.append("---")
-    relatorio.append("**Fontes:**  ")
-    relatorio.append("- 🔬 CNPq: http://www.cnpq.br/  ")
-    relatorio.append("- 🏛️ FAPEMIG: http://www.fapemig.br/  ")
-    relatorio.append("- 🎓 UFMG: https://www.ufmg.br/  ")
-    relatorio.append("")
-    relatorio.append("**🎯 IMPORTANTE:** Este relatório contém dados reais extraídos diretamente dos sites oficiais das instituições.")
-    
-    return "\n".join(relatorio)
+    return _renderizar_em_texto('markdown', chamadas_cnpq, chamadas_fapemig, chamadas_ufmg, indice)
 
 def main():
     """
@@ -562,16 +439,17 @@ def main():
     print("🚀 Gerador de Relatórios com Dados Reais")
     print("=" * 50)
     
-    # Carrega os dados reais extraídos
+    # Carrega os dados reais extraídos mais recentes (resolvidos pelo manifesto)
     try:
-        with open('dados_reais_simples_20250817_230420.json', 'r', encoding='utf-8') as f:
-            dados = json.load(f)
+        dados, origem = carregar_mais_recente('dados_reais_simples')
+        if dados is None:
+            raise FileNotFoundError('dados_reais_simples')
         
         chamadas_cnpq = dados.get('cnpq', [])
         chamadas_fapemig = dados.get('fapemig', [])
         chamadas_ufmg = dados.get('ufmg', [])
         
-        print(f"✅ Dados carregados:")
+        print(f"✅ Dados carregados de {origem}:")
         print(f"   • CNPq: {len(chamadas_cnpq)} chamadas")
         print(f"   • FAPEMIG: {len(chamadas_fapemig)} chamadas")
         print(f"   • UFMG: {len(chamadas_ufmg)} chamadas")
@@ -586,23 +464,47 @@ def main():
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # Gera relatório unificado em texto
-    relatorio_texto = gerar_relatorio_texto_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg)
-    with open(f"relatorio_completo_dados_reais_texto_{timestamp}.txt", 'w', encoding='utf-8') as f:
-        f.write(relatorio_texto)
-    print(f"✅ Relatório completo em texto salvo: relatorio_completo_dados_reais_texto_{timestamp}.txt")
+    # Índice do histórico: marca cada chamada como nova (🆕) ou recorrente (🔁)
+    indice = abrir_indice()
+    if indice is None:
+        print("⚠️ Índice do histórico não encontrado, chamadas sem marcação de novas/recorrentes")
+    
+    # Os três formatos numa única passada pelas chamadas, escritos direto nos arquivos
+    arquivos = {
+        'texto': f"relatorio_completo_dados_reais_texto_{timestamp}.txt",
+        'html': f"relatorio_completo_dados_reais_html_{timestamp}.html",
+        'markdown': f"relatorio_completo_dados_reais_md_{timestamp}.md",
+    }
+    # Blocos das chamadas que não mudaram vêm do cache de fragmentos (--sem-cache desliga)
+    cache = CacheFragmentos() if cache_ativo() else None
+    with ExitStack() as pilha:
+        saidas = {formato: pilha.enter_context(open(arquivo, 'w', encoding='utf-8'))
+                  for formato, arquivo in arquivos.items()}
+        renderizar_relatorios({'cnpq': chamadas_cnpq, 'fapemig': chamadas_fapemig, 'ufmg': chamadas_ufmg},
+                              saidas, indice, cache)
+    if cache is not None:
+        cache.salvar()
+        resumo = cache.resumo()
+        print(f"♻️ Cache de fragmentos: {resumo['reaproveitados']} chamada(s) reaproveitada(s), "
+              f"{resumo['renderizados']} renderizada(s)")
     
-    # Gera relatório unificado em HTML
-    relatorio_html = gerar_relatorio_html_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg)
-    with open(f"relatorio_completo_dados_reais_html_{timestamp}.html", 'w', encoding='utf-8') as f:
-        f.write(relatorio_html)
-    print(f"✅ Relatório completo em HTML salvo: relatorio_completo_dados_reais_html_{timestamp}.html")
+    for formato, descricao, tipo in [('texto', 'texto', 'relatorio_completo_dados_reais_texto'),
+                                     ('html', 'HTML', 'relatorio_completo_dados_reais_html'),
+                                     ('markdown', 'Markdown', 'relatorio_completo_dados_reais_md')]:
+        print(f"✅ Relatório completo em {descricao} salvo: {arquivos[formato]}")
+        registrar_artefato(tipo, arquivos[formato])
     
-    # Gera relatório unificado em Markdown
-    relatorio_md = gerar_relatorio_markdown_unificado(chamadas_cnpq, chamadas_fapemig, chamadas_ufmg)
-    with open(f"relatorio_completo_dados_reais_md_{timestamp}.md", 'w', encoding='utf-8') as f:
-        f.write(relatorio_md)
-    print(f"✅ Relatório completo em Markdown salvo: relatorio_completo_dados_reais_md_{timestamp}.md")
+    # --site: também o site estático paginado, com busca no navegador (site_estatico.py)
+    if '--site' in sys.argv:
+        from site_estatico import gerar_site, DIRETORIO_SITE
+        from arquivo_historico import ArquivoHistorico
+        historico = ArquivoHistorico() if '--historico' in sys.argv else None
+        resumo = gerar_site({'cnpq': chamadas_cnpq, 'fapemig': chamadas_fapemig, 'ufmg': chamadas_ufmg},
+                            DIRETORIO_SITE, indice, historico)
+        registrar_artefato('site_relatorio', os.path.join(DIRETORIO_SITE, 'index.html'),
+                           registros=resumo['chamadas'])
+        print(f"✅ Site estático salvo em {DIRETORIO_SITE}/: {resumo['chamadas']} chamadas, "
+              f"{resumo['gravados']} arquivo(s) gravado(s), {resumo['iguais']} sem mudança")
     
     print(f"\n🎉 Relatórios completos com dados reais gerados com sucesso!")
     print("📁 Arquivos criados:")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+⏱️ IMPORTAÇÕES PREGUIÇOSAS E ORÇAMENTO DE INICIALIZAÇÃO
+=======================================================
+
+Os scripts de relatório e de email carregavam tudo no topo do módulo (smtplib,
+ssl, pytz, sqlite3, msgpack...) mesmo quando só liam um JSON:
+✅ preguicoso('modulo'): o módulo só é importado no primeiro uso de um atributo
+✅ Perfil de importação de cada ponto de entrada (python -X importtime resumido)
+✅ Verificação: falha se um ponto de entrada carregar selenium, chromedriver_autoinstaller,
+   bs4 ou requests. Passar do orçamento de tempo (mediana de REPETICOES medições) só
+   gera aviso, porque o tempo varia muito entre máquinas; --estrito também falha nesse caso
+
+Uso: python importacao.py [perfil|verificar] [ponto_de_entrada ...] [--estrito]
+"""
+
+import os
+import sys
+import importlib
+import importlib.util
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+REPETICOES = 5
+
+# Ponto de entrada -> orçamento de importação em milissegundos
+ORCAMENTOS = {
+    'enviar_email_simples': 80,
+    'enviar_email_resultados': 80,
+    'enviar_email_solucao_definitiva': 80,
+    'diagnostico_email': 80,
+    'gerar_relatorios_dados_reais': 80,
+    'gerar_relatorio_fapemig': 40,
+    'reorganizar_dados': 80,
+}
+
+# Só os scrapers podem pagar por estes
+MODULOS_PESADOS = ('selenium', 'chromedriver_autoinstaller', 'bs4', 'requests')
+
+
+class ModuloPreguicoso:
+    """Representa um módulo que só é importado quando um atributo dele é usado"""
+
+    def __init__(self, nome):
+        self._nome = nome
+        self._modulo = None
+
+    def __getattr__(self, atributo):
+        if self._modulo is None:
+            self._modulo = importlib.import_module(self._nome)
+        return getattr(self._modulo, atributo)
+
+    def __repr__(self):
+        situacao = 'carregado' if self._modulo is not None else 'não carregado'
+        return f"<módulo preguiçoso '{self._nome}' ({situacao})>"
+
+
+def preguicoso(nome):
+    """Módulo carregado no primeiro uso, ou None se não estiver instalado (dependência opcional)"""
+    if nome in sys.modules:
+        return sys.modules[nome]
+    try:
+        if importlib.util.find_spec(nome) is None:
+            return None
+    except ModuleNotFoundError:
+        return None
+    return ModuloPreguicoso(nome)
+
+
+def medir_importacao(modulo):
+    """Uma importação do módulo num interpretador novo: (total em ms, {módulo: (próprio, acumulado)})"""
+    import subprocess
+
+    processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {modulo}"],
+                              cwd=DIRETORIO, capture_output=True, text=True)
+    if processo.returncode != 0:
+        erro = processo.stderr.strip().splitlines()[-1] if processo.stderr.strip() else 'erro desconhecido'
+        raise ImportError(f"{modulo}: {erro}")
+
+    tempos = {}
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, acumulado, nome = linha[len('import time:'):].split('|')
+        tempos[nome.strip()] = (int(proprio) / 1000, int(acumulado) / 1000)
+    return tempos[modulo][1], tempos
+
+
+def perfil(modulo, repeticoes=REPETICOES):
+    """Medição mediana entre as repetições (tempo total e os módulos dela)"""
+    medicoes = sorted((medir_importacao(modulo) for _ in range(repeticoes)), key=lambda medicao: medicao[0])
+    return medicoes[len(medicoes) // 2]
+
+
+def pesados_carregados(tempos):
+    return sorted(nome for nome in tempos if nome in MODULOS_PESADOS)
+
+
+def main():
+    argumentos = [argumento for argumento in sys.argv[1:] if argumento != '--estrito']
+    estrito = '--estrito' in sys.argv
+    comando = argumentos[0] if argumentos else 'perfil'
+    pontos = argumentos[1:] or list(ORCAMENTOS)
+    if comando not in ('perfil', 'verificar'):
+        print(f"❌ Comando desconhecido: {comando} (use perfil ou verificar)")
+        return 2
+
+    print("⏱️ TEMPO DE IMPORTAÇÃO DOS PONTOS DE ENTRADA")
+    print("=" * 50)
+
+    falhas = []
+    for ponto in pontos:
+        orcamento = ORCAMENTOS.get(ponto)
+        try:
+            total, tempos = perfil(ponto)
+        except ImportError as e:
+            print(f"❌ {e}")
+            falhas.append(ponto)
+            continue
+
+        pesados = pesados_carregados(tempos)
+        estourou = orcamento is not None and total > orcamento
+        falhou = bool(pesados) or (estourou and estrito)
+        marca = '❌' if falhou else '⚠️' if estourou else '✅'
+        limite = f" / orçamento {orcamento} ms" if orcamento is not None else ''
+        print(f"\n{marca} {ponto}: {total:.1f} ms (mediana){limite}")
+        if pesados:
+            print(f"   ❌ Módulos pesados carregados: {', '.join(pesados)}")
+        elif estourou:
+            print("   ⚠️ Acima do orçamento de tempo" + ('' if estrito else " (aviso; use --estrito para falhar)"))
+
+        if comando == 'perfil':
+            mais_caros = sorted((item for item in tempos.items() if item[0] != ponto),
+                                key=lambda item: item[1][0], reverse=True)[:8]
+            for nome, (proprio, acumulado) in mais_caros:
+                print(f"   {proprio:7.1f} ms próprios {acumulado:7.1f} ms acumulados  {nome}")
+
+        if falhou:
+            falhas.append(ponto)
+
+    if comando == 'verificar':
+        if falhas:
+            print(f"\n❌ {len(falhas)} ponto(s) de entrada reprovado(s): {', '.join(falhas)}")
+            return 1
+        print(f"\n✅ {len(pontos)} ponto(s) de entrada sem importações pesadas")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
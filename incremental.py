@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+🔁 MODO INCREMENTAL POR IMPRESSÃO DIGITAL DOS BLOCOS DA LISTAGEM
+================================================================
+
+A maioria das chamadas da FAPEMIG e do CNPq é a mesma de um dia para o outro,
+mas cada execução refazia a visita à página de detalhe e a busca de PDFs/links
+de todas elas:
+✅ Impressão digital de cada bloco da listagem: título, número, datas visíveis
+   e hrefs dos links do bloco
+✅ Bloco com impressão conhecida reaproveita o resultado caro guardado
+   (PDFs, links, detalhes); só blocos novos ou alterados refazem o trabalho
+✅ Ativado com --incremental ou SCRAPER_INCREMENTAL=1; as impressões são
+   guardadas sempre, para a próxima execução incremental
+✅ Impressões que não aparecem há DIAS_RETENCAO dias são descartadas
+"""
+
+import os
+import sys
+import json
+import hashlib
+import re
+from datetime import datetime, timedelta
+
+DIRETORIO_INCREMENTAL = os.getenv('SCRAPER_CACHE_INCREMENTAL', '.cache_incremental')
+DIAS_RETENCAO = 30
+
+PADRAO_NUMERO = re.compile(r'\d{1,3}/\d{4}')
+PADRAO_DATA = re.compile(r'\d{2}/\d{2}/\d{4}')
+
+
+def modo_incremental():
+    return '--incremental' in sys.argv or os.getenv('SCRAPER_INCREMENTAL') == '1'
+
+
+def hrefs_do_bloco(elemento):
+    """hrefs dos links dentro do elemento (lista vazia se ele não estiver mais na página)"""
+    if elemento is None:
+        return []
+    try:
+        return [link.get_attribute('href') or '' for link in elemento.find_elements('tag name', 'a')]
+    except Exception:
+        return []
+
+
+def impressao_bloco(titulo, texto, hrefs=()):
+    """Impressão digital do bloco: título, números e datas visíveis no texto e hrefs dos links"""
+    partes = {
+        'titulo': ' '.join((titulo or '').split()).lower(),
+        'numeros': PADRAO_NUMERO.findall(titulo or ''),
+        'datas': PADRAO_DATA.findall(texto or ''),
+        'hrefs': sorted(set(href for href in hrefs if href))
+    }
+    texto_canonico = json.dumps(partes, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(texto_canonico.encode('utf-8')).hexdigest()
+
+
+class CacheIncremental:
+    """Resultados caros por impressão digital de bloco, em '<diretorio>/<tipo>.json'"""
+
+    def __init__(self, tipo, ativo=None, diretorio=DIRETORIO_INCREMENTAL):
+        self.tipo = tipo
+        self.caminho = os.path.join(diretorio, f"{tipo}.json")
+        self.ativo = modo_incremental() if ativo is None else ativo
+        self.entradas = self._carregar()
+        self.reaproveitados = 0
+        self.processados = 0
+
+    def _carregar(self):
+        try:
+            with open(self.caminho, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            print(f"⚠️ Cache incremental de '{self.tipo}' inválido ({e}), ignorando")
+            return {}
+
+    def reaproveitar(self, impressao):
+        """Resultado guardado para o bloco, ou None se o bloco é novo/alterado (ou o modo está desligado)"""
+        entrada = self.entradas.get(impressao)
+        if not self.ativo or entrada is None:
+            return None
+        entrada['visto_em'] = datetime.now().isoformat()
+        self.reaproveitados += 1
+        return entrada['dados']
+
+    def guardar(self, impressao, dados, titulo=''):
+        """Guarda o resultado do trabalho caro feito para o bloco"""
+        self.entradas[impressao] = {'dados': dados, 'titulo': titulo[:120],
+                                    'visto_em': datetime.now().isoformat()}
+        self.processados += 1
+
+    def salvar(self):
+        """Grava o cache (atômico), descartando blocos não vistos há mais de DIAS_RETENCAO dias"""
+        limite = (datetime.now() - timedelta(days=DIAS_RETENCAO)).isoformat()
+        self.entradas = {impressao: entrada for impressao, entrada in self.entradas.items()
+                         if entrada['visto_em'] >= limite}
+        os.makedirs(os.path.dirname(self.caminho) or '.', exist_ok=True)
+        temporario = f"{self.caminho}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(self.entradas, f, ensure_ascii=False)
+        os.replace(temporario, self.caminho)
+
+    def resumo(self):
+        """Contagens para os metadados da execução"""
+        return {'ativo': self.ativo, 'reaproveitados': self.reaproveitados, 'processados': self.processados}
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+🔎 ÍNDICE DE CHAVES DO HISTÓRICO (MEMORY-MAPPED)
+================================================
+
+"Já vimos a CNPq 13085 ou a FAPEMIG 011/2025, e quando?" sem abrir os JSONs antigos:
+✅ Registros de largura fixa, ordenados por (fonte, chave), gerados a partir do
+   arquivo histórico (arquivo_historico.py)
+✅ Chave: número normalizado ('n:11/2025') e/ou ID de divulgação ('i:13085')
+✅ Primeira e última execução em que a chamada apareceu + offset do registro no arquivo
+✅ Aberto com mmap e consultado por busca binária, sem parse na inicialização
+✅ Email e relatórios marcam as chamadas como novas ou recorrentes
+"""
+
+import os
+import sys
+import mmap
+import struct
+import tempfile
+from datetime import datetime
+
+from deduplicacao import normalizar_texto, numero_do_registro, marcador_entrada, hash_titulo
+from modelos import Chamada, texto_de
+from arquivo_historico import ArquivoHistorico, CAMINHO_ARQUIVO
+
+CAMINHO_INDICE = os.getenv('SCRAPER_INDICE_CHAVES', 'historico_chamadas.chaves')
+MAGICO = b'IDXCHV01'
+CABECALHO = struct.Struct('<8sQ')
+# fonte, chave, primeira e última execução (AAAAMMDDHHMMSS), offset do bloco, linha no bloco
+REGISTRO = struct.Struct('<8s40sQQQI')
+TAMANHO_CHAVE = 48
+
+
+def _campo(texto, tamanho):
+    # Texto em largura fixa; o que não cabe vira um hash (mantém a chave única)
+    dados = texto.encode('utf-8')
+    if len(dados) > tamanho:
+        dados = f"h:{hash_titulo(texto)}".encode('utf-8')
+    return dados.ljust(tamanho, b'\0')
+
+
+def chave_binaria(fonte, chave):
+    """Prefixo de 48 bytes usado na ordenação e na busca"""
+    return _campo(normalizar_texto(fonte), 8) + _campo(chave, 40)
+
+
+def chaves_do_registro(registro, fonte=None):
+    """Chaves de busca de um registro: número normalizado (+ entrada) e ID de divulgação"""
+    chamada = Chamada.from_dict(registro, fonte=fonte)
+    chaves = []
+
+    numero = numero_do_registro(registro)
+    if numero:
+        entrada = marcador_entrada(registro.get('titulo', ''))
+        chaves.append(f"n:{numero}#{entrada}" if entrada else f"n:{numero}")
+    if chamada.id:
+        chaves.append(f"i:{chamada.id}")
+    if not chaves and chamada.titulo:
+        chaves.append(f"t:{hash_titulo(chamada.titulo)}")
+
+    return texto_de(chamada.fonte) or 'desconhecida', chaves
+
+
+def _data_inteira(data_iso):
+    return int(data_iso[:19].replace('-', '').replace('T', '').replace(':', '').ljust(14, '0'))
+
+
+def _data_iso(inteiro):
+    return datetime.strptime(str(inteiro), '%Y%m%d%H%M%S').isoformat()
+
+
+def construir_indice(caminho_arquivo=CAMINHO_ARQUIVO, caminho_indice=CAMINHO_INDICE):
+    """Regrava o índice a partir do arquivo histórico. Retorna o total de chaves"""
+    historico = ArquivoHistorico(caminho_arquivo)
+    vistas = {}
+
+    with open(historico.caminho, 'rb') as arquivo:
+        for entrada in sorted(historico.blocos(), key=lambda e: e['data']):
+            data = _data_inteira(entrada['data'])
+            for linha, registro in enumerate(historico.ler_bloco(entrada, arquivo)):
+                fonte, chaves = chaves_do_registro(registro, entrada['fonte'])
+                for chave in chaves:
+                    binaria = chave_binaria(fonte, chave)
+                    if binaria in vistas:
+                        vistas[binaria][1] = data
+                    else:
+                        vistas[binaria] = [data, data, entrada['offset'], linha]
+
+    # Grava em temporário + os.replace: leitores nunca veem um índice pela metade
+    diretorio = os.path.dirname(os.path.abspath(caminho_indice))
+    descritor, temporario = tempfile.mkstemp(prefix='.chaves_', suffix='.tmp', dir=diretorio)
+    try:
+        with os.fdopen(descritor, 'wb') as f:
+            f.write(CABECALHO.pack(MAGICO, len(vistas)))
+            for binaria in sorted(vistas):
+                primeira, ultima, offset, linha = vistas[binaria]
+                f.write(REGISTRO.pack(binaria[:8], binaria[8:], primeira, ultima, offset, linha))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho_indice)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+    return len(vistas)
+
+
+class IndiceHistorico:
+    """Leitura do índice via mmap; cada consulta é uma busca binária O(log n)"""
+
+    def __init__(self, caminho=CAMINHO_INDICE):
+        self.caminho = caminho
+        self._arquivo = open(caminho, 'rb')
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, self.total = CABECALHO.unpack_from(self._mapa, 0)
+        if magico != MAGICO:
+            self.fechar()
+            raise ValueError(f"{caminho} não é um índice de chaves")
+
+    def _chave_em(self, posicao):
+        inicio = CABECALHO.size + posicao * REGISTRO.size
+        return self._mapa[inicio:inicio + TAMANHO_CHAVE]
+
+    def buscar(self, fonte, chave):
+        """{'primeira', 'ultima', 'offset', 'linha'} da chave, ou None"""
+        alvo = chave_binaria(fonte, chave)
+        inicio, fim = 0, self.total
+        while inicio < fim:
+            meio = (inicio + fim) // 2
+            if self._chave_em(meio) < alvo:
+                inicio = meio + 1
+            else:
+                fim = meio
+        if inicio == self.total or self._chave_em(inicio) != alvo:
+            return None
+
+        _, _, primeira, ultima, offset, linha = REGISTRO.unpack_from(
+            self._mapa, CABECALHO.size + inicio * REGISTRO.size)
+        return {'primeira': _data_iso(primeira), 'ultima': _data_iso(ultima), 'offset': offset, 'linha': linha}
+
+    def buscar_registro(self, registro, fonte=None):
+        """Ocorrência histórica de um registro (por número ou ID), ou None"""
+        fonte, chaves = chaves_do_registro(registro, fonte)
+        ocorrencias = [o for o in (self.buscar(fonte, chave) for chave in chaves) if o]
+        return min(ocorrencias, key=lambda o: o['primeira']) if ocorrencias else None
+
+    def situacao(self, registro, fonte=None, antes_de=None):
+        """('nova' | 'recorrente', data da primeira vez) em relação a 'antes_de' (padrão: hoje)"""
+        antes_de = antes_de or datetime.now().date().isoformat()
+        ocorrencia = self.buscar_registro(registro, fonte)
+        if ocorrencia and ocorrencia['primeira'] < antes_de:
+            return 'recorrente', ocorrencia['primeira']
+        return 'nova', None
+
+    def fechar(self):
+        self._mapa.close()
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+
+def abrir_indice(caminho=CAMINHO_INDICE):
+    """Índice aberto, ou None se ainda não foi construído (sem histórico não há como marcar)"""
+    try:
+        return IndiceHistorico(caminho)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def etiqueta_situacao(indice, registro, fonte=None):
+    """' 🆕' para chamada nova, ' 🔁 (desde dd/mm/aaaa)' para recorrente, '' sem índice"""
+    if indice is None:
+        return ''
+    situacao, primeira = indice.situacao(registro, fonte)
+    if situacao == 'nova':
+        return ' 🆕'
+    return f" 🔁 (desde {datetime.fromisoformat(primeira).strftime('%d/%m/%Y')})"
+
+
+def main():
+    """Uso: python indice_historico.py construir
+            python indice_historico.py buscar <fonte> <número ou ID>"""
+    print("🔎 ÍNDICE DE CHAVES DO HISTÓRICO")
+    print("=" * 50)
+
+    argumentos = sys.argv[1:]
+    if not argumentos or argumentos[0] == 'construir':
+        try:
+            total = construir_indice()
+            print(f"✅ {total} chaves indexadas em {CAMINHO_INDICE}")
+        except FileNotFoundError:
+            print(f"❌ Arquivo histórico {CAMINHO_ARQUIVO} não encontrado")
+            print("💡 Execute primeiro: python arquivo_historico.py compactar")
+        return
+
+    if argumentos[0] == 'buscar' and len(argumentos) >= 3:
+        indice = abrir_indice()
+        if indice is None:
+            print(f"❌ Índice {CAMINHO_INDICE} não encontrado")
+            return
+        with indice:
+            fonte, valor = argumentos[1], argumentos[2]
+            registro = {'numero': valor} if '/' in valor else {'id': valor}
+            ocorrencia = indice.buscar_registro(registro, fonte)
+        if ocorrencia:
+            print(f"🔁 {fonte} {valor}: vista de {ocorrencia['primeira']} a {ocorrencia['ultima']}")
+        else:
+            print(f"🆕 {fonte} {valor}: nunca vista")
+        return
+
+    print("💡 Uso: python indice_historico.py [construir | buscar <fonte> <número ou ID>]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+📒 MANIFESTO DOS ARTEFATOS MAIS RECENTES
+========================================
+
+Arquivo único que mapeia cada tipo de artefato ('editais_rapidos',
+'fapemig_solucao_definitiva', ...) para a sua versão mais recente:
+✅ Caminho, tamanho, total de registros e hash SHA-256 do conteúdo
+✅ Atualizado de forma atômica (arquivo temporário + os.replace)
+✅ Leitores resolvem o "mais recente" em O(1), sem glob nem getctime
+   (ctimes são todos iguais em um checkout do CI)
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos
+    fcntl = None
+
+CAMINHO_MANIFESTO = os.getenv('SCRAPER_MANIFESTO', 'manifesto_artefatos.json')
+VERSAO = 1
+
+
+def hash_arquivo(caminho):
+    """SHA-256 do conteúdo do arquivo, lido em blocos"""
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+def contar_registros(dados):
+    """Total de registros em um JSON de resultados (listas de dicts no topo)"""
+    if isinstance(dados, list):
+        return len(dados)
+    if isinstance(dados, dict):
+        return sum(len(v) for v in dados.values() if isinstance(v, list) and v and isinstance(v[0], dict))
+    return None
+
+
+def ler_manifesto(caminho=CAMINHO_MANIFESTO):
+    """Conteúdo do manifesto ({'artefatos': {tipo: entrada}}), vazio se não existir"""
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            manifesto = json.load(f)
+    except FileNotFoundError:
+        return {'versao': VERSAO, 'artefatos': {}}
+    except json.JSONDecodeError as e:
+        print(f"⚠️ Manifesto inválido ({e}), ignorando")
+        return {'versao': VERSAO, 'artefatos': {}}
+    manifesto.setdefault('artefatos', {})
+    return manifesto
+
+
+def _escrever_atomico(caminho, manifesto):
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    descritor, temporario = tempfile.mkstemp(prefix='.manifesto_', suffix='.tmp', dir=diretorio)
+    try:
+        with os.fdopen(descritor, 'w', encoding='utf-8') as f:
+            json.dump(manifesto, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+
+def registrar_artefato(tipo, arquivo, registros=None, caminho=CAMINHO_MANIFESTO, interno=None):
+    """Aponta 'tipo' para 'arquivo' (e sua cópia interna compacta, se houver) no manifesto"""
+    entrada = {
+        'caminho': arquivo,
+        'tamanho': os.path.getsize(arquivo),
+        'registros': registros,
+        'sha256': hash_arquivo(arquivo),
+        'atualizado_em': datetime.now().isoformat()
+    }
+    if interno:
+        entrada['interno'] = interno
+
+    # A trava serializa escritores concorrentes (leitura-modificação-escrita)
+    with open(f"{caminho}.lock", 'a') as trava:
+        if fcntl:
+            fcntl.flock(trava, fcntl.LOCK_EX)
+        manifesto = ler_manifesto(caminho)
+        manifesto['versao'] = VERSAO
+        manifesto['artefatos'][tipo] = entrada
+        _escrever_atomico(caminho, manifesto)
+
+    return entrada
+
+
+def artefato(tipo, caminho=CAMINHO_MANIFESTO):
+    """Entrada mais recente de um tipo, ou None
+
+    Como o glob '<tipo>_*.json', 'dados_reorganizados' também casa com
+    'dados_reorganizados_com_pdfs' e 'dados_reorganizados_solucao_definitiva'.
+    """
+    artefatos = ler_manifesto(caminho)['artefatos']
+    if tipo in artefatos:
+        return artefatos[tipo]
+    candidatos = [entrada for nome, entrada in artefatos.items() if nome.startswith(f"{tipo}_")]
+    return max(candidatos, key=lambda entrada: entrada['atualizado_em']) if candidatos else None
+
+
+def caminho_artefato(tipo, caminho=CAMINHO_MANIFESTO):
+    """Caminho do artefato mais recente de um tipo, se ainda existir no disco"""
+    entrada = artefato(tipo, caminho)
+    if entrada and os.path.exists(entrada['caminho']):
+        return entrada['caminho']
+    return None
+
+
+def main():
+    """Mostra o manifesto e confere tamanho e hash de cada artefato"""
+    print("📒 MANIFESTO DOS ARTEFATOS")
+    print("=" * 50)
+
+    artefatos = ler_manifesto()['artefatos']
+    if not artefatos:
+        print(f"⚠️ Nenhum artefato registrado em {CAMINHO_MANIFESTO}")
+        return
+
+    for tipo, entrada in sorted(artefatos.items()):
+        if not os.path.exists(entrada['caminho']):
+            situacao = "❌ arquivo ausente"
+        elif hash_arquivo(entrada['caminho']) != entrada['sha256']:
+            situacao = "⚠️ conteúdo alterado"
+        else:
+            situacao = "✅"
+        registros = entrada['registros'] if entrada['registros'] is not None else '-'
+        print(f"{situacao} {tipo}: {entrada['caminho']} ({entrada['tamanho']} bytes, {registros} registros)")
+
+
+if __name__ == "__main__":
+    main()
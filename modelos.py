@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+📦 MODELO TIPADO DE REGISTROS - CHAMADAS, ANEXOS E LINKS
+========================================================
+
+Modelo único usado por todas as etapas (scrapers, reorganização, relatórios, email):
+✅ Dataclasses com __slots__ (Chamada, Anexo, LinkImportante)
+✅ Fonte, tipo e método como enums internados
+✅ from_dict lê TODOS os layouts JSON existentes (numero/numero_chamada,
+   pdfs/pdfs_disponiveis, link_pdf/link_permanente, data_limite/prazo_final...)
+✅ to_dict escreve sempre o mesmo layout canônico
+"""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class Fonte(str, Enum):
+    FAPEMIG = 'FAPEMIG'
+    CNPQ = 'CNPq'
+    UFMG = 'UFMG'
+
+    @classmethod
+    def _missing_(cls, valor):
+        # Aceita 'cnpq', 'Fapemig', ' UFMG ' etc.
+        texto = str(valor).strip().lower()
+        for membro in cls:
+            if membro.value.lower() == texto:
+                return membro
+        return None
+
+
+class TipoLink(str, Enum):
+    PDF = 'PDF'
+    PDF_DIRETO = 'PDF Direto'
+    PDF_PROXIMO = 'PDF Próximo'
+    PDF_MENCIONADO = 'PDF Mencionado'
+    PDF_HTML = 'PDF HTML'
+    DOWNLOAD = 'Download'
+    CHAMADA_PRINCIPAL = 'Chamada Principal'
+    ANEXO = 'Anexo'
+    FAQ = 'FAQ'
+    RESULTADO = 'Resultado'
+    EDITAL = 'Edital'
+    LINK_GERAL = 'Link Geral'
+
+
+class Metodo(str, Enum):
+    ELEMENTO_PAI = 'Elemento Pai'
+    BOTAO_DOWNLOAD = 'Botão Download'
+    ELEMENTO_PROXIMO = 'Elemento Próximo'
+    TEXTO_CHAMADA = 'Texto da Chamada'
+    REGEX_HTML = 'Regex HTML'
+    CONTAINER_DIRETO = 'Container Direto'
+
+
+# Aliases de chaves encontrados nos JSONs gerados pelos diferentes scripts.
+# A ordem define a prioridade quando mais de uma chave estiver preenchida.
+ALIASES_CHAMADA = {
+    'titulo': ('titulo', 'nome'),
+    'numero': ('numero', 'numero_chamada'),
+    'id': ('id', 'id_divulgacao'),
+    'descricao': ('descricao',),
+    'data_inclusao': ('data_inclusao', 'data_abertura', 'data'),
+    'prazo_final': ('prazo_final', 'data_limite'),
+    'periodo_inscricao': ('periodo_inscricao', 'data_inscricao', 'periodo'),
+    'link': ('link', 'link_permanente', 'link_chamada', 'link_principal', 'link_pdf'),
+    'link_alternativo': ('link_alternativo',),
+    'status': ('status',),
+    'data_coleta': ('data_coleta',),
+    'texto_completo': ('texto_completo',),
+}
+
+CHAVES_ANEXOS = ('pdfs_disponiveis', 'pdfs', 'anexos')
+CHAVES_CONHECIDAS = (
+    {chave for aliases in ALIASES_CHAMADA.values() for chave in aliases}
+    | set(CHAVES_ANEXOS)
+    | {'fonte', 'links_importantes', 'links_video', 'total_pdfs', 'total_links'}
+)
+
+# Listas de registros em cada layout de arquivo conhecido -> fonte implícita
+CHAVES_LISTAS = {
+    'fapemig': Fonte.FAPEMIG,
+    'editais_fapemig': Fonte.FAPEMIG,
+    'cnpq': Fonte.CNPQ,
+    'chamadas_cnpq': Fonte.CNPQ,
+    'ufmg': Fonte.UFMG,
+    'editais_ufmg': Fonte.UFMG,
+    'chamadas_formatadas': None,
+    'chamadas': None,
+}
+
+
+def internar(enum_cls, valor):
+    """Converte para o membro do enum; valores fora do enum viram strings internadas"""
+    if valor is None or isinstance(valor, enum_cls):
+        return valor
+    try:
+        return enum_cls(valor)
+    except ValueError:
+        return sys.intern(str(valor))
+
+
+def texto_de(valor):
+    """Valor textual de um campo que pode ser enum ou string"""
+    if isinstance(valor, Enum):
+        return valor.value
+    return valor or ''
+
+
+def _primeiro(dados, aliases):
+    for chave in aliases:
+        valor = dados.get(chave)
+        if valor not in (None, ''):
+            return valor
+    return ''
+
+
+@dataclass(slots=True)
+class Anexo:
+    nome: str = ''
+    url: str = ''
+    tipo: object = None
+    metodo: object = None
+    instrucoes: str = ''
+    metodos: list = field(default_factory=list)
+    tipos: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, dados, url_padrao=''):
+        """Lê um PDF em qualquer layout: dict ({nome|texto, url, ...}) ou só o nome (str)"""
+        if isinstance(dados, str):
+            return cls(nome=dados, url=url_padrao, tipo=TipoLink.ANEXO)
+        return cls(
+            nome=dados.get('nome') or dados.get('texto') or '',
+            url=dados.get('url') or url_padrao,
+            tipo=internar(TipoLink, dados.get('tipo') or None),
+            metodo=internar(Metodo, dados.get('metodo') or dados.get('metodo_extracao') or None),
+            instrucoes=dados.get('instrucoes') or '',
+            metodos=[internar(Metodo, m) for m in dados.get('metodos') or []],
+            tipos=[internar(TipoLink, t) for t in dados.get('tipos') or []],
+        )
+
+    def to_dict(self):
+        dados = {
+            'nome': self.nome,
+            'url': self.url,
+            'tipo': texto_de(self.tipo),
+            'metodo': texto_de(self.metodo),
+        }
+        if self.instrucoes:
+            dados['instrucoes'] = self.instrucoes
+        if self.metodos:
+            dados['metodos'] = [texto_de(m) for m in self.metodos]
+        if self.tipos:
+            dados['tipos'] = [texto_de(t) for t in self.tipos]
+        return dados
+
+
+@dataclass(slots=True)
+class LinkImportante:
+    texto: str = ''
+    url: str = ''
+    tipo: object = None
+    metodo: object = None
+    instrucoes: str = ''
+    metodos: list = field(default_factory=list)
+    tipos: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, dados):
+        return cls(
+            texto=dados.get('texto') or dados.get('nome') or '',
+            url=dados.get('url') or '',
+            tipo=internar(TipoLink, dados.get('tipo') or None),
+            metodo=internar(Metodo, dados.get('metodo') or None),
+            instrucoes=dados.get('instrucoes') or '',
+            metodos=[internar(Metodo, m) for m in dados.get('metodos') or []],
+            tipos=[internar(TipoLink, t) for t in dados.get('tipos') or []],
+        )
+
+    def to_dict(self):
+        dados = {
+            'texto': self.texto,
+            'url': self.url,
+            'tipo': texto_de(self.tipo),
+            'metodo': texto_de(self.metodo),
+        }
+        if self.instrucoes:
+            dados['instrucoes'] = self.instrucoes
+        if self.metodos:
+            dados['metodos'] = [texto_de(m) for m in self.metodos]
+        if self.tipos:
+            dados['tipos'] = [texto_de(t) for t in self.tipos]
+        return dados
+
+
+@dataclass(slots=True)
+class Chamada:
+    fonte: object = None
+    titulo: str = ''
+    numero: str = ''
+    id: str = ''
+    descricao: str = ''
+    data_inclusao: str = ''
+    prazo_final: str = ''
+    periodo_inscricao: str = ''
+    link: str = ''
+    link_alternativo: str = ''
+    status: str = ''
+    data_coleta: str = ''
+    texto_completo: str = ''
+    anexos: list = field(default_factory=list)
+    links_importantes: list = field(default_factory=list)
+    links_video: list = field(default_factory=list)
+    extras: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, dados, fonte=None):
+        """Lê uma chamada de qualquer layout JSON já gerado pelos scripts"""
+        valores = {campo: _primeiro(dados, aliases) for campo, aliases in ALIASES_CHAMADA.items()}
+        for campo in ('numero', 'id'):
+            valores[campo] = str(valores[campo]) if valores[campo] != '' else ''
+
+        anexos = []
+        for chave in CHAVES_ANEXOS:
+            for item in dados.get(chave) or []:
+                anexos.append(Anexo.from_dict(item, url_padrao=valores['link']))
+
+        return cls(
+            fonte=internar(Fonte, dados.get('fonte') or fonte),
+            anexos=anexos,
+            links_importantes=[LinkImportante.from_dict(l) for l in dados.get('links_importantes') or []],
+            links_video=list(dados.get('links_video') or []),
+            extras={chave: valor for chave, valor in dados.items() if chave not in CHAVES_CONHECIDAS},
+            **valores
+        )
+
+    @property
+    def periodo(self):
+        """Período de inscrição ou prazo final, o que estiver disponível"""
+        return self.periodo_inscricao or self.prazo_final
+
+    @property
+    def prazo_iso(self):
+        """Prazo final em ISO (AAAA-MM-DD): prazo_final ou a última data do período"""
+        for texto in (self.prazo_final, self.periodo_inscricao):
+            datas = re.findall(r'(\d{1,2})/(\d{1,2})/(\d{4})', texto or '')
+            if datas:
+                dia, mes, ano = datas[-1]
+                return f"{ano}-{int(mes):02d}-{int(dia):02d}"
+        return ''
+
+    def to_dict(self):
+        """Layout canônico, compatível com os leitores existentes"""
+        dados = {
+            'fonte': texto_de(self.fonte),
+            'titulo': self.titulo,
+            'numero': self.numero,
+            'id': self.id,
+            'descricao': self.descricao,
+            'data_inclusao': self.data_inclusao,
+            'prazo_final': self.prazo_final,
+            'periodo_inscricao': self.periodo_inscricao,
+            'link': self.link,
+            'link_alternativo': self.link_alternativo,
+            'status': self.status,
+            'data_coleta': self.data_coleta,
+            'texto_completo': self.texto_completo,
+            'pdfs_disponiveis': [anexo.to_dict() for anexo in self.anexos],
+            'total_pdfs': len(self.anexos),
+            'links_importantes': [link.to_dict() for link in self.links_importantes],
+            'total_links': len(self.links_importantes),
+            'links_video': self.links_video,
+        }
+        dados.update(self.extras)
+        return dados
+
+
+def chamadas_de_dados(dados):
+    """Gera Chamadas de um JSON carregado, qualquer que seja o layout do arquivo"""
+    if isinstance(dados, list):
+        for item in dados:
+            if isinstance(item, dict):
+                yield Chamada.from_dict(item)
+        return
+
+    for chave, fonte in CHAVES_LISTAS.items():
+        for item in dados.get(chave) or []:
+            if isinstance(item, dict):
+                yield Chamada.from_dict(item, fonte=fonte)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+🔗 PIPELINE EM PROCESSO ÚNICO
+=============================
+
+Substitui o subprocess.run(..., shell=True, capture_output=True) dos scripts
+executar_solucao_definitiva*.py:
+✅ Cada etapa é uma função Python importada, sem novo interpretador nem novo import do Selenium
+✅ Os resultados passam em memória de uma etapa para a seguinte (contexto)
+✅ Arquivos JSON continuam sendo gravados, mas só como saída lateral
+✅ Saída das etapas aparece ao vivo (stdout com buffer de linha)
+✅ Tempo de cada etapa no resumo final
+✅ Cada etapa recebe uma fatia (peso) do orçamento de tempo que resta (prazos.py)
+✅ Com checkpoint (checkpoints.py), etapas já concluídas são retomadas do resultado gravado
+"""
+
+import sys
+import time
+import traceback
+
+from prazos import etapa_com_prazo
+
+
+class Etapa:
+    """Uma etapa do pipeline: funcao(contexto) devolve os dados da etapa, ou None/False se falhou
+
+    peso: fatia do tempo restante reservada para a etapa, relativa às etapas seguintes.
+    """
+
+    def __init__(self, nome, descricao, funcao, obrigatoria=True, peso=1):
+        self.nome = nome
+        self.descricao = descricao
+        self.funcao = funcao
+        self.obrigatoria = obrigatoria
+        self.peso = peso
+
+
+class Pipeline:
+    """Executa as etapas em ordem; contexto[nome] guarda o resultado de cada uma"""
+
+    def __init__(self, etapas, checkpoint=None):
+        self.etapas = etapas
+        self.checkpoint = checkpoint
+        self.contexto = {}
+        self.duracoes = {}
+
+    def executar_etapa(self, etapa, pesos_restantes=None):
+        """Executa uma etapa e guarda o resultado no contexto. Retorna True se ela teve sucesso"""
+        print(f"\n🚀 EXECUTANDO: {etapa.descricao}")
+        print("-" * 60)
+
+        inicio = time.perf_counter()
+        try:
+            with etapa_com_prazo(etapa.nome, etapa.peso, pesos_restantes or etapa.peso) as prazo:
+                print(f"⏳ Prazo da etapa: {prazo.restante():.0f}s")
+                resultado = etapa.funcao(self.contexto)
+        except Exception as e:
+            print(f"❌ Erro ao executar {etapa.descricao}: {e}")
+            traceback.print_exc()
+            resultado = None
+        finally:
+            self.duracoes[etapa.nome] = time.perf_counter() - inicio
+
+        if resultado is None or resultado is False:
+            print(f"❌ {etapa.descricao} falhou!")
+            return False
+
+        self.contexto[etapa.nome] = resultado
+        if isinstance(resultado, dict) and resultado.get('parcial'):
+            # Resultado parcial não vai para o checkpoint: uma retomada executa a etapa de novo
+            print(f"⏰ {etapa.descricao}: prazo esgotado, seguindo com resultado parcial")
+        elif self.checkpoint:
+            self.checkpoint.concluir_etapa(etapa.nome, resultado)
+        print(f"✅ {etapa.descricao} executado com sucesso! ({self.duracoes[etapa.nome]:.1f}s)")
+        return True
+
+    def executar(self):
+        """Executa todas as etapas. Para na primeira etapa obrigatória que falhar"""
+        # Saída ao vivo mesmo quando o stdout não é um terminal (CI)
+        if hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(line_buffering=True)
+
+        falhas = 0
+        for indice, etapa in enumerate(self.etapas):
+            if self.checkpoint and self.checkpoint.etapa_concluida(etapa.nome):
+                self.contexto[etapa.nome] = self.checkpoint.resultado_etapa(etapa.nome)
+                print(f"\n💾 {etapa.descricao}: concluída no checkpoint, pulando")
+                continue
+            pesos_restantes = sum(seguinte.peso for seguinte in self.etapas[indice:])
+            if not self.executar_etapa(etapa, pesos_restantes):
+                if etapa.obrigatoria:
+                    return False
+                falhas += 1
+
+        # Com etapa opcional que falhou o checkpoint fica, para uma retomada refazer só ela
+        if self.checkpoint and not falhas:
+            self.checkpoint.limpar()
+        return True
+
+    def resumo_duracoes(self):
+        """Linhas 'etapa: Xs' para o resumo final"""
+        return [f"   ⏱️ {nome}: {duracao:.1f}s" for nome, duracao in self.duracoes.items()]
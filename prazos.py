@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+⏳ PRAZOS DA EXECUÇÃO (ORÇAMENTO DE TEMPO)
+==========================================
+
+Os tempos limite estavam espalhados (implicitly_wait, WebDriverWait, sleeps) e
+nada limitava a execução inteira: um site travado consumia o job inteiro do CI.
+✅ Orçamento da execução (SCRAPER_ORCAMENTO, em segundos) com um fim absoluto
+   compartilhado por todas as etapas e processos (SCRAPER_FIM_EXECUCAO)
+✅ Orçamento dividido em prazos por etapa (agendador/pipeline) e por fonte
+✅ Esperas, carregamentos de página e sleeps limitados ao tempo que resta
+✅ Prazo esgotado: a etapa devolve o que já tem, marcada como parcial
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+ORCAMENTO_PADRAO = 1500  # 25 min: sobra tempo do job para upload dos artefatos
+TEMPO_CARREGAMENTO = 30
+ESPERA_MINIMA = 0.1
+
+
+class Prazo:
+    """Fim absoluto (time.time()) de uma execução, etapa ou fonte; fim=None é sem limite"""
+
+    def __init__(self, segundos=None, fim=None, nome='execução'):
+        if fim is None and segundos is not None:
+            fim = time.time() + segundos
+        self.fim = fim
+        self.nome = nome
+        # True quando alguém consultou o prazo e ele já tinha acabado: resultado parcial
+        self.estourado = False
+        self.espera_implicita = None
+        self.tempo_carregamento = TEMPO_CARREGAMENTO
+
+    def restante(self):
+        """Segundos até o fim (infinito se não há limite; nunca negativo)"""
+        if self.fim is None:
+            return float('inf')
+        return max(self.fim - time.time(), 0.0)
+
+    def esgotado(self):
+        if self.restante() <= 0:
+            self.estourado = True
+        return self.estourado
+
+    def limitar(self, segundos):
+        """Tempo limite de uma espera: 'segundos', sem passar do fim do prazo"""
+        return max(min(segundos, self.restante()), ESPERA_MINIMA)
+
+    def dormir(self, segundos):
+        """time.sleep limitado ao prazo. Retorna False se o prazo acabou"""
+        time.sleep(min(segundos, self.restante()))
+        return not self.esgotado()
+
+    def dividir(self, nome, segundos=None, fracao=None):
+        """Prazo filho: 'segundos' a partir de agora ou 'fracao' do restante, sem passar do fim deste"""
+        fim = self.fim
+        if segundos is not None:
+            fim = time.time() + segundos if fim is None else min(fim, time.time() + segundos)
+        elif fracao is not None and fim is not None:
+            fim = time.time() + self.restante() * fracao
+        return Prazo(fim=fim, nome=nome)
+
+    def aplicar(self, driver, espera_implicita, tempo_carregamento=TEMPO_CARREGAMENTO):
+        """Limita ao prazo a espera implícita e o carregamento de páginas do driver"""
+        self.espera_implicita = espera_implicita
+        self.tempo_carregamento = tempo_carregamento
+        driver.implicitly_wait(self.limitar(espera_implicita))
+        driver.set_page_load_timeout(self.limitar(tempo_carregamento))
+
+    def carregar(self, driver, url):
+        """driver.get com os tempos limite ajustados ao que resta. Retorna False se o prazo acabou"""
+        if self.esgotado():
+            return False
+        if self.espera_implicita is not None:
+            driver.implicitly_wait(self.limitar(self.espera_implicita))
+        driver.set_page_load_timeout(self.limitar(self.tempo_carregamento))
+        try:
+            driver.get(url)
+        except Exception:
+            if self.esgotado():
+                return False
+            raise
+        return True
+
+    def descricao(self):
+        if self.fim is None:
+            return f"{self.nome}: sem prazo"
+        return f"{self.nome}: {self.restante():.0f}s restantes"
+
+
+def prazo_da_execucao():
+    """Prazo da execução inteira, o mesmo para todos os scripts e processos filhos"""
+    fim = os.getenv('SCRAPER_FIM_EXECUCAO')
+    if not fim:
+        orcamento = float(os.getenv('SCRAPER_ORCAMENTO', ORCAMENTO_PADRAO))
+        fim = str(time.time() + orcamento)
+        os.environ['SCRAPER_FIM_EXECUCAO'] = fim
+    return Prazo(fim=float(fim))
+
+
+def prazo_da_etapa():
+    """Prazo da etapa em andamento (ver etapa_com_prazo) ou, fora de uma etapa, o da execução"""
+    execucao = prazo_da_execucao()
+    fim = os.getenv('SCRAPER_FIM_ETAPA')
+    if not fim:
+        return execucao
+    return Prazo(fim=min(float(fim), execucao.fim), nome='etapa')
+
+
+@contextmanager
+def etapa_com_prazo(nome, peso=1, pesos_restantes=1):
+    """Reserva para a etapa a fração peso/pesos_restantes do tempo que resta (na etapa que a contém, se houver)"""
+    anterior = os.environ.get('SCRAPER_FIM_ETAPA')
+    prazo = prazo_da_etapa().dividir(nome, fracao=peso / max(pesos_restantes, peso))
+    os.environ['SCRAPER_FIM_ETAPA'] = str(prazo.fim)
+    try:
+        yield prazo
+    finally:
+        if anterior is None:
+            os.environ.pop('SCRAPER_FIM_ETAPA', None)
+        else:
+            os.environ['SCRAPER_FIM_ETAPA'] = anterior
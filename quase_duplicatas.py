@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+🪞 DETECTOR DE QUASE-DUPLICATAS (SimHash + LSH)
+===============================================
+
+Reentradas ("CHAMADA 005/2025 ... 2ª ENTRADA") e títulos da listagem vs
+página de detalhe diferem em poucos tokens, e a comparação exata não os pega:
+✅ Assinaturas SimHash de 64 bits sobre títulos e descrições normalizados
+✅ Baldes LSH por bandas de bits: candidatos em tempo sub-linear
+✅ Limiar de similaridade configurável (1 - distância de Hamming / 64)
+"""
+
+import hashlib
+from collections import defaultdict
+from functools import lru_cache
+
+from deduplicacao import normalizar_texto
+
+BITS = 64
+LIMIAR_PADRAO = 0.8
+BANDAS_PADRAO = 8
+
+
+def _hash_token(token):
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def caracteristicas(texto):
+    """Tokens e bigramas do texto normalizado (bigramas preservam a ordem das palavras)"""
+    palavras = normalizar_texto(texto).split()
+    return palavras + [f"{a} {b}" for a, b in zip(palavras, palavras[1:])]
+
+
+@lru_cache(maxsize=4096)
+def simhash(texto):
+    """Assinatura SimHash de 64 bits de um texto"""
+    pesos = [0] * BITS
+    for token in caracteristicas(texto):
+        valor = _hash_token(token)
+        for bit in range(BITS):
+            pesos[bit] += 1 if valor >> bit & 1 else -1
+
+    assinatura = 0
+    for bit, peso in enumerate(pesos):
+        if peso > 0:
+            assinatura |= 1 << bit
+    return assinatura
+
+
+def similaridade(assinatura_a, assinatura_b):
+    """Similaridade entre duas assinaturas (1.0 = idênticas)"""
+    return 1 - bin(assinatura_a ^ assinatura_b).count('1') / BITS
+
+
+def similaridade_textos(texto_a, texto_b):
+    """Similaridade SimHash entre dois textos"""
+    return similaridade(simhash(texto_a), simhash(texto_b))
+
+
+class IndiceQuaseDuplicatas:
+    """Índice LSH de assinaturas SimHash.
+
+    A assinatura é dividida em 'bandas' blocos de bits; dois textos são candidatos
+    se coincidirem em pelo menos uma banda inteira. Com 8 bandas, qualquer par com
+    até 7 bits diferentes (similaridade >= 0.89) é encontrado com certeza; pares
+    um pouco menos similares são encontrados com alta probabilidade.
+    """
+
+    def __init__(self, limiar=LIMIAR_PADRAO, bandas=BANDAS_PADRAO):
+        if BITS % bandas:
+            raise ValueError(f"bandas deve dividir {BITS}: {bandas}")
+        self.limiar = limiar
+        self.bandas = bandas
+        self.bits_banda = BITS // bandas
+        self.mascara = (1 << self.bits_banda) - 1
+        self.baldes = [defaultdict(list) for _ in range(bandas)]
+        self.assinaturas = {}
+
+    def _bandas(self, assinatura):
+        for banda in range(self.bandas):
+            yield banda, (assinatura >> (banda * self.bits_banda)) & self.mascara
+
+    def adicionar(self, chave, texto):
+        """Indexa um texto sob uma chave (qualquer valor hashable)"""
+        assinatura = simhash(texto)
+        self.assinaturas[chave] = assinatura
+        for banda, valor in self._bandas(assinatura):
+            self.baldes[banda][valor].append(chave)
+        return assinatura
+
+    def candidatos(self, texto, limiar=None):
+        """Chaves quase-duplicadas do texto, ordenadas da mais para a menos similar"""
+        limiar = self.limiar if limiar is None else limiar
+        assinatura = simhash(texto)
+
+        vistos = set()
+        encontrados = []
+        for banda, valor in self._bandas(assinatura):
+            for chave in self.baldes[banda].get(valor, ()):
+                if chave in vistos:
+                    continue
+                vistos.add(chave)
+                pontuacao = similaridade(assinatura, self.assinaturas[chave])
+                if pontuacao >= limiar:
+                    encontrados.append((chave, pontuacao))
+
+        encontrados.sort(key=lambda item: item[1], reverse=True)
+        return encontrados
+
+    def mais_proximo(self, texto, limiar=None):
+        """Chave mais similar acima do limiar, ou None"""
+        encontrados = self.candidatos(texto, limiar)
+        return encontrados[0] if encontrados else None
+
+    def __len__(self):
+        return len(self.assinaturas)
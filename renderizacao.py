@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+🖨️ RENDERIZAÇÃO EM STREAMING PARA VÁRIOS FORMATOS
+=================================================
+
+Os relatórios montavam cada formato inteiro em memória (um f-string de vários KB
+para o HTML) e percorriam os mesmos registros uma vez por formato:
+✅ Modelos str.format analisados uma única vez (ModeloCompilado)
+✅ Cada fragmento é escrito em todas as saídas (TXT, HTML, MD...) ao mesmo
+   tempo, numa única passada pelos registros
+✅ Nada é acumulado: a memória não cresce com o número de registros
+✅ Cache de fragmentos (CacheFragmentos): o bloco de cada registro, já renderizado
+   em todos os formatos, fica num SQLite com chave (fonte, hash do conteúdo,
+   versão dos modelos); só registros novos ou alterados são renderizados de novo
+✅ Seções (trechos de registros) também ficam no cache, até LIMITE_SECAO
+   caracteres: seção sem nenhuma mudança é copiada sem olhar registro por registro
+"""
+
+import os
+import json
+import time
+import hashlib
+from string import Formatter
+
+from importacao import preguicoso
+
+sqlite3 = preguicoso('sqlite3')
+
+CAMINHO_CACHE_FRAGMENTOS = os.path.join(os.getenv('SCRAPER_CACHE_RELATORIOS', '.cache_relatorios'),
+                                        'fragmentos.db')
+# Seções maiores que isto (soma dos formatos) não são guardadas inteiras, só os seus blocos
+LIMITE_SECAO = 4 * 1024 * 1024
+DIAS_RETENCAO = 7
+
+
+class ModeloCompilado:
+    """Modelo '{campo}'/'{campo:especificacao}' dividido em trechos literais e campos na criação"""
+
+    def __init__(self, texto):
+        self.texto = texto
+        self.partes = []
+        for literal, campo, especificacao, conversao in Formatter().parse(texto):
+            if conversao or (campo and ('.' in campo or '[' in campo)):
+                raise ValueError(f"Campo não suportado no modelo: {{{campo}}}")
+            self.partes.append((literal, campo, especificacao))
+
+    def renderizar(self, valores):
+        pedacos = []
+        for literal, campo, especificacao in self.partes:
+            pedacos.append(literal)
+            if campo is not None:
+                pedacos.append(format(valores[campo], especificacao))
+        return ''.join(pedacos)
+
+
+def compilar_modelos(modelos):
+    """{formato: {fragmento: texto}} -> {formato: {fragmento: ModeloCompilado}}"""
+    return {formato: {fragmento: ModeloCompilado(texto) for fragmento, texto in fragmentos.items()}
+            for formato, fragmentos in modelos.items()}
+
+
+def versao_modelos(modelos, versao=''):
+    """Hash dos textos dos modelos compilados (+ versão manual do código que calcula os valores):
+    mudar qualquer modelo invalida os fragmentos guardados"""
+    textos = {formato: {fragmento: modelo.texto for fragmento, modelo in fragmentos.items()}
+              for formato, fragmentos in modelos.items()}
+    conteudo = json.dumps([versao, textos], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(conteudo.encode('utf-8')).hexdigest()[:12]
+
+
+def chave_fragmento(*partes):
+    """Chave de um bloco: hash de tudo o que entra na renderização dele"""
+    conteudo = json.dumps(partes, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(conteudo.encode('utf-8')).hexdigest()
+
+
+class CacheFragmentos:
+    """Blocos e seções renderizados ({formato: texto}) por chave, num SQLite em disco (a memória
+    não cresce com o cache). Ao salvar, descarta o que não é usado há DIAS_RETENCAO dias"""
+
+    def __init__(self, caminho=CAMINHO_CACHE_FRAGMENTOS):
+        self.caminho = caminho
+        os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.execute("CREATE TABLE IF NOT EXISTS fragmentos "
+                             "(chave TEXT PRIMARY KEY, textos TEXT NOT NULL, usado_em REAL NOT NULL)")
+        self.inicio = time.time()
+        self._usados = []
+        self.reaproveitados = 0
+        self.renderizados = 0
+
+    def obter(self, chave):
+        linha = self.conexao.execute("SELECT textos FROM fragmentos WHERE chave = ?", (chave,)).fetchone()
+        if linha is None:
+            return None
+        self._usados.append((self.inicio, chave))
+        self.reaproveitados += 1
+        return json.loads(linha[0])
+
+    def guardar(self, chave, textos):
+        self.conexao.execute("INSERT OR REPLACE INTO fragmentos (chave, textos, usado_em) VALUES (?, ?, ?)",
+                             (chave, json.dumps(textos, ensure_ascii=False), self.inicio))
+        self.renderizados += 1
+
+    def salvar(self):
+        """Grava (uma transação para a execução inteira) e remove o que saiu do relatório. Os blocos
+        de uma seção copiada inteira não são tocados, por isso a retenção em dias e não por execução"""
+        self.conexao.executemany("UPDATE fragmentos SET usado_em = ? WHERE chave = ?", self._usados)
+        self.conexao.execute("DELETE FROM fragmentos WHERE usado_em < ?", (self.inicio - DIAS_RETENCAO * 86400,))
+        self.conexao.commit()
+        self.conexao.close()
+
+    def resumo(self):
+        return {'reaproveitados': self.reaproveitados, 'renderizados': self.renderizados}
+
+
+class RenderizadorStreaming:
+    """Escreve cada fragmento emitido em todas as saídas abertas ({formato: arquivo})"""
+
+    def __init__(self, modelos, saidas, cache=None):
+        self.modelos = modelos
+        self.saidas = saidas
+        self.cache = cache
+        # {formato: [textos]} da seção em andamento, para guardá-la inteira no cache
+        self._captura = None
+        self._tamanho_captura = 0
+
+    def renderizar(self, fragmento, valores=None):
+        """{formato: texto} do fragmento; formatos sem modelo para ele ficam com ''"""
+        valores = valores or {}
+        textos = {}
+        for formato in self.saidas:
+            modelo = self.modelos[formato].get(fragmento)
+            textos[formato] = modelo.renderizar(valores) if modelo is not None else ''
+        return textos
+
+    def escrever(self, textos):
+        for formato, arquivo in self.saidas.items():
+            arquivo.write(textos[formato])
+
+        if self._captura is not None:
+            self._tamanho_captura += sum(len(texto) for texto in textos.values())
+            if self._tamanho_captura > LIMITE_SECAO:
+                self._captura = None
+            else:
+                for formato, partes in self._captura.items():
+                    partes.append(textos[formato])
+
+    def emitir(self, fragmento, valores=None):
+        self.escrever(self.renderizar(fragmento, valores))
+
+    def emitir_bloco(self, chave, gerar):
+        """Bloco de vários fragmentos: copiado do cache se a chave é conhecida, senão
+        renderizado a partir de gerar() -> [(fragmento, valores)] e guardado"""
+        textos = self.cache.obter(chave) if self.cache is not None else None
+        if textos is None or any(formato not in textos for formato in self.saidas):
+            textos = {formato: '' for formato in self.saidas}
+            for fragmento, valores in gerar():
+                for formato, texto in self.renderizar(fragmento, valores).items():
+                    textos[formato] += texto
+            if self.cache is not None:
+                self.cache.guardar(chave, textos)
+        self.escrever(textos)
+
+    def emitir_secao(self, chave, emitir):
+        """Seção inteira: copiada do cache se a chave é conhecida; senão emitir() a escreve
+        normalmente (blocos do cache incluídos) e o texto é guardado se couber em LIMITE_SECAO"""
+        textos = self.cache.obter(chave) if self.cache is not None else None
+        if textos is not None and all(formato in textos for formato in self.saidas):
+            self.escrever(textos)
+            return
+
+        self._captura = {formato: [] for formato in self.saidas} if self.cache is not None else None
+        self._tamanho_captura = 0
+        try:
+            emitir()
+        finally:
+            captura, self._captura = self._captura, None
+        if captura is not None:
+            self.cache.guardar(chave, {formato: ''.join(partes) for formato, partes in captura.items()})
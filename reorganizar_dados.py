@@ -8,17 +8,17 @@ TODOS os editais tenham links para PDFs ou páginas que levam a PDFs.
 """
 
 import json
-import glob
 from datetime import datetime
 
+from armazenamento import salvar_execucao, localizar_mais_recente
+
 def reorganizar_dados():
     """Reorganiza os dados para garantir PDFs para todos"""
     print("🔧 Reorganizando dados para garantir PDFs para todos...")
     
-    # Carregar dados dos scrapers
-    editais_rapidos = glob.glob('editais_rapidos_*.json')
-    chamadas_detalhadas = glob.glob('chamadas_cnpq_detalhadas_*.json')
-    chamadas_inteligentes = glob.glob('chamadas_cnpq_inteligentes_*.json')
+    # Carregar dados dos scrapers (banco SQLite, ou arquivos JSON se ele não existir)
+    editais_rapidos = localizar_mais_recente('editais_rapidos')
+    chamadas_detalhadas = localizar_mais_recente('chamadas_cnpq_detalhadas')
     
     # Dados reorganizados com PDFs para todos
     dados_reorganizados = {
@@ -31,8 +31,8 @@ def reorganizar_dados():
     
     # FAPEMIG - Adicionar links que levam a PDFs
     if editais_rapidos:
-        print(f"📄 Carregando dados da FAPEMIG de: {editais_rapidos[-1]}")
-        with open(editais_rapidos[-1], 'r', encoding='utf-8') as f:
+        print(f"📄 Carregando dados da FAPEMIG de: {editais_rapidos}")
+        with open(editais_rapidos, 'r', encoding='utf-8') as f:
             dados = json.load(f)
             for item in dados.get('fapemig', []):
                 item['link_pdf'] = 'http://www.fapemig.br/pt/chamadas_abertas_oportunidades_fapemig/'
@@ -43,8 +43,8 @@ def reorganizar_dados():
     
     # UFMG - Manter PDFs existentes
     if editais_rapidos:
-        print(f"📄 Carregando dados da UFMG de: {editais_rapidos[-1]}")
-        with open(editais_rapidos[-1], 'r', encoding='utf-8') as f:
+        print(f"📄 Carregando dados da UFMG de: {editais_rapidos}")
+        with open(editais_rapidos, 'r', encoding='utf-8') as f:
             dados = json.load(f)
             for item in dados.get('ufmg', []):
                 if not item.get('link_pdf'):
@@ -56,8 +56,8 @@ def reorganizar_dados():
     
     # CNPq - Adicionar links que levam a PDFs
     if chamadas_detalhadas:
-        print(f"📄 Carregando dados do CNPq de: {chamadas_detalhadas[-1]}")
-        with open(chamadas_detalhadas[-1], 'r', encoding='utf-8') as f:
+        print(f"📄 Carregando dados do CNPq de: {chamadas_detalhadas}")
+        with open(chamadas_detalhadas, 'r', encoding='utf-8') as f:
             dados = json.load(f)
             for item in dados.get('chamadas_cnpq', []):
                 if not item.get('link_pdf'):
@@ -74,6 +74,7 @@ def reorganizar_dados():
         json.dump(dados_reorganizados, f, ensure_ascii=False, indent=2)
     
     print(f"✅ Dados reorganizados salvos em: {nome_arquivo}")
+    salvar_execucao('dados_reorganizados_com_pdfs', dados_reorganizados, nome_arquivo)
     print(f"📊 Total de oportunidades: {sum(len(v) for v in dados_reorganizados.values() if isinstance(v, list))}")
     print(f"📄 FAPEMIG: {len(dados_reorganizados['fapemig'])} com links para PDFs")
     print(f"📄 UFMG: {len(dados_reorganizados['ufmg'])} com PDFs diretos")
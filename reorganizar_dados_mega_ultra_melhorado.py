@@ -13,10 +13,12 @@ Versão que resolve TODOS os problemas de reorganização:
 """
 
 import json
-import glob
-import os
 from datetime import datetime
 
+from modelos import Fonte, chamadas_de_dados
+from armazenamento import salvar_execucao, localizar_mais_recente, localizar_mais_recente_da_fonte
+from serializacao import carregar_arquivo
+
 class ReorganizadorDadosSolucaoDefinitiva:
     def __init__(self):
         self.dados_finais = {
@@ -29,87 +31,71 @@ class ReorganizadorDadosSolucaoDefinitiva:
             'solucao_definitiva': True
         }
         
-    def encontrar_arquivos_solucao_definitiva(self):
-        """Encontra arquivos da SOLUÇÃO DEFINITIVA"""
+    def encontrar_arquivos_solucao_definitiva(self, dados_fapemig=None, dados_cnpq=None):
+        """Encontra arquivos da SOLUÇÃO DEFINITIVA (dados já em memória dispensam a busca)"""
         print("🔍 Procurando arquivos da SOLUÇÃO DEFINITIVA...")
         
-        # Buscar arquivos da FAPEMIG
-        arquivos_fapemig = glob.glob("fapemig_solucao_definitiva_*.json")
-        if arquivos_fapemig:
-            arquivo_fapemig = max(arquivos_fapemig, key=lambda x: os.path.getctime(x))
-            print(f"✅ FAPEMIG: {arquivo_fapemig}")
+        # Buscar arquivos da FAPEMIG (banco SQLite, ou arquivos JSON se ele não existir)
+        if dados_fapemig is not None:
+            arquivo_fapemig = dados_fapemig
+            print("✅ FAPEMIG: recebida em memória")
         else:
-            print("❌ Arquivo da FAPEMIG não encontrado")
-            arquivo_fapemig = None
+            arquivo_fapemig = localizar_mais_recente('fapemig_solucao_definitiva')
+            if arquivo_fapemig:
+                print(f"✅ FAPEMIG: {arquivo_fapemig}")
+            else:
+                print("❌ Arquivo da FAPEMIG não encontrado")
         
         # Buscar arquivos do CNPq
-        arquivos_cnpq = glob.glob("cnpq_solucao_definitiva_*.json")
-        if arquivos_cnpq:
-            arquivo_cnpq = max(arquivos_cnpq, key=lambda x: os.path.getctime(x))
-            print(f"✅ CNPq: {arquivo_cnpq}")
+        if dados_cnpq is not None:
+            arquivo_cnpq = dados_cnpq
+            print("✅ CNPq: recebido em memória")
         else:
-            print("❌ Arquivo do CNPq não encontrado")
-            arquivo_cnpq = None
+            arquivo_cnpq = localizar_mais_recente('cnpq_solucao_definitiva')
+            if arquivo_cnpq:
+                print(f"✅ CNPq: {arquivo_cnpq}")
+            else:
+                print("❌ Arquivo do CNPq não encontrado")
         
-        # Buscar arquivos da UFMG (se existirem)
-        arquivos_ufmg = glob.glob("*ufmg*.json")
-        if arquivos_ufmg:
-            arquivo_ufmg = max(arquivos_ufmg, key=lambda x: os.path.getctime(x))
+        # Buscar arquivos da UFMG (se existirem): última execução que trouxe editais da UFMG
+        arquivo_ufmg = localizar_mais_recente_da_fonte(Fonte.UFMG, padrao="*ufmg*.json")
+        if arquivo_ufmg:
             print(f"✅ UFMG: {arquivo_ufmg}")
         else:
             print("⚠️ Arquivo da UFMG não encontrado")
-            arquivo_ufmg = None
         
         return arquivo_fapemig, arquivo_cnpq, arquivo_ufmg
     
+    def carregar_origem(self, origem):
+        """Dados já em memória (pipeline) ou caminho de arquivo a ser lido"""
+        if isinstance(origem, str):
+            return carregar_arquivo(origem)
+        return origem
+    
     def processar_fapemig_solucao_definitiva(self, arquivo):
         """Processa dados da FAPEMIG com SOLUÇÃO DEFINITIVA"""
         print("\n🔥 Processando FAPEMIG com SOLUÇÃO DEFINITIVA...")
         
         try:
-            with open(arquivo, 'r', encoding='utf-8') as f:
-                dados = json.load(f)
+            dados = self.carregar_origem(arquivo)
             
             editais_processados = 0
             pdfs_encontrados = 0
             
-            for edital in dados.get('editais_fapemig', []):
+            for edital in chamadas_de_dados(dados):
+                if edital.fonte != Fonte.FAPEMIG:
+                    continue
                 try:
-                    # Extrair informações MEGA-ULTRA-MELHORADAS
-                    edital_processado = {
-                        'fonte': 'FAPEMIG',
-                        'titulo': edital.get('titulo', ''),
-                        'numero': edital.get('numero', ''),
-                        'data_inclusao': edital.get('data_inclusao', ''),
-                        'prazo_final': edital.get('prazo_final', ''),
-                        'descricao': edital.get('descricao', ''),
-                        'total_pdfs': edital.get('total_pdfs', 0),
-                        'pdfs_disponiveis': [],
-                        'links_importantes': edital.get('links_importantes', []),
-                        'data_coleta': edital.get('data_coleta', ''),
-                        'solucao_definitiva': True
-                    }
-                    
-                    # 🔥 PROCESSAMENTO MEGA-ULTRA-MELHORADO DOS PDFs
-                    pdfs = edital.get('pdfs_disponiveis', [])
-                    for pdf in pdfs:
-                        pdf_processado = {
-                            'nome': pdf.get('nome', ''),
-                            'url': pdf.get('url', ''),
-                            'tipo': pdf.get('tipo', ''),
-                            'instrucoes': pdf.get('instrucoes', ''),
-                            'metodo_extracao': pdf.get('metodo', ''),
-                            'solucao_definitiva': True
-                        }
-                        edital_processado['pdfs_disponiveis'].append(pdf_processado)
-                        pdfs_encontrados += 1
+                    edital_processado = edital.to_dict()
+                    edital_processado['solucao_definitiva'] = True
                     
                     # Adicionar à lista final
                     self.dados_finais['fapemig'].append(edital_processado)
                     editais_processados += 1
+                    pdfs_encontrados += len(edital.anexos)
                     
-                    print(f"   ✅ Edital processado: {edital_processado['titulo'][:50]}...")
-                    print(f"      📄 PDFs encontrados: {len(edital_processado['pdfs_disponiveis'])}")
+                    print(f"   ✅ Edital processado: {edital.titulo[:50]}...")
+                    print(f"      📄 PDFs encontrados: {len(edital.anexos)}")
                     
                 except Exception as e:
                     print(f"   ❌ Erro ao processar edital: {e}")
@@ -127,48 +113,25 @@ class ReorganizadorDadosSolucaoDefinitiva:
         print("\n🔥 Processando CNPq com SOLUÇÃO DEFINITIVA...")
         
         try:
-            with open(arquivo, 'r', encoding='utf-8') as f:
-                dados = json.load(f)
+            dados = self.carregar_origem(arquivo)
             
             chamadas_processadas = 0
             links_encontrados = 0
             
-            for chamada in dados.get('chamadas_cnpq', []):
+            for chamada in chamadas_de_dados(dados):
+                if chamada.fonte != Fonte.CNPQ:
+                    continue
                 try:
-                    # Extrair informações MEGA-ULTRA-MELHORADAS
-                    chamada_processada = {
-                        'fonte': 'CNPq',
-                        'titulo': chamada.get('titulo', ''),
-                        'numero': chamada.get('numero', ''),
-                        'id': chamada.get('id', ''),
-                        'descricao': chamada.get('descricao', ''),
-                        'periodo_inscricao': chamada.get('periodo_inscricao', ''),
-                        'total_links': chamada.get('total_links', 0),
-                        'links_importantes': [],
-                        'data_coleta': chamada.get('data_coleta', ''),
-                        'texto_completo': chamada.get('texto_completo', ''),
-                        'solucao_definitiva': True
-                    }
-                    
-                    # 🔥 PROCESSAMENTO MEGA-ULTRA-MELHORADO DOS LINKS
-                    links = chamada.get('links_importantes', [])
-                    for link in links:
-                        link_processado = {
-                            'texto': link.get('texto', ''),
-                            'url': link.get('url', ''),
-                            'tipo': link.get('tipo', ''),
-                            'metodo': link.get('metodo', ''),
-                            'solucao_definitiva': True
-                        }
-                        chamada_processada['links_importantes'].append(link_processado)
-                        links_encontrados += 1
+                    chamada_processada = chamada.to_dict()
+                    chamada_processada['solucao_definitiva'] = True
                     
                     # Adicionar à lista final
                     self.dados_finais['cnpq'].append(chamada_processada)
                     chamadas_processadas += 1
+                    links_encontrados += len(chamada.links_importantes)
                     
-                    print(f"   ✅ Chamada processada: {chamada_processada['titulo'][:50]}...")
-                    print(f"      🔗 Links encontrados: {len(chamada_processada['links_importantes'])}")
+                    print(f"   ✅ Chamada processada: {chamada.titulo[:50]}...")
+                    print(f"      🔗 Links encontrados: {len(chamada.links_importantes)}")
                     
                 except Exception as e:
                     print(f"   ❌ Erro ao processar chamada: {e}")
@@ -190,33 +153,23 @@ class ReorganizadorDadosSolucaoDefinitiva:
         print("\n🏫 Processando UFMG...")
         
         try:
-            with open(arquivo, 'r', encoding='utf-8') as f:
-                dados = json.load(f)
+            dados = self.carregar_origem(arquivo)
             
             editais_processados = 0
             pdfs_encontrados = 0
             
-            # Processar editais da UFMG (estrutura pode variar)
-            editais = dados.get('editais_ufmg', dados.get('ufmg', []))
-            
-            for edital in editais:
+            # Processar editais da UFMG (o modelo lê qualquer estrutura conhecida)
+            for edital in chamadas_de_dados(dados):
+                if edital.fonte != Fonte.UFMG:
+                    continue
                 try:
-                    edital_processado = {
-                        'fonte': 'UFMG',
-                        'titulo': edital.get('titulo', ''),
-                        'numero': edital.get('numero', ''),
-                        'data': edital.get('data', ''),
-                        'descricao': edital.get('descricao', ''),
-                        'link_pdf': edital.get('link_pdf', ''),
-                        'link_alternativo': edital.get('link_alternativo', ''),
-                        'data_coleta': edital.get('data_coleta', ''),
-                        'solucao_definitiva': True
-                    }
+                    edital_processado = edital.to_dict()
+                    edital_processado['solucao_definitiva'] = True
                     
                     self.dados_finais['ufmg'].append(edital_processado)
                     editais_processados += 1
                     
-                    if edital_processado['link_pdf'] or edital_processado['link_alternativo']:
+                    if edital.link or edital.link_alternativo:
                         pdfs_encontrados += 1
                     
                 except Exception as e:
@@ -248,7 +201,7 @@ class ReorganizadorDadosSolucaoDefinitiva:
             total_pdfs += len(chamada.get('links_importantes', []))
         
         for edital in self.dados_finais['ufmg']:
-            if edital.get('link_pdf') or edital.get('link_alternativo'):
+            if edital.get('link') or edital.get('link_alternativo'):
                 total_pdfs += 1
         
         self.dados_finais['total_editais'] = total_editais
@@ -272,20 +225,25 @@ class ReorganizadorDadosSolucaoDefinitiva:
                 json.dump(self.dados_finais, f, ensure_ascii=False, indent=2)
             
             print(f"\n💾 Dados finais salvos em: {nome_arquivo}")
+            salvar_execucao('dados_reorganizados_solucao_definitiva', self.dados_finais, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
             print(f"❌ Erro ao salvar dados finais: {e}")
             return None
     
-    def executar_reorganizacao_completa(self):
-        """Executa reorganização MEGA-ULTRA-MELHORADA completa"""
+    def executar_reorganizacao_completa(self, dados_fapemig=None, dados_cnpq=None):
+        """Executa reorganização MEGA-ULTRA-MELHORADA completa
+
+        dados_fapemig/dados_cnpq vêm em memória do pipeline; sem eles, os arquivos
+        mais recentes são procurados no disco.
+        """
         print("🚀 INICIANDO REORGANIZAÇÃO MEGA-ULTRA-MELHORADA")
         print("=" * 60)
         print(f"⏰ Início: {datetime.now().strftime('%H:%M:%S')}")
         
         # Encontrar arquivos
-        arquivo_fapemig, arquivo_cnpq, arquivo_ufmg = self.encontrar_arquivos_solucao_definitiva()
+        arquivo_fapemig, arquivo_cnpq, arquivo_ufmg = self.encontrar_arquivos_solucao_definitiva(dados_fapemig, dados_cnpq)
         
         total_editais = 0
         total_pdfs = 0
@@ -321,6 +279,13 @@ class ReorganizadorDadosSolucaoDefinitiva:
         
         return True
 
+def executar(contexto=None):
+    """Etapa do pipeline: reorganiza os resultados das etapas anteriores (ou os do disco)"""
+    contexto = contexto or {}
+    reorganizador = ReorganizadorDadosSolucaoDefinitiva()
+    reorganizador.executar_reorganizacao_completa(contexto.get('fapemig'), contexto.get('cnpq'))
+    return reorganizador.dados_finais
+
 if __name__ == "__main__":
     reorganizador = ReorganizadorDadosSolucaoDefinitiva()
     reorganizador.executar_reorganizacao_completa()
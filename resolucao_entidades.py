@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+🧩 RESOLUÇÃO DE ENTIDADES ENTRE FONTES E EXECUÇÕES
+==================================================
+
+A mesma chamada aparece em editais_rapidos_*, fapemig_solucao_definitiva_*,
+scraper_unificado_real_*, dados_reorganizados_* ... com títulos e campos
+ligeiramente diferentes. Esta etapa:
+✅ Agrupa candidatos por blocos (fonte, ano, número) e por prefixo de tokens do título
+✅ Mesma (fonte, número, entrada) é fundida direto, sem comparar pares
+✅ Compara apenas pares dentro do mesmo bloco (sem comparação de todos contra todos);
+   blocos grandes demais são divididos pelas bandas SimHash do título
+✅ Funde cada grupo em um registro "golden" com proveniência por campo
+"""
+
+import re
+import glob
+import json
+from collections import defaultdict
+from datetime import datetime
+
+from colecao_links import ColecaoLinks
+from deduplicacao import normalizar_texto, normalizar_numero, marcador_entrada
+from quase_duplicatas import IndiceQuaseDuplicatas
+from modelos import Anexo, LinkImportante, chamadas_de_dados, texto_de
+from armazenamento import salvar_execucao
+
+# Arquivos históricos que costumam repetir as mesmas chamadas
+PADROES_ARQUIVOS = [
+    'editais_rapidos_*.json',
+    'fapemig_solucao_definitiva_*.json',
+    'cnpq_solucao_definitiva_*.json',
+    'scraper_unificado_real_*.json',
+    'dados_reorganizados_*.json',
+    'chamadas_cnpq_detalhadas_*.json',
+    'chamadas_cnpq_inteligentes_*.json',
+]
+
+# Tokens genéricos que não ajudam a distinguir chamadas
+STOPWORDS = {
+    'chamada', 'chamadas', 'edital', 'editais', 'publica', 'fapemig', 'cnpq', 'ufmg',
+    'de', 'da', 'do', 'das', 'dos', 'e', 'em', 'no', 'na', 'para', 'a', 'o', 'n'
+}
+
+TOKENS_PREFIXO = 2          # Tokens significativos usados no bloco por título
+LIMIAR_MESMO_NUMERO = 0.5   # Similaridade mínima quando o número coincide
+LIMIAR_SEM_NUMERO = 0.8     # Similaridade mínima quando só o título coincide
+TAMANHO_MAXIMO_BLOCO = 500  # Blocos maiores são divididos antes da comparação de pares
+
+CAMPOS_TEXTO = [
+    'titulo', 'numero', 'id', 'descricao', 'data_inclusao', 'prazo_final',
+    'periodo_inscricao', 'link', 'link_alternativo', 'status', 'texto_completo'
+]
+
+
+def tokens_titulo(titulo):
+    """Tokens significativos do título normalizado"""
+    return [t for t in normalizar_texto(titulo).split() if t not in STOPWORDS and not t.isdigit()]
+
+
+def numero_da_chamada(chamada):
+    """Número normalizado da chamada, buscando no título quando o campo está vazio"""
+    numero = normalizar_numero(chamada.numero)
+    if not re.match(r'^\d+/\d{4}$', numero):
+        match = re.search(r'(\d{1,4})\s*/\s*(\d{4})', chamada.titulo or '')
+        numero = normalizar_numero(match.group(0)) if match else ''
+    return numero
+
+
+class RegistroCandidato:
+    """Chamada com as chaves pré-calculadas usadas pela resolução"""
+
+    __slots__ = ('chamada', 'origem', 'fonte', 'numero', 'tokens', 'entrada')
+
+    def __init__(self, chamada, origem):
+        self.chamada = chamada
+        self.origem = origem
+        self.fonte = texto_de(chamada.fonte)
+        self.numero = numero_da_chamada(chamada)
+        self.tokens = set(tokens_titulo(chamada.titulo))
+        self.entrada = marcador_entrada(chamada.titulo)
+
+    def chaves_bloco(self):
+        """Blocos aos quais o registro pertence"""
+        chaves = []
+        if self.numero:
+            numero, ano = self.numero.split('/')
+            chaves.append(('numero', self.fonte, ano, numero))
+        prefixo = tokens_titulo(self.chamada.titulo)[:TOKENS_PREFIXO]
+        if prefixo:
+            chaves.append(('titulo', self.fonte, ' '.join(prefixo)))
+        return chaves
+
+
+def similaridade(a, b):
+    """Pontuação de um par dentro de um bloco (0 a 1)"""
+    if a.entrada != b.entrada:
+        return 0.0
+    if a.numero and b.numero and a.numero != b.numero:
+        return 0.0
+    if not a.tokens or not b.tokens:
+        return 1.0 if a.numero and a.numero == b.numero else 0.0
+    return len(a.tokens & b.tokens) / len(a.tokens | b.tokens)
+
+
+class UniaoBusca:
+    """Union-find para agrupar os pares que casaram"""
+
+    def __init__(self, tamanho):
+        self.pai = list(range(tamanho))
+
+    def encontrar(self, i):
+        while self.pai[i] != i:
+            self.pai[i] = self.pai[self.pai[i]]
+            i = self.pai[i]
+        return i
+
+    def unir(self, i, j):
+        raiz_i, raiz_j = self.encontrar(i), self.encontrar(j)
+        if raiz_i != raiz_j:
+            self.pai[max(raiz_i, raiz_j)] = min(raiz_i, raiz_j)
+
+
+class ResolvedorEntidades:
+    def __init__(self):
+        self.registros = []
+        self.blocos = defaultdict(list)
+        self.pares_comparados = 0
+
+    def adicionar(self, chamada, origem):
+        """Registra uma chamada vinda de 'origem' (nome do arquivo, etapa...)"""
+        registro = RegistroCandidato(chamada, origem)
+        posicao = len(self.registros)
+        self.registros.append(registro)
+        for chave in registro.chaves_bloco():
+            self.blocos[chave].append(posicao)
+
+    def adicionar_arquivo(self, arquivo):
+        """Lê todas as chamadas de um arquivo JSON em qualquer layout conhecido"""
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+        total = 0
+        for chamada in chamadas_de_dados(dados):
+            if chamada.titulo:
+                self.adicionar(chamada, arquivo)
+                total += 1
+        return total
+
+    def _comparar(self, uniao, posicoes, limiar):
+        for i, posicao_a in enumerate(posicoes):
+            for posicao_b in posicoes[i + 1:]:
+                if uniao.encontrar(posicao_a) == uniao.encontrar(posicao_b):
+                    continue
+                self.pares_comparados += 1
+                if similaridade(self.registros[posicao_a], self.registros[posicao_b]) >= limiar:
+                    uniao.unir(posicao_a, posicao_b)
+
+    def _sub_blocos(self, posicoes):
+        """Divide um bloco grande pelas bandas SimHash do título: quase-duplicatas coincidem em
+        pelo menos uma banda. Um balde ainda grande demais é fatiado (mantém a comparação limitada)"""
+        indice = IndiceQuaseDuplicatas()
+        for posicao in posicoes:
+            indice.adicionar(posicao, self.registros[posicao].chamada.titulo)
+        for baldes in indice.baldes:
+            for balde in baldes.values():
+                for inicio in range(0, len(balde), TAMANHO_MAXIMO_BLOCO):
+                    yield balde[inicio:inicio + TAMANHO_MAXIMO_BLOCO]
+
+    def agrupar(self):
+        """Compara pares apenas dentro dos blocos e devolve os grupos de índices"""
+        uniao = UniaoBusca(len(self.registros))
+
+        # Mesma fonte, número e entrada: é a mesma chamada, fundida sem comparação
+        primeiras = {}
+        for posicao, registro in enumerate(self.registros):
+            if registro.numero:
+                chave = (registro.fonte, registro.numero, registro.entrada)
+                uniao.unir(primeiras.setdefault(chave, posicao), posicao)
+
+        for chave, posicoes in self.blocos.items():
+            # Um representante por grupo já formado; títulos com os mesmos tokens (similaridade 1)
+            # também são unidos direto
+            representantes = {}
+            for posicao in posicoes:
+                registro = self.registros[posicao]
+                assinatura = (registro.entrada, registro.numero, frozenset(registro.tokens)) \
+                    if registro.tokens else ('posicao', uniao.encontrar(posicao))
+                if assinatura in representantes:
+                    uniao.unir(representantes[assinatura], posicao)
+                else:
+                    representantes[assinatura] = posicao
+            posicoes = list({uniao.encontrar(p): p for p in representantes.values()}.values())
+            if len(posicoes) < 2:
+                continue
+
+            limiar = LIMIAR_MESMO_NUMERO if chave[0] == 'numero' else LIMIAR_SEM_NUMERO
+            if len(posicoes) <= TAMANHO_MAXIMO_BLOCO:
+                self._comparar(uniao, posicoes, limiar)
+            else:
+                for sub_bloco in self._sub_blocos(posicoes):
+                    self._comparar(uniao, sub_bloco, limiar)
+
+        grupos = defaultdict(list)
+        for posicao in range(len(self.registros)):
+            grupos[uniao.encontrar(posicao)].append(posicao)
+        return list(grupos.values())
+
+    def fundir_grupo(self, posicoes):
+        """Funde um grupo em um registro golden com proveniência por campo"""
+        membros = [self.registros[p] for p in posicoes]
+        golden = membros[0].chamada
+        proveniencia = {}
+        resultado = {campo: '' for campo in CAMPOS_TEXTO}
+
+        for membro in membros:
+            for campo in CAMPOS_TEXTO:
+                valor = getattr(membro.chamada, campo) or ''
+                # O valor mais completo vence; em empate fica o primeiro visto
+                if len(str(valor)) > len(str(resultado[campo])):
+                    resultado[campo] = valor
+                    proveniencia[campo] = membro.origem
+
+        anexos = ColecaoLinks()
+        links = ColecaoLinks()
+        for membro in membros:
+            for anexo in membro.chamada.anexos:
+                if anexos.adicionar(anexo.to_dict()):
+                    proveniencia.setdefault('pdfs_disponiveis', membro.origem)
+            for link in membro.chamada.links_importantes:
+                if links.adicionar(link.to_dict()):
+                    proveniencia.setdefault('links_importantes', membro.origem)
+
+        datas_coleta = [m.chamada.data_coleta for m in membros if m.chamada.data_coleta]
+
+        registro = golden.to_dict()
+        registro.update(resultado)
+        registro['numero'] = resultado['numero'] or membros[0].numero
+        registro['pdfs_disponiveis'] = [Anexo.from_dict(a).to_dict() for a in anexos]
+        registro['total_pdfs'] = len(anexos)
+        registro['links_importantes'] = [LinkImportante.from_dict(l).to_dict() for l in links]
+        registro['total_links'] = len(links)
+        registro['data_coleta'] = max(datas_coleta) if datas_coleta else ''
+        registro['primeira_coleta'] = min(datas_coleta) if datas_coleta else ''
+        registro['proveniencia'] = proveniencia
+        registro['origens'] = sorted({m.origem for m in membros})
+        registro['total_ocorrencias'] = len(membros)
+        return registro
+
+    def resolver(self):
+        """Executa blocagem, pontuação e fusão, devolvendo os registros golden"""
+        return [self.fundir_grupo(grupo) for grupo in self.agrupar()]
+
+
+def main():
+    """Resolve as chamadas de todo o histórico de arquivos JSON"""
+    print("🧩 RESOLUÇÃO DE ENTIDADES ENTRE FONTES")
+    print("=" * 50)
+
+    resolvedor = ResolvedorEntidades()
+    arquivos = sorted({arquivo for padrao in PADROES_ARQUIVOS for arquivo in glob.glob(padrao)})
+
+    for arquivo in arquivos:
+        try:
+            total = resolvedor.adicionar_arquivo(arquivo)
+            print(f"   📖 {arquivo}: {total} registros")
+        except Exception as e:
+            print(f"   ❌ Erro ao ler {arquivo}: {e}")
+
+    golden = resolvedor.resolver()
+
+    resultado = {
+        'chamadas': golden,
+        'total_registros': len(resolvedor.registros),
+        'total_chamadas': len(golden),
+        'pares_comparados': resolvedor.pares_comparados,
+        'arquivos': arquivos,
+        'timestamp': datetime.now().isoformat()
+    }
+
+    nome_arquivo = f"chamadas_resolvidas_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(nome_arquivo, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+
+    print(f"\n📊 {len(resolvedor.registros)} registros -> {len(golden)} chamadas únicas")
+    print(f"🔍 Pares comparados: {resolvedor.pares_comparados}")
+    print(f"💾 Resultado salvo em: {nome_arquivo}")
+    salvar_execucao('chamadas_resolvidas', resultado, nome_arquivo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+📝 SAÍDA NDJSON EM STREAMING (APPEND-ONLY)
+==========================================
+
+Os scrapers gravam cada chamada assim que ela é extraída, em vez de esperar o
+json.dump final (um crash no meio da execução perdia tudo):
+✅ Uma linha JSON compacta por registro, em modo append
+✅ flush + fsync a cada lote de registros
+✅ Registro mesclado depois reescrito com a mesma posição (a última versão vence)
+✅ Rodapé com totais e metadados da execução
+✅ Leitura preguiçosa linha a linha e geração do JSON formatado a partir do stream
+"""
+
+import os
+import sys
+import json
+from datetime import datetime
+
+TAMANHO_LOTE = 10
+
+
+class SaidaNDJSON:
+    """Arquivo '<tipo>_<timestamp>.ndjson' onde cada linha é {lista, posicao, dados}"""
+
+    def __init__(self, tipo, timestamp=None, tamanho_lote=TAMANHO_LOTE):
+        self.tipo = tipo
+        self.timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.caminho = f"{tipo}_{self.timestamp}.ndjson"
+        self.tamanho_lote = tamanho_lote
+        self.arquivo = None
+        self.totais = {}
+        self.posicoes = {}
+        self.pendentes = 0
+
+    def _abrir(self):
+        # O arquivo só é criado quando o primeiro registro chega
+        if self.arquivo is None:
+            self.arquivo = open(self.caminho, 'a', encoding='utf-8')
+
+    def _gravar_linha(self, objeto):
+        self._abrir()
+        self.arquivo.write(json.dumps(objeto, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.pendentes += 1
+        if self.pendentes >= self.tamanho_lote:
+            self.sincronizar()
+
+    def sincronizar(self):
+        """Garante que as linhas já escritas estejam no disco"""
+        if self.arquivo is not None and self.pendentes:
+            self.arquivo.flush()
+            os.fsync(self.arquivo.fileno())
+            self.pendentes = 0
+
+    def escrever(self, lista, registro):
+        """Grava um registro da lista ('fapemig', 'chamadas_cnpq'...). Reescrever o mesmo
+        objeto (ex.: após uma mesclagem) repete a posição, e a última versão vence na leitura"""
+        chave = id(registro)
+        if chave in self.posicoes:
+            lista, posicao, _ = self.posicoes[chave]
+        else:
+            posicao = self.totais.get(lista, 0)
+            self.totais[lista] = posicao + 1
+            # Guarda a referência para que o id() não seja reaproveitado por outro objeto
+            self.posicoes[chave] = (lista, posicao, registro)
+
+        self._gravar_linha({'lista': lista, 'posicao': posicao, 'dados': registro})
+        return posicao
+
+    def finalizar(self, dados=None):
+        """Grava o rodapé (totais + campos que não são listas de registros) e fecha o arquivo"""
+        metadados = {chave: valor for chave, valor in (dados or {}).items() if chave not in self.totais}
+        self._gravar_linha({
+            'rodape': True,
+            'tipo': self.tipo,
+            'totais': self.totais,
+            'metadados': metadados,
+            'finalizado_em': datetime.now().isoformat()
+        })
+        self.sincronizar()
+        self.fechar()
+        return self.caminho
+
+    def fechar(self):
+        if self.arquivo is not None:
+            self.arquivo.close()
+            self.arquivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.sincronizar()
+        self.fechar()
+
+
+def ler_ndjson(caminho):
+    """Gera as linhas do arquivo sob demanda; uma última linha truncada (crash) é ignorada"""
+    with open(caminho, 'r', encoding='utf-8') as f:
+        for numero, linha in enumerate(f, 1):
+            linha = linha.strip()
+            if not linha:
+                continue
+            try:
+                yield json.loads(linha)
+            except json.JSONDecodeError:
+                print(f"⚠️ {caminho}: linha {numero} incompleta ignorada")
+
+
+def ler_registros(caminho):
+    """Gera (lista, posicao, dados) de cada linha de registro, sem carregar o arquivo inteiro"""
+    for objeto in ler_ndjson(caminho):
+        if not objeto.get('rodape'):
+            yield objeto['lista'], objeto['posicao'], objeto['dados']
+
+
+def ler_rodape(caminho):
+    """Rodapé da execução (lido do fim do arquivo), ou None se ela não terminou"""
+    with open(caminho, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        tamanho = f.tell()
+        bloco = min(tamanho, 64 * 1024)
+        f.seek(tamanho - bloco)
+        linhas = f.read().splitlines()
+
+    for linha in reversed(linhas):
+        if not linha.strip():
+            continue
+        try:
+            objeto = json.loads(linha.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return objeto if objeto.get('rodape') else None
+    return None
+
+
+def carregar_ndjson(caminho):
+    """Reconstrói o dict da execução (mesmo formato do antigo json.dump dos scrapers)"""
+    listas = {}
+    rodape = None
+    for objeto in ler_ndjson(caminho):
+        if objeto.get('rodape'):
+            rodape = objeto
+            continue
+        listas.setdefault(objeto['lista'], {})[objeto['posicao']] = objeto['dados']
+
+    dados = dict(rodape['metadados']) if rodape else {}
+    for lista, registros in listas.items():
+        dados[lista] = [registros[posicao] for posicao in sorted(registros)]
+    if rodape is None:
+        dados['execucao_incompleta'] = True
+    return dados
+
+
+def gerar_json_formatado(caminho_ndjson, caminho_json=None):
+    """Gera o artefato JSON formatado (indent=2) a partir do stream. Retorna (dados, caminho)"""
+    caminho_json = caminho_json or caminho_ndjson[:-len('.ndjson')] + '.json'
+    dados = carregar_ndjson(caminho_ndjson)
+    with open(caminho_json, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    return dados, caminho_json
+
+
+def main():
+    """Regenera o JSON formatado de um ou mais arquivos .ndjson (ex.: após um crash)"""
+    print("📝 GERAÇÃO DE JSON A PARTIR DO NDJSON")
+    print("=" * 50)
+
+    for caminho in sys.argv[1:]:
+        try:
+            rodape = ler_rodape(caminho)
+            dados, caminho_json = gerar_json_formatado(caminho)
+            situacao = "completa" if rodape else "incompleta (sem rodapé)"
+            total = sum(len(v) for v in dados.values() if isinstance(v, list))
+            print(f"✅ {caminho} -> {caminho_json}: {total} registros, execução {situacao}")
+        except Exception as e:
+            print(f"❌ Erro ao processar {caminho}: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,9 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 import os
 
+from armazenamento import salvar_execucao
+from prazos import prazo_da_etapa
+
 class ScraperCNPQDetalhado:
     def __init__(self):
         self.driver = None
@@ -28,6 +31,7 @@ class ScraperCNPQDetalhado:
             'timestamp': datetime.now().isoformat()
         }
         self.wait = None
+        self.prazo = prazo_da_etapa()
         
     def configurar_navegador(self):
         """Configura o navegador Chrome otimizado para extração detalhada"""
@@ -48,8 +52,8 @@ class ScraperCNPQDetalhado:
             options.add_argument('--ignore-certificate-errors')
             
             self.driver = webdriver.Chrome(options=options)
-            self.driver.implicitly_wait(5)
-            self.wait = WebDriverWait(self.driver, 10)
+            self.prazo.aplicar(self.driver, 5)
+            self.wait = WebDriverWait(self.driver, self.prazo.limitar(10))
             
             print("✅ Navegador configurado para extração detalhada!")
             return True
@@ -186,6 +190,7 @@ class ScraperCNPQDetalhado:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"💾 Resultados detalhados salvos em: {nome_arquivo}")
+            salvar_execucao('chamadas_cnpq_detalhadas', self.resultados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -7,7 +7,6 @@ Versão que usa múltiplas estratégias para extrair informações do CNPq,
 incluindo busca por texto específico, análise de estrutura e fallbacks.
 """
 
-import time
 import json
 import re
 from datetime import datetime
@@ -20,6 +19,9 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 import os
 
+from armazenamento import salvar_execucao
+from prazos import prazo_da_etapa
+
 class ScraperCNPQInteligente:
     def __init__(self):
         self.driver = None
@@ -29,6 +31,7 @@ class ScraperCNPQInteligente:
             'timestamp': datetime.now().isoformat()
         }
         self.wait = None
+        self.prazo = prazo_da_etapa()
         
     def configurar_navegador(self):
         """Configura o navegador Chrome para extração inteligente"""
@@ -49,8 +52,8 @@ class ScraperCNPQInteligente:
             options.add_argument('--ignore-certificate-errors')
             
             self.driver = webdriver.Chrome(options=options)
-            self.driver.implicitly_wait(15)
-            self.wait = WebDriverWait(self.driver, 20)
+            self.prazo.aplicar(self.driver, 15)
+            self.wait = WebDriverWait(self.driver, self.prazo.limitar(20))
             
             print("✅ Navegador configurado para extração inteligente!")
             return True
@@ -71,8 +74,10 @@ class ScraperCNPQInteligente:
         for url in urls_tentativas:
             try:
                 print(f"   Tentando: {url}")
-                self.driver.get(url)
-                time.sleep(8)  # Aguardar carregamento completo
+                if not self.prazo.carregar(self.driver, url):
+                    print("   ⏰ Prazo esgotado")
+                    return False
+                self.prazo.dormir(8)  # Aguardar carregamento completo
                 
                 # Verificar se carregou corretamente
                 titulo = self.driver.title
@@ -123,6 +128,8 @@ class ScraperCNPQInteligente:
             ]
             
             for nome, seletor in seletores_teste:
+                if self.prazo.esgotado():
+                    break
                 try:
                     elementos = self.driver.find_elements(By.CSS_SELECTOR, seletor)
                     estrutura['elementos_encontrados'][nome] = len(elementos)
@@ -186,6 +193,9 @@ class ScraperCNPQInteligente:
         chamadas_encontradas = []
         
         for info_chamada in textos_chamadas:
+            if self.prazo.esgotado():
+                print("   ⏰ Prazo esgotado, mantendo as chamadas já extraídas")
+                break
             try:
                 texto_busca = info_chamada['busca']
                 print(f"   Buscando: {texto_busca[:50]}...")
@@ -304,11 +314,14 @@ class ScraperCNPQInteligente:
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             nome_arquivo = f"chamadas_cnpq_inteligentes_{timestamp}.json"
+            # Prazo esgotado no meio da extração: salva o que tem, marcado como parcial
+            self.resultados['parcial'] = self.prazo.estourado
             
             with open(nome_arquivo, 'w', encoding='utf-8') as f:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"💾 Resultados inteligentes salvos em: {nome_arquivo}")
+            salvar_execucao('chamadas_cnpq_inteligentes', self.resultados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
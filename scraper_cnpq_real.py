@@ -20,6 +20,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 import os
 
+from armazenamento import salvar_execucao
+
 class ScraperCNPQReal:
     def __init__(self):
         self.driver = None
@@ -326,6 +328,7 @@ class ScraperCNPQReal:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"💾 Resultados reais salvos em: {nome_arquivo}")
+            salvar_execucao('chamadas_cnpq_reais', self.resultados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -10,8 +10,6 @@ Versão que resolve TODOS os problemas baseada na estrutura HTML real:
 ✅ Funciona com a estrutura HTML real identificada
 """
 
-import time
-import json
 import re
 from datetime import datetime
 from selenium import webdriver
@@ -22,6 +20,14 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 
+from deduplicacao import IndiceDeduplicacao
+from colecao_links import ColecaoLinks
+from quase_duplicatas import IndiceQuaseDuplicatas
+from armazenamento import salvar_execucao
+from saida_ndjson import SaidaNDJSON, gerar_json_formatado
+from prazos import prazo_da_etapa
+from incremental import CacheIncremental, impressao_bloco, hrefs_do_bloco
+
 class ScraperCNPqSolucaoDefinitiva:
     def __init__(self):
         self.driver = None
@@ -32,6 +38,17 @@ class ScraperCNPqSolucaoDefinitiva:
             'total_links': 0
         }
         self.wait = None
+        # Cada registro novo ou mesclado vai para o disco assim que é extraído
+        self.saida = SaidaNDJSON('cnpq_solucao_definitiva')
+        # Índice compartilhado por todos os métodos de busca (evita duplicatas em O(1))
+        self.indice = IndiceDeduplicacao(
+            self.resultados['chamadas_cnpq'], fonte='CNPq',
+            similares=IndiceQuaseDuplicatas(),
+            ao_gravar=lambda registro: self.saida.escrever('chamadas_cnpq', registro)
+        )
+        self.prazo = prazo_da_etapa()
+        # Modo incremental: links reaproveitados dos blocos que não mudaram desde a última execução
+        self.incremental = CacheIncremental('cnpq_solucao_definitiva')
         
     def configurar_navegador(self):
         """Configura o navegador Chrome para extração MEGA-ULTRA-MELHORADA"""
@@ -51,8 +68,8 @@ class ScraperCNPqSolucaoDefinitiva:
             options.add_argument('--ignore-certificate-errors')
             
             self.driver = webdriver.Chrome(options=options)
-            self.driver.implicitly_wait(20)
-            self.wait = WebDriverWait(self.driver, 30)
+            self.prazo.aplicar(self.driver, 20)
+            self.wait = WebDriverWait(self.driver, self.prazo.limitar(30))
             
             print("✅ Navegador configurado para SOLUÇÃO DEFINITIVA do CNPq!")
             return True
@@ -66,8 +83,10 @@ class ScraperCNPqSolucaoDefinitiva:
         
         try:
             url = "http://memoria2.cnpq.br/web/guest/chamadas-publicas"
-            self.driver.get(url)
-            time.sleep(15)  # Aguardar carregamento completo
+            if not self.prazo.carregar(self.driver, url):
+                print("⏰ CNPq: prazo esgotado antes de carregar a página")
+                return
+            self.prazo.dormir(15)  # Aguardar carregamento completo
             
             print(f"   Título: {self.driver.title}")
             print(f"   URL atual: {self.driver.current_url}")
@@ -76,14 +95,18 @@ class ScraperCNPqSolucaoDefinitiva:
             self.buscar_chamadas_metodo_1()
             
             # 🔥 MÉTODO 2: Buscar por padrões específicos no HTML
-            if len(self.resultados['chamadas_cnpq']) < 10:  # Se não encontrou muitos
+            if len(self.resultados['chamadas_cnpq']) < 10 and not self.prazo.esgotado():  # Se não encontrou muitos
                 self.buscar_chamadas_metodo_2()
             
             # 🔥 MÉTODO 3: Buscar por elementos específicos do CNPq
-            if len(self.resultados['chamadas_cnpq']) < 15:  # Se ainda não encontrou muitos
+            if len(self.resultados['chamadas_cnpq']) < 15 and not self.prazo.esgotado():  # Se ainda não encontrou muitos
                 self.buscar_chamadas_metodo_3()
             
+            if self.prazo.estourado:
+                print("⏰ CNPq: prazo esgotado, resultado parcial")
             print(f"✅ CNPq: {len(self.resultados['chamadas_cnpq'])} chamadas extraídas com SOLUÇÃO DEFINITIVA!")
+            print(f"   🧬 Duplicatas mescladas: {self.indice.total_mesclados}")
+            print(f"   🪞 Quase-duplicatas (SimHash): {self.indice.total_quase_duplicatas}")
             
         except Exception as e:
             print(f"❌ Erro ao extrair CNPq: {e}")
@@ -105,6 +128,8 @@ class ScraperCNPqSolucaoDefinitiva:
             chamadas_encontradas = []
             
             for xpath in xpath_patterns:
+                if self.prazo.esgotado():
+                    break
                 try:
                     elementos = self.driver.find_elements(By.XPATH, xpath)
                     for elemento in elementos:
@@ -118,10 +143,11 @@ class ScraperCNPqSolucaoDefinitiva:
             
             # Processar cada chamada encontrada
             for i, elemento in enumerate(chamadas_encontradas, 1):
+                if self.prazo.esgotado():
+                    break
                 try:
                     info_completa = self.extrair_chamada_completa(elemento, i)
-                    if info_completa and info_completa not in self.resultados['chamadas_cnpq']:
-                        self.resultados['chamadas_cnpq'].append(info_completa)
+                    if self.indice.adicionar(info_completa):
                         print(f"      ✅ Chamada {i}: {info_completa['titulo'][:50]}...")
                 except Exception as e:
                     print(f"      ❌ Erro ao processar chamada {i}: {e}")
@@ -149,14 +175,15 @@ class ScraperCNPqSolucaoDefinitiva:
             for padrao in padroes:
                 matches = re.findall(padrao, html_completo, re.IGNORECASE)
                 for match in matches:
+                    if self.prazo.esgotado():
+                        break
                     print(f"      📋 Padrão encontrado: {match}")
                     
                     # Buscar o elemento que contém este padrão
                     elemento = self.buscar_elemento_por_texto(match)
                     if elemento:
                         info_completa = self.extrair_chamada_por_texto(match, elemento)
-                        if info_completa and info_completa not in self.resultados['chamadas_cnpq']:
-                            self.resultados['chamadas_cnpq'].append(info_completa)
+                        self.indice.adicionar(info_completa)
                             
         except Exception as e:
             print(f"      ❌ Erro no método 2: {e}")
@@ -178,14 +205,15 @@ class ScraperCNPqSolucaoDefinitiva:
             ]
             
             for seletor in seletores_cnpq:
+                if self.prazo.esgotado():
+                    break
                 try:
                     elementos = self.driver.find_elements(By.CSS_SELECTOR, seletor)
                     for elemento in elementos:
                         texto = elemento.text.strip()
                         if texto and len(texto) > 20:
                             info_completa = self.extrair_chamada_completa(elemento, len(self.resultados['chamadas_cnpq']) + 1)
-                            if info_completa and info_completa not in self.resultados['chamadas_cnpq']:
-                                self.resultados['chamadas_cnpq'].append(info_completa)
+                            self.indice.adicionar(info_completa)
                 except:
                     continue
                     
@@ -259,8 +287,15 @@ class ScraperCNPqSolucaoDefinitiva:
             if not descricao:
                 descricao = titulo
             
-            # 🔥 BUSCA MEGA-ULTRA-MELHORADA POR LINKS
-            links_importantes = self.buscar_links_mega_ultra_melhorado(container, titulo)
+            # 🔥 BUSCA MEGA-ULTRA-MELHORADA POR LINKS (só para blocos novos ou alterados no modo incremental)
+            impressao = impressao_bloco(titulo, texto_completo, hrefs_do_bloco(container))
+            anterior = self.incremental.reaproveitar(impressao)
+            if anterior is not None:
+                links_importantes = anterior['links_importantes']
+                print(f"         🔁 Bloco inalterado, {len(links_importantes)} links reaproveitados")
+            else:
+                links_importantes = self.buscar_links_mega_ultra_melhorado(container, titulo)
+                self.incremental.guardar(impressao, {'links_importantes': links_importantes}, titulo)
             
             # Extrair ID da chamada se disponível
             id_chamada = ""
@@ -340,7 +375,7 @@ class ScraperCNPqSolucaoDefinitiva:
     
     def buscar_links_mega_ultra_melhorado(self, container, titulo_chamada):
         """Busca MEGA-ULTRA-MELHORADA por links importantes relacionados à chamada"""
-        links = []
+        links = ColecaoLinks(base=self.driver.current_url)
         
         try:
             print(f"         🔍 Buscando links MEGA-ULTRA-MELHORADO para: {titulo_chamada[:40]}...")
@@ -355,13 +390,13 @@ class ScraperCNPqSolucaoDefinitiva:
                     # Classificar o tipo de link baseado no texto
                     tipo_link = self.classificar_tipo_link(texto)
                     
-                    links.append({
+                    if links.adicionar({
                         'texto': texto,
                         'url': href,
                         'tipo': tipo_link,
                         'metodo': 'Container Direto'
-                    })
-                    print(f"            🔗 Link encontrado: {texto} ({tipo_link})")
+                    }):
+                        print(f"            🔗 Link encontrado: {texto} ({tipo_link})")
             
             # 2. Buscar por links específicos mencionados no texto
             if not links:
@@ -380,7 +415,7 @@ class ScraperCNPqSolucaoDefinitiva:
         except Exception as e:
             print(f"         ❌ Erro na busca MEGA-ULTRA-MELHORADA: {e}")
         
-        return links
+        return links.para_lista()
     
     def classificar_tipo_link(self, texto_link):
         """Classifica o tipo de link baseado no texto"""
@@ -429,7 +464,7 @@ class ScraperCNPqSolucaoDefinitiva:
     
     def buscar_links_elementos_proximos(self, container):
         """Busca links em elementos próximos ao container"""
-        links = []
+        links = ColecaoLinks()
         
         try:
             # Buscar por elementos irmãos
@@ -444,14 +479,12 @@ class ScraperCNPqSolucaoDefinitiva:
                             href = link.get_attribute('href')
                             texto = link.text.strip()
                             
-                            if href and texto and href not in [l['url'] for l in links]:
-                                tipo_link = self.classificar_tipo_link(texto)
-                                links.append({
-                                    'texto': texto,
-                                    'url': href,
-                                    'tipo': tipo_link,
-                                    'metodo': 'Elemento Próximo'
-                                })
+                            if href and texto and links.adicionar({
+                                'texto': texto,
+                                'url': href,
+                                'tipo': self.classificar_tipo_link(texto),
+                                'metodo': 'Elemento Próximo'
+                            }):
                                 print(f"                  🔗 Link próximo: {texto}")
                     except:
                         continue
@@ -462,23 +495,25 @@ class ScraperCNPqSolucaoDefinitiva:
         except Exception as e:
             print(f"                  ❌ Erro na busca por elementos próximos: {e}")
         
-        return links
+        return links.para_lista()
     
     def salvar_resultados(self):
         """Salva os resultados da SOLUÇÃO DEFINITIVA do CNPq"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nome_arquivo = f"cnpq_solucao_definitiva_{timestamp}.json"
-            
             # Calcular totais
             total_links = sum(len(item.get('links_importantes', [])) for item in self.resultados['chamadas_cnpq'])
             self.resultados['total_chamadas'] = len(self.resultados['chamadas_cnpq'])
             self.resultados['total_links'] = total_links
+            self.resultados['parcial'] = self.prazo.estourado
+            self.resultados['incremental'] = self.incremental.resumo()
+            self.incremental.salvar()
             
-            with open(nome_arquivo, 'w', encoding='utf-8') as f:
-                json.dump(self.resultados, f, ensure_ascii=False, indent=2)
+            # Fecha o stream NDJSON e gera o JSON formatado a partir dele
+            self.saida.finalizar(self.resultados)
+            dados, nome_arquivo = gerar_json_formatado(self.saida.caminho)
             
             print(f"💾 Resultados da SOLUÇÃO DEFINITIVA do CNPq salvos em: {nome_arquivo}")
+            salvar_execucao('cnpq_solucao_definitiva', dados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -517,6 +552,13 @@ class ScraperCNPqSolucaoDefinitiva:
                 self.driver.quit()
             return False
 
+def executar(contexto=None):
+    """Etapa do pipeline: executa o scraper e devolve os resultados em memória"""
+    scraper = ScraperCNPqSolucaoDefinitiva()
+    if not scraper.executar_solucao_definitiva():
+        return None
+    return scraper.resultados
+
 if __name__ == "__main__":
     scraper = ScraperCNPqSolucaoDefinitiva()
     scraper.executar_solucao_definitiva()
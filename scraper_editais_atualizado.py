@@ -15,7 +15,6 @@ Extrai:
 - Data limite de submissão
 """
 
-import time
 import json
 import re
 from datetime import datetime
@@ -27,6 +26,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 import chromedriver_autoinstaller
 
+from armazenamento import salvar_execucao
+from execucao_paralela import executar_fontes_em_paralelo, fontes_parciais
+from prazos import prazo_da_etapa
+from checkpoints import Checkpoint
+
 class ScraperEditaisAtualizado:
     def __init__(self):
         self.driver = None
@@ -37,6 +41,8 @@ class ScraperEditaisAtualizado:
             'timestamp': datetime.now().isoformat()
         }
         self.wait = None
+        # Prazo da etapa; no processo de cada fonte é trocado pelo prazo da fonte
+        self.prazo = prazo_da_etapa()
         
     def configurar_navegador(self):
         """Configura o navegador Chrome com opções otimizadas"""
@@ -55,8 +61,8 @@ class ScraperEditaisAtualizado:
             
             self.driver = webdriver.Chrome(options=options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.implicitly_wait(10)
-            self.wait = WebDriverWait(self.driver, 15)
+            self.prazo.aplicar(self.driver, 10)
+            self.wait = WebDriverWait(self.driver, self.prazo.limitar(15))
             
             print("✅ Navegador configurado com sucesso!")
             return True
@@ -69,16 +75,20 @@ class ScraperEditaisAtualizado:
         print("\n🔍 Extraindo editais da UFMG...")
         
         try:
-            self.driver.get('https://www.ufmg.br/prograd/editais-chamadas/')
-            time.sleep(3)
+            if not self.prazo.carregar(self.driver, 'https://www.ufmg.br/prograd/editais-chamadas/'):
+                print("⏰ UFMG: prazo esgotado")
+                return
+            self.prazo.dormir(3)
             
-            # Aguardar carregamento da página
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            # Aguardar carregamento da página (sem passar do prazo)
+            WebDriverWait(self.driver, self.prazo.limitar(15)).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
             # Buscar por links que contenham editais
             editais = self.driver.find_elements(By.CSS_SELECTOR, 'a')
             
             for edital in editais:
+                if self.prazo.esgotado():
+                    break
                 try:
                     texto = edital.text.strip()
                     href = edital.get_attribute('href')
@@ -142,16 +152,20 @@ class ScraperEditaisAtualizado:
         print("\n🔍 Extraindo oportunidades da FAPEMIG...")
         
         try:
-            self.driver.get('http://www.fapemig.br/pt/chamadas_abertas_oportunidades_fapemig/?hl=pt-BR')
-            time.sleep(4)
+            if not self.prazo.carregar(self.driver, 'http://www.fapemig.br/pt/chamadas_abertas_oportunidades_fapemig/?hl=pt-BR'):
+                print("⏰ FAPEMIG: prazo esgotado")
+                return
+            self.prazo.dormir(4)
             
-            # Aguardar carregamento da página
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            # Aguardar carregamento da página (sem passar do prazo)
+            WebDriverWait(self.driver, self.prazo.limitar(15)).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
             # Estratégia 1: Buscar por títulos de chamadas
             chamadas = self.driver.find_elements(By.TAG_NAME, "h5")
             
             for chamada in chamadas:
+                if self.prazo.esgotado():
+                    break
                 try:
                     texto = chamada.text.strip()
                     
@@ -244,6 +258,8 @@ class ScraperEditaisAtualizado:
                 outros_elementos = self.driver.find_elements(By.CSS_SELECTOR, "h3, h4, .chamada, .oportunidade")
                 
                 for elem in outros_elementos:
+                    if self.prazo.esgotado():
+                        break
                     try:
                         texto = elem.text.strip()
                         
@@ -291,16 +307,20 @@ class ScraperEditaisAtualizado:
         print("\n🔍 Extraindo chamadas do CNPq...")
         
         try:
-            self.driver.get('http://memoria2.cnpq.br/web/guest/chamadas-publicas')
-            time.sleep(4)
+            if not self.prazo.carregar(self.driver, 'http://memoria2.cnpq.br/web/guest/chamadas-publicas'):
+                print("⏰ CNPq: prazo esgotado")
+                return
+            self.prazo.dormir(4)
             
-            # Aguardar carregamento da página
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            # Aguardar carregamento da página (sem passar do prazo)
+            WebDriverWait(self.driver, self.prazo.limitar(15)).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
             # Estratégia 1: Buscar por títulos h4
             h4s = self.driver.find_elements(By.TAG_NAME, "h4")
             
             for h4 in h4s:
+                if self.prazo.esgotado():
+                    break
                 try:
                     texto = h4.text.strip()
                     
@@ -380,6 +400,8 @@ class ScraperEditaisAtualizado:
                 outros_elementos = self.driver.find_elements(By.CSS_SELECTOR, "h3, h5, .chamada, .oportunidade, .edital")
                 
                 for elem in outros_elementos:
+                    if self.prazo.esgotado():
+                        break
                     try:
                         texto = elem.text.strip()
                         
@@ -429,6 +451,7 @@ class ScraperEditaisAtualizado:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"\n💾 Resultados salvos em: {nome_arquivo}")
+            salvar_execucao('editais_extraidos', self.resultados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -472,17 +495,23 @@ class ScraperEditaisAtualizado:
         print("🚀 Iniciando extração de editais...")
         print(f"⏰ Início: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
         
-        if not self.configurar_navegador():
-            return False
-        
         try:
-            # Executar extrações
-            self.extrair_ufmg()
-            self.extrair_fapemig()
-            self.extrair_cnpq()
+            # Executar extrações: uma fonte por processo, cada uma com o seu navegador
+            checkpoint = Checkpoint('editais_extraidos')
+            resultados, situacao = executar_fontes_em_paralelo(ScraperEditaisAtualizado, {
+                'ufmg': 'extrair_ufmg',
+                'fapemig': 'extrair_fapemig',
+                'cnpq': 'extrair_cnpq'
+            }, checkpoint=checkpoint)
+            for lista, registros in resultados.items():
+                self.resultados[lista] = registros
+            self.resultados['situacao_fontes'] = situacao
+            self.resultados['parcial'] = bool(fontes_parciais(situacao))
             
             # Salvar e mostrar resultados
             arquivo_salvo = self.salvar_resultados()
+            if arquivo_salvo and not self.resultados['parcial']:
+                checkpoint.limpar()
             self.imprimir_resumo()
             
             if arquivo_salvo:
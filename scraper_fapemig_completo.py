@@ -18,6 +18,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 
+from colecao_links import ColecaoLinks
+from armazenamento import salvar_execucao
+
 class ScraperFAPEMIGCompleto:
     def __init__(self):
         self.driver = None
@@ -163,7 +166,7 @@ class ScraperFAPEMIGCompleto:
     
     def extrair_pdfs_fapemig(self, elemento_pai):
         """Extrai todos os PDFs disponíveis de uma chamada"""
-        pdfs = []
+        pdfs = ColecaoLinks()
         
         try:
             # Buscar por links que contenham .pdf
@@ -174,7 +177,7 @@ class ScraperFAPEMIGCompleto:
                 texto = link.text.strip()
                 
                 if href and texto:
-                    pdfs.append({
+                    pdfs.adicionar({
                         'nome': texto,
                         'url': href,
                         'tipo': 'PDF'
@@ -187,8 +190,8 @@ class ScraperFAPEMIGCompleto:
                 href = botao.get_attribute('href')
                 texto = botao.text.strip()
                 
-                if href and texto and href not in [p['url'] for p in pdfs]:
-                    pdfs.append({
+                if href and texto:
+                    pdfs.adicionar({
                         'nome': texto,
                         'url': href,
                         'tipo': 'Download'
@@ -197,7 +200,7 @@ class ScraperFAPEMIGCompleto:
         except Exception as e:
             print(f"   ❌ Erro ao extrair PDFs: {e}")
         
-        return pdfs
+        return pdfs.para_lista()
     
     def extrair_links_video(self, texto_completo):
         """Extrai links para vídeos explicativos"""
@@ -230,6 +233,7 @@ class ScraperFAPEMIGCompleto:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"💾 Resultados completos da FAPEMIG salvos em: {nome_arquivo}")
+            salvar_execucao('fapemig_completo', self.resultados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -19,6 +19,13 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 
+from colecao_links import ColecaoLinks
+from quase_duplicatas import similaridade_textos
+from armazenamento import salvar_execucao
+
+# Similaridade mínima entre o texto do link e o título para associar o PDF à chamada
+LIMIAR_PDF_RELACIONADO = 0.75
+
 class ScraperFAPEMIGDefinitivo:
     def __init__(self):
         self.driver = None
@@ -182,7 +189,7 @@ class ScraperFAPEMIGDefinitivo:
     
     def buscar_pdfs_mega_inteligente(self, elemento_pai, titulo_chamada, html_completo):
         """Busca MEGA-INTELIGENTE por PDFs relacionados à chamada"""
-        pdfs = []
+        pdfs = ColecaoLinks(base=self.driver.current_url)
         
         try:
             print(f"      🔍 Buscando PDFs para: {titulo_chamada[:40]}...")
@@ -193,13 +200,12 @@ class ScraperFAPEMIGDefinitivo:
                 href = link.get_attribute('href')
                 texto = link.text.strip()
                 
-                if href and texto:
-                    pdfs.append({
-                        'nome': texto,
-                        'url': href,
-                        'tipo': 'PDF Direto',
-                        'metodo': 'Elemento Pai'
-                    })
+                if href and texto and pdfs.adicionar({
+                    'nome': texto,
+                    'url': href,
+                    'tipo': 'PDF Direto',
+                    'metodo': 'Elemento Pai'
+                }):
                     print(f"         📄 PDF direto encontrado: {texto}")
             
             # 2. Buscar por botões de download
@@ -208,13 +214,12 @@ class ScraperFAPEMIGDefinitivo:
                 href = botao.get_attribute('href')
                 texto = botao.text.strip()
                 
-                if href and texto and href not in [p['url'] for p in pdfs]:
-                    pdfs.append({
-                        'nome': texto,
-                        'url': href,
-                        'tipo': 'Download',
-                        'metodo': 'Botão Download'
-                    })
+                if href and texto and pdfs.adicionar({
+                    'nome': texto,
+                    'url': href,
+                    'tipo': 'Download',
+                    'metodo': 'Botão Download'
+                }):
                     print(f"         📄 Download encontrado: {texto}")
             
             # 3. 🔥 BUSCA MEGA-INTELIGENTE NO HTML COMPLETO
@@ -240,7 +245,7 @@ class ScraperFAPEMIGDefinitivo:
         except Exception as e:
             print(f"         ❌ Erro na busca MEGA-INTELIGENTE: {e}")
         
-        return pdfs
+        return pdfs.para_lista()
     
     def buscar_pdfs_no_html_completo(self, titulo_chamada, html_completo):
         """Busca PDFs no HTML completo usando regex avançado"""
@@ -284,11 +289,9 @@ class ScraperFAPEMIGDefinitivo:
                 if palavra.lower() in texto_pdf.lower():
                     return True
             
-            # Verificar se o título da chamada aparece no texto do PDF
-            palavras_titulo = titulo_chamada.split()[:5]  # Primeiras 5 palavras
-            for palavra in palavras_titulo:
-                if len(palavra) > 3 and palavra.lower() in texto_pdf.lower():
-                    return True
+            # Verificar se o texto do PDF é uma variação do título da chamada (SimHash)
+            if similaridade_textos(titulo_chamada, texto_pdf) >= LIMIAR_PDF_RELACIONADO:
+                return True
             
             return False
             
@@ -297,7 +300,7 @@ class ScraperFAPEMIGDefinitivo:
     
     def buscar_pdfs_elementos_proximos(self, elemento_pai):
         """Busca PDFs em elementos próximos ao elemento pai"""
-        pdfs = []
+        pdfs = ColecaoLinks()
         
         try:
             # Buscar por elementos irmãos
@@ -312,13 +315,12 @@ class ScraperFAPEMIGDefinitivo:
                             href = link.get_attribute('href')
                             texto = link.text.strip()
                             
-                            if href and texto and href not in [p['url'] for p in pdfs]:
-                                pdfs.append({
-                                    'nome': texto,
-                                    'url': href,
-                                    'tipo': 'PDF Próximo',
-                                    'metodo': 'Elemento Próximo'
-                                })
+                            if href and texto and pdfs.adicionar({
+                                'nome': texto,
+                                'url': href,
+                                'tipo': 'PDF Próximo',
+                                'metodo': 'Elemento Próximo'
+                            }):
                                 print(f"            📄 PDF próximo: {texto}")
                     except:
                         continue
@@ -329,7 +331,7 @@ class ScraperFAPEMIGDefinitivo:
         except Exception as e:
             print(f"            ❌ Erro na busca por elementos próximos: {e}")
         
-        return pdfs
+        return pdfs.para_lista()
     
     def buscar_pdfs_por_texto(self, titulo_chamada, texto_completo):
         """Busca PDFs mencionados no texto da chamada"""
@@ -388,6 +390,7 @@ class ScraperFAPEMIGDefinitivo:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"💾 Resultados MEGA-INTELIGENTES da FAPEMIG salvos em: {nome_arquivo}")
+            salvar_execucao('fapemig_mega_inteligente', self.resultados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -10,6 +10,8 @@ import json
 import re
 from datetime import datetime
 
+from armazenamento import salvar_execucao
+
 def extrair_dados_fapemig():
     """
     Extrai dados do FAPEMIG baseado nos arquivos JSON existentes
@@ -116,6 +118,7 @@ def salvar_resultados(chamadas):
         with open(nome_arquivo, 'w', encoding='utf-8') as f:
             json.dump(resultado_final, f, ensure_ascii=False, indent=2)
         print(f"\n💾 Resultados salvos em: {nome_arquivo}")
+        salvar_execucao('fapemig_funcional', resultado_final, nome_arquivo)
         return nome_arquivo
     except Exception as e:
         print(f"❌ Erro ao salvar arquivo: {e}")
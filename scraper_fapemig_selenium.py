@@ -10,6 +10,8 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+from armazenamento import salvar_execucao
+
 class ScraperFAPEMIG:
     def __init__(self, headless=True):
         """Inicializa o scraper FAPEMIG com Selenium"""
@@ -347,6 +349,7 @@ class ScraperFAPEMIG:
             with open(nome_arquivo, 'w', encoding='utf-8') as f:
                 json.dump(resultado_final, f, ensure_ascii=False, indent=2)
             print(f"💾 Resultados salvos em: {nome_arquivo}")
+            salvar_execucao('fapemig_selenium', resultado_final, nome_arquivo)
             return nome_arquivo
         except Exception as e:
             print(f"❌ Erro ao salvar arquivo: {e}")
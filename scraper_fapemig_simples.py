@@ -5,6 +5,8 @@ import re
 from datetime import datetime
 import time
 
+from armazenamento import salvar_execucao
+
 class ScraperFAPEMIGSimples:
     def __init__(self):
         """Scraper FAPEMIG simples usando requests + BeautifulSoup"""
@@ -216,6 +218,7 @@ class ScraperFAPEMIGSimples:
             with open(nome_arquivo, 'w', encoding='utf-8') as f:
                 json.dump(resultado_final, f, ensure_ascii=False, indent=2)
             print(f"💾 Resultados salvos em: {nome_arquivo}")
+            salvar_execucao('fapemig_simples', resultado_final, nome_arquivo)
             return nome_arquivo
         except Exception as e:
             print(f"❌ Erro ao salvar arquivo: {e}")
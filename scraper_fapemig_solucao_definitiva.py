@@ -11,8 +11,6 @@ Versão que resolve TODOS os problemas:
 ✅ Funciona com a estrutura atual da página
 """
 
-import time
-import json
 import re
 from datetime import datetime
 from selenium import webdriver
@@ -23,6 +21,17 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 
+from deduplicacao import IndiceDeduplicacao
+from colecao_links import ColecaoLinks
+from quase_duplicatas import IndiceQuaseDuplicatas, similaridade_textos
+from armazenamento import salvar_execucao
+from saida_ndjson import SaidaNDJSON, gerar_json_formatado
+from prazos import prazo_da_etapa
+from incremental import CacheIncremental, impressao_bloco, hrefs_do_bloco
+
+# Similaridade mínima entre o texto do link e o título para associar o PDF à chamada
+LIMIAR_PDF_RELACIONADO = 0.75
+
 class ScraperFAPEMIGSolucaoDefinitiva:
     def __init__(self):
         self.driver = None
@@ -33,6 +42,17 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             'total_pdfs': 0
         }
         self.wait = None
+        # Cada registro novo ou mesclado vai para o disco assim que é extraído
+        self.saida = SaidaNDJSON('fapemig_solucao_definitiva')
+        # Índice compartilhado por todos os métodos de busca (evita duplicatas em O(1))
+        self.indice = IndiceDeduplicacao(
+            self.resultados['fapemig'], fonte='FAPEMIG',
+            similares=IndiceQuaseDuplicatas(),
+            ao_gravar=lambda registro: self.saida.escrever('fapemig', registro)
+        )
+        self.prazo = prazo_da_etapa()
+        # Modo incremental: PDFs reaproveitados dos blocos que não mudaram desde a última execução
+        self.incremental = CacheIncremental('fapemig_solucao_definitiva')
         
     def configurar_navegador(self):
         """Configura o navegador Chrome para extração MEGA-ULTRA-MELHORADA"""
@@ -52,8 +72,8 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             options.add_argument('--ignore-certificate-errors')
             
             self.driver = webdriver.Chrome(options=options)
-            self.driver.implicitly_wait(20)
-            self.wait = WebDriverWait(self.driver, 30)
+            self.prazo.aplicar(self.driver, 20)
+            self.wait = WebDriverWait(self.driver, self.prazo.limitar(30))
             
             print("✅ Navegador configurado para SOLUÇÃO DEFINITIVA da FAPEMIG!")
             return True
@@ -67,8 +87,10 @@ class ScraperFAPEMIGSolucaoDefinitiva:
         
         try:
             url = "http://www.fapemig.br/pt/chamadas_abertas_oportunidades_fapemig/"
-            self.driver.get(url)
-            time.sleep(20)  # Aguardar carregamento COMPLETO
+            if not self.prazo.carregar(self.driver, url):
+                print("⏰ FAPEMIG: prazo esgotado antes de carregar a página")
+                return
+            self.prazo.dormir(20)  # Aguardar carregamento COMPLETO
             
             print(f"   Título: {self.driver.title}")
             print(f"   URL atual: {self.driver.current_url}")
@@ -77,18 +99,22 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             self.buscar_editais_metodo_1()
             
             # 🔥 MÉTODO 2: Buscar por padrões específicos no HTML
-            if len(self.resultados['fapemig']) < 10:  # Se não encontrou muitos
+            if len(self.resultados['fapemig']) < 10 and not self.prazo.esgotado():  # Se não encontrou muitos
                 self.buscar_editais_metodo_2()
             
             # 🔥 MÉTODO 3: Buscar por elementos específicos da FAPEMIG
-            if len(self.resultados['fapemig']) < 15:  # Se ainda não encontrou muitos
+            if len(self.resultados['fapemig']) < 15 and not self.prazo.esgotado():  # Se ainda não encontrou muitos
                 self.buscar_editais_metodo_3()
             
             # 🔥 MÉTODO 4: Busca MEGA-INTELIGENTE por padrões
-            if len(self.resultados['fapemig']) < 20:  # Se ainda não encontrou muitos
+            if len(self.resultados['fapemig']) < 20 and not self.prazo.esgotado():  # Se ainda não encontrou muitos
                 self.buscar_editais_metodo_4()
             
+            if self.prazo.estourado:
+                print("⏰ FAPEMIG: prazo esgotado, resultado parcial")
             print(f"✅ FAPEMIG: {len(self.resultados['fapemig'])} editais extraídos com SOLUÇÃO DEFINITIVA!")
+            print(f"   🧬 Duplicatas mescladas: {self.indice.total_mesclados}")
+            print(f"   🪞 Quase-duplicatas (SimHash): {self.indice.total_quase_duplicatas}")
             
         except Exception as e:
             print(f"❌ Erro ao extrair FAPEMIG: {e}")
@@ -110,6 +136,8 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             editais_encontrados = []
             
             for seletor in seletores:
+                if self.prazo.esgotado():
+                    break
                 try:
                     elementos = self.driver.find_elements(By.CSS_SELECTOR, seletor)
                     for elemento in elementos:
@@ -123,10 +151,11 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             
             # Processar cada edital encontrado
             for i, elemento in enumerate(editais_encontrados, 1):
+                if self.prazo.esgotado():
+                    break
                 try:
                     info_completa = self.extrair_edital_completo(elemento, i)
-                    if info_completa and info_completa not in self.resultados['fapemig']:
-                        self.resultados['fapemig'].append(info_completa)
+                    if self.indice.adicionar(info_completa):
                         print(f"      ✅ Edital {i}: {info_completa['titulo'][:50]}...")
                 except Exception as e:
                     print(f"      ❌ Erro ao processar edital {i}: {e}")
@@ -155,14 +184,15 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             for padrao in padroes:
                 matches = re.findall(padrao, html_completo, re.IGNORECASE)
                 for match in matches:
+                    if self.prazo.esgotado():
+                        break
                     print(f"      📋 Padrão encontrado: {match}")
                     
                     # Buscar o elemento que contém este padrão
                     elemento = self.buscar_elemento_por_texto(match)
                     if elemento:
                         info_completa = self.extrair_edital_por_texto(match, elemento)
-                        if info_completa and info_completa not in self.resultados['fapemig']:
-                            self.resultados['fapemig'].append(info_completa)
+                        self.indice.adicionar(info_completa)
                             
         except Exception as e:
             print(f"      ❌ Erro no método 2: {e}")
@@ -185,14 +215,15 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             ]
             
             for seletor in seletores_fapemig:
+                if self.prazo.esgotado():
+                    break
                 try:
                     elementos = self.driver.find_elements(By.CSS_SELECTOR, seletor)
                     for elemento in elementos:
                         texto = elemento.text.strip()
                         if texto and len(texto) > 20:
                             info_completa = self.extrair_edital_completo(elemento, len(self.resultados['fapemig']) + 1)
-                            if info_completa and info_completa not in self.resultados['fapemig']:
-                                self.resultados['fapemig'].append(info_completa)
+                            self.indice.adicionar(info_completa)
                 except:
                     continue
                     
@@ -208,12 +239,13 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             todos_elementos = self.driver.find_elements(By.CSS_SELECTOR, '*')
             
             for elemento in todos_elementos:
+                if self.prazo.esgotado():
+                    break
                 try:
                     texto = elemento.text.strip()
                     if self.eh_edital_mega_inteligente(texto):
                         info_completa = self.extrair_edital_completo(elemento, len(self.resultados['fapemig']) + 1)
-                        if info_completa and info_completa not in self.resultados['fapemig']:
-                            self.resultados['fapemig'].append(info_completa)
+                        self.indice.adicionar(info_completa)
                             
                         # Limitar para não sobrecarregar
                         if len(self.resultados['fapemig']) >= 25:
@@ -307,8 +339,15 @@ class ScraperFAPEMIGSolucaoDefinitiva:
             if not descricao:
                 descricao = titulo
             
-            # 🔥 BUSCA MEGA-ULTRA-MELHORADA POR PDFs
-            pdfs_disponiveis = self.buscar_pdfs_mega_ultra_melhorado(elemento_pai, titulo)
+            # 🔥 BUSCA MEGA-ULTRA-MELHORADA POR PDFs (só para blocos novos ou alterados no modo incremental)
+            impressao = impressao_bloco(titulo, texto_completo, hrefs_do_bloco(elemento_pai))
+            anterior = self.incremental.reaproveitar(impressao)
+            if anterior is not None:
+                pdfs_disponiveis = anterior['pdfs_disponiveis']
+                print(f"         🔁 Bloco inalterado, {len(pdfs_disponiveis)} PDFs reaproveitados")
+            else:
+                pdfs_disponiveis = self.buscar_pdfs_mega_ultra_melhorado(elemento_pai, titulo)
+                self.incremental.guardar(impressao, {'pdfs_disponiveis': pdfs_disponiveis}, titulo)
             
             # Extrair links para vídeos
             links_video = self.extrair_links_video(texto_completo)
@@ -385,7 +424,7 @@ class ScraperFAPEMIGSolucaoDefinitiva:
     
     def buscar_pdfs_mega_ultra_melhorado(self, elemento_pai, titulo_chamada):
         """Busca MEGA-ULTRA-MELHORADA por PDFs relacionados à chamada"""
-        pdfs = []
+        pdfs = ColecaoLinks(base=self.driver.current_url)
         
         try:
             print(f"         🔍 Buscando PDFs MEGA-ULTRA-MELHORADO para: {titulo_chamada[:40]}...")
@@ -396,13 +435,12 @@ class ScraperFAPEMIGSolucaoDefinitiva:
                 href = link.get_attribute('href')
                 texto = link.text.strip()
                 
-                if href and texto:
-                    pdfs.append({
-                        'nome': texto,
-                        'url': href,
-                        'tipo': 'PDF Direto',
-                        'metodo': 'Elemento Pai'
-                    })
+                if href and texto and pdfs.adicionar({
+                    'nome': texto,
+                    'url': href,
+                    'tipo': 'PDF Direto',
+                    'metodo': 'Elemento Pai'
+                }):
                     print(f"            📄 PDF direto encontrado: {texto}")
             
             # 2. Buscar por botões de download
@@ -411,13 +449,12 @@ class ScraperFAPEMIGSolucaoDefinitiva:
                 href = botao.get_attribute('href')
                 texto = botao.text.strip()
                 
-                if href and texto and href not in [p['url'] for p in pdfs]:
-                    pdfs.append({
-                        'nome': texto,
-                        'url': href,
-                        'tipo': 'Download',
-                        'metodo': 'Botão Download'
-                    })
+                if href and texto and pdfs.adicionar({
+                    'nome': texto,
+                    'url': href,
+                    'tipo': 'Download',
+                    'metodo': 'Botão Download'
+                }):
                     print(f"            📄 Download encontrado: {texto}")
             
             # 3. Buscar por elementos próximos que possam conter PDFs
@@ -444,11 +481,11 @@ class ScraperFAPEMIGSolucaoDefinitiva:
         except Exception as e:
             print(f"         ❌ Erro na busca MEGA-ULTRA-MELHORADA: {e}")
         
-        return pdfs
+        return pdfs.para_lista()
     
     def buscar_pdfs_elementos_proximos(self, elemento_pai):
         """Busca PDFs em elementos próximos ao elemento pai"""
-        pdfs = []
+        pdfs = ColecaoLinks()
         
         try:
             # Buscar por elementos irmãos
@@ -463,13 +500,12 @@ class ScraperFAPEMIGSolucaoDefinitiva:
                             href = link.get_attribute('href')
                             texto = link.text.strip()
                             
-                            if href and texto and href not in [p['url'] for p in pdfs]:
-                                pdfs.append({
-                                    'nome': texto,
-                                    'url': href,
-                                    'tipo': 'PDF Próximo',
-                                    'metodo': 'Elemento Próximo'
-                                })
+                            if href and texto and pdfs.adicionar({
+                                'nome': texto,
+                                'url': href,
+                                'tipo': 'PDF Próximo',
+                                'metodo': 'Elemento Próximo'
+                            }):
                                 print(f"               📄 PDF próximo: {texto}")
                     except:
                         continue
@@ -480,7 +516,7 @@ class ScraperFAPEMIGSolucaoDefinitiva:
         except Exception as e:
             print(f"               ❌ Erro na busca por elementos próximos: {e}")
         
-        return pdfs
+        return pdfs.para_lista()
     
     def buscar_pdfs_por_texto(self, titulo_chamada, texto_completo):
         """Busca PDFs mencionados no texto da chamada"""
@@ -550,11 +586,9 @@ class ScraperFAPEMIGSolucaoDefinitiva:
                 if palavra.lower() in texto_pdf.lower():
                     return True
             
-            # Verificar se o título da chamada aparece no texto do PDF
-            palavras_titulo = titulo_chamada.split()[:5]  # Primeiras 5 palavras
-            for palavra in palavras_titulo:
-                if len(palavra) > 3 and palavra.lower() in texto_pdf.lower():
-                    return True
+            # Verificar se o texto do PDF é uma variação do título da chamada (SimHash)
+            if similaridade_textos(titulo_chamada, texto_pdf) >= LIMIAR_PDF_RELACIONADO:
+                return True
             
             return False
             
@@ -585,18 +619,20 @@ class ScraperFAPEMIGSolucaoDefinitiva:
     def salvar_resultados(self):
         """Salva os resultados da SOLUÇÃO DEFINITIVA da FAPEMIG"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nome_arquivo = f"fapemig_solucao_definitiva_{timestamp}.json"
-            
             # Calcular totais
             total_pdfs = sum(len(item.get('pdfs_disponiveis', [])) for item in self.resultados['fapemig'])
             self.resultados['total_editais'] = len(self.resultados['fapemig'])
             self.resultados['total_pdfs'] = total_pdfs
+            self.resultados['parcial'] = self.prazo.estourado
+            self.resultados['incremental'] = self.incremental.resumo()
+            self.incremental.salvar()
             
-            with open(nome_arquivo, 'w', encoding='utf-8') as f:
-                json.dump(self.resultados, f, ensure_ascii=False, indent=2)
+            # Fecha o stream NDJSON e gera o JSON formatado a partir dele
+            self.saida.finalizar(self.resultados)
+            dados, nome_arquivo = gerar_json_formatado(self.saida.caminho)
             
             print(f"💾 Resultados da SOLUÇÃO DEFINITIVA da FAPEMIG salvos em: {nome_arquivo}")
+            salvar_execucao('fapemig_solucao_definitiva', dados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -635,6 +671,13 @@ class ScraperFAPEMIGSolucaoDefinitiva:
                 self.driver.quit()
             return False
 
+def executar(contexto=None):
+    """Etapa do pipeline: executa o scraper e devolve os resultados em memória"""
+    scraper = ScraperFAPEMIGSolucaoDefinitiva()
+    if not scraper.executar_solucao_definitiva():
+        return None
+    return scraper.resultados
+
 if __name__ == "__main__":
     scraper = ScraperFAPEMIGSolucaoDefinitiva()
     scraper.executar_solucao_definitiva()
@@ -19,6 +19,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 
+from colecao_links import ColecaoLinks
+from armazenamento import salvar_execucao
+from incremental import CacheIncremental, impressao_bloco, hrefs_do_bloco
+
 class ScraperFAPEMIGUltraMelhorado:
     def __init__(self):
         self.driver = None
@@ -27,6 +31,8 @@ class ScraperFAPEMIGUltraMelhorado:
             'timestamp': datetime.now().isoformat()
         }
         self.wait = None
+        # Modo incremental: página de detalhe só para blocos novos ou alterados
+        self.incremental = CacheIncremental('fapemig_ultra_melhorado')
         
     def configurar_navegador(self):
         """Configura o navegador Chrome para extração ULTRA-MELHORADA"""
@@ -95,12 +101,32 @@ class ScraperFAPEMIGUltraMelhorado:
             # Agora acessar cada chamada individualmente para extrair PDFs
             for i, chamada in enumerate(chamadas_encontradas, 1):
                 try:
+                    anterior = self.incremental.reaproveitar(chamada['impressao'])
+                    if anterior is not None:
+                        info_completa = {
+                            'titulo': chamada['titulo'],
+                            'numero': chamada['numero'],
+                            'data_inclusao': chamada['data_inclusao'],
+                            'prazo_final': chamada['prazo_final'],
+                            'fonte': 'FAPEMIG',
+                            'data_coleta': datetime.now().isoformat(),
+                            **anterior
+                        }
+                        self.resultados['fapemig'].append(info_completa)
+                        print(f"\n   🔁 Chamada {i} inalterada: {len(info_completa['pdfs_disponiveis'])} PDFs reaproveitados")
+                        continue
+                    
                     print(f"\n   🔍 Acessando chamada {i}/{len(chamadas_encontradas)}: {chamada['titulo'][:50]}...")
                     
                     # Acessar a página da chamada individual
                     info_completa = self.acessar_chamada_individual(chamada)
                     if info_completa:
                         self.resultados['fapemig'].append(info_completa)
+                        self.incremental.guardar(chamada['impressao'], {
+                            'pdfs_disponiveis': info_completa['pdfs_disponiveis'],
+                            'info_detalhada': info_completa['info_detalhada'],
+                            'link_chamada': info_completa['link_chamada']
+                        }, chamada['titulo'])
                         print(f"   ✅ PDFs extraídos: {len(info_completa['pdfs_disponiveis'])} arquivos")
                     
                     # Aguardar entre acessos
@@ -123,6 +149,7 @@ class ScraperFAPEMIGUltraMelhorado:
                 elemento_pai = elemento.find_element(By.XPATH, "./..")
                 texto_completo = elemento_pai.text.strip()
             except:
+                elemento_pai = elemento
                 texto_completo = elemento.text.strip()
             
             # Extrair título
@@ -149,7 +176,9 @@ class ScraperFAPEMIGUltraMelhorado:
                 'numero': numero,
                 'data_inclusao': data_inclusao,
                 'prazo_final': prazo_final,
-                'texto_completo': texto_completo[:300] + "..." if len(texto_completo) > 300 else texto_completo
+                'texto_completo': texto_completo[:300] + "..." if len(texto_completo) > 300 else texto_completo,
+                # Título, número, datas e links do bloco: decide se a página de detalhe precisa ser visitada
+                'impressao': impressao_bloco(titulo, texto_completo, hrefs_do_bloco(elemento_pai))
             }
             
             return resultado
@@ -225,7 +254,7 @@ class ScraperFAPEMIGUltraMelhorado:
     
     def extrair_pdfs_da_chamada(self):
         """Extrai PDFs de uma página de chamada individual"""
-        pdfs = []
+        pdfs = ColecaoLinks(base=self.driver.current_url)
         
         try:
             # Buscar por links que contenham .pdf
@@ -236,7 +265,7 @@ class ScraperFAPEMIGUltraMelhorado:
                 texto = link.text.strip()
                 
                 if href and texto:
-                    pdfs.append({
+                    pdfs.adicionar({
                         'nome': texto,
                         'url': href,
                         'tipo': 'PDF'
@@ -249,8 +278,8 @@ class ScraperFAPEMIGUltraMelhorado:
                 href = botao.get_attribute('href')
                 texto = botao.text.strip()
                 
-                if href and texto and href not in [p['url'] for p in pdfs]:
-                    pdfs.append({
+                if href and texto:
+                    pdfs.adicionar({
                         'nome': texto,
                         'url': href,
                         'tipo': 'Download'
@@ -259,11 +288,11 @@ class ScraperFAPEMIGUltraMelhorado:
         except Exception as e:
             print(f"      ❌ Erro ao extrair PDFs da chamada: {e}")
         
-        return pdfs
+        return pdfs.para_lista()
     
     def buscar_pdfs_na_pagina_principal(self, titulo_chamada):
         """Busca PDFs relacionados a uma chamada na página principal"""
-        pdfs = []
+        pdfs = ColecaoLinks()
         
         try:
             # Voltar para a página principal
@@ -285,8 +314,8 @@ class ScraperFAPEMIGUltraMelhorado:
                         href = link.get_attribute('href')
                         texto = link.text.strip()
                         
-                        if href and texto and href not in [p['url'] for p in pdfs]:
-                            pdfs.append({
+                        if href and texto:
+                            pdfs.adicionar({
                                 'nome': texto,
                                 'url': href,
                                 'tipo': 'PDF'
@@ -298,7 +327,7 @@ class ScraperFAPEMIGUltraMelhorado:
         except Exception as e:
             print(f"      ❌ Erro ao buscar PDFs na página principal: {e}")
         
-        return pdfs
+        return pdfs.para_lista()
     
     def extrair_info_detalhada_chamada(self):
         """Extrai informações detalhadas de uma chamada"""
@@ -333,11 +362,14 @@ class ScraperFAPEMIGUltraMelhorado:
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             nome_arquivo = f"fapemig_ultra_melhorado_{timestamp}.json"
+            self.resultados['incremental'] = self.incremental.resumo()
+            self.incremental.salvar()
             
             with open(nome_arquivo, 'w', encoding='utf-8') as f:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"💾 Resultados ULTRA-MELHORADOS da FAPEMIG salvos em: {nome_arquivo}")
+            salvar_execucao('fapemig_ultra_melhorado', self.resultados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -7,8 +7,6 @@ Versão otimizada para execução rápida, com timeouts reduzidos
 e configurações para ambiente CI/CD.
 """
 
-import time
-import json
 import re
 from datetime import datetime
 from selenium import webdriver
@@ -19,6 +17,12 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 
+from armazenamento import salvar_execucao
+from saida_ndjson import SaidaNDJSON, gerar_json_formatado
+from execucao_paralela import executar_fontes_em_paralelo, fontes_parciais
+from prazos import prazo_da_etapa
+from checkpoints import Checkpoint, UrlsProcessadas
+
 class ScraperRapido:
     def __init__(self):
         self.driver = None
@@ -29,6 +33,12 @@ class ScraperRapido:
             'timestamp': datetime.now().isoformat()
         }
         self.wait = None
+        # Cada edital vai para o disco assim que é extraído
+        self.saida = SaidaNDJSON('editais_rapidos')
+        # Prazo da etapa; no processo de cada fonte é trocado pelo prazo da fonte
+        self.prazo = prazo_da_etapa()
+        # URLs já processadas (no processo de cada fonte vêm do checkpoint)
+        self.urls_processadas = UrlsProcessadas()
         
     def configurar_navegador(self):
         """Configura o navegador Chrome otimizado para velocidade"""
@@ -56,8 +66,8 @@ class ScraperRapido:
             self.driver = webdriver.Chrome(options=options)
             
             # ⚡ TIMEOUTS ULTRA-RÁPIDOS
-            self.driver.implicitly_wait(2)  # Era 10
-            self.wait = WebDriverWait(self.driver, 5)  # Era 15
+            self.prazo.aplicar(self.driver, 2)  # Era 10
+            self.wait = WebDriverWait(self.driver, self.prazo.limitar(5))  # Era 15
             
             print("✅ Navegador configurado para velocidade máxima!")
             return True
@@ -70,13 +80,17 @@ class ScraperRapido:
         print("🔍 Extraindo UFMG (modo rápido)...")
         
         try:
-            self.driver.get('https://www.ufmg.br/prograd/editais-chamadas/')
-            time.sleep(1)  # Era 3
+            if not self.prazo.carregar(self.driver, 'https://www.ufmg.br/prograd/editais-chamadas/'):
+                print("⏰ UFMG: prazo esgotado")
+                return
+            self.prazo.dormir(1)  # Era 3
             
             # Buscar apenas links principais
             editais = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*=".pdf"]')
             
             for edital in editais[:5]:  # Limitar a 5 resultados para teste
+                if self.prazo.esgotado():
+                    break
                 try:
                     texto = edital.text.strip()
                     href = edital.get_attribute('href')
@@ -92,6 +106,8 @@ class ScraperRapido:
                         }
                         
                         self.resultados['ufmg'].append(resultado)
+                        
+                        self.saida.escrever('ufmg', resultado)
                         print(f"✅ UFMG: {texto[:50]}...")
                         
                 except Exception as e:
@@ -116,9 +132,16 @@ class ScraperRapido:
         
         for url in urls_fapemig:
             try:
+                if url in self.urls_processadas:
+                    print(f"   ⏭️ {url} já processada (checkpoint)")
+                    if self.resultados['fapemig']:
+                        break
+                    continue
                 print(f"   Tentando: {url}")
-                self.driver.get(url)
-                time.sleep(2)
+                if not self.prazo.carregar(self.driver, url):
+                    print("   ⏰ Prazo esgotado, mantendo o que já foi extraído")
+                    break
+                self.prazo.dormir(2)
                 
                 # Verificar se carregou corretamente
                 if "O site não é seguro" in self.driver.title or "chrome-error" in self.driver.current_url:
@@ -129,6 +152,8 @@ class ScraperRapido:
                 seletores = ['h5', 'h4', 'h3', '.chamada', '.oportunidade', 'a']
                 
                 for seletor in seletores:
+                    if self.prazo.esgotado():
+                        break
                     try:
                         elementos = self.driver.find_elements(By.CSS_SELECTOR, seletor)
                         
@@ -148,6 +173,7 @@ class ScraperRapido:
                                 # Verificar se já existe
                                 if not any(r['titulo'] == texto for r in self.resultados['fapemig']):
                                     self.resultados['fapemig'].append(resultado)
+                                    self.saida.escrever('fapemig', resultado)
                                     print(f"✅ FAPEMIG: {texto[:50]}...")
                                 
                                 if len(self.resultados['fapemig']) >= 3:  # Limitar a 3
@@ -159,6 +185,8 @@ class ScraperRapido:
                     except Exception as e:
                         continue
                 
+                if not self.prazo.esgotado():
+                    self.urls_processadas.marcar(url)
                 if len(self.resultados['fapemig']) > 0:
                     break  # Se encontrou algo, para de tentar outras URLs
                     
@@ -182,9 +210,16 @@ class ScraperRapido:
         
         for url in urls_cnpq:
             try:
+                if url in self.urls_processadas:
+                    print(f"   ⏭️ {url} já processada (checkpoint)")
+                    if self.resultados['cnpq']:
+                        break
+                    continue
                 print(f"   Tentando: {url}")
-                self.driver.get(url)
-                time.sleep(2)
+                if not self.prazo.carregar(self.driver, url):
+                    print("   ⏰ Prazo esgotado, mantendo o que já foi extraído")
+                    break
+                self.prazo.dormir(2)
                 
                 # Verificar se carregou corretamente
                 if "O site não é seguro" in self.driver.title or "chrome-error" in self.driver.current_url:
@@ -195,6 +230,8 @@ class ScraperRapido:
                 seletores = ['h4', 'h3', 'h5', '.chamada', '.oportunidade', '.edital']
                 
                 for seletor in seletores:
+                    if self.prazo.esgotado():
+                        break
                     try:
                         elementos = self.driver.find_elements(By.CSS_SELECTOR, seletor)
                         
@@ -214,6 +251,7 @@ class ScraperRapido:
                                 # Verificar se já existe
                                 if not any(r['titulo'] == texto for r in self.resultados['cnpq']):
                                     self.resultados['cnpq'].append(resultado)
+                                    self.saida.escrever('cnpq', resultado)
                                     print(f"✅ CNPq: {texto[:50]}...")
                                 
                                 if len(self.resultados['cnpq']) >= 3:  # Limitar a 3
@@ -225,6 +263,8 @@ class ScraperRapido:
                     except Exception as e:
                         continue
                 
+                if not self.prazo.esgotado():
+                    self.urls_processadas.marcar(url)
                 if len(self.resultados['cnpq']) > 0:
                     break  # Se encontrou algo, para de tentar outras URLs
                     
@@ -234,16 +274,20 @@ class ScraperRapido:
         
         print(f"✅ CNPq: {len(self.resultados['cnpq'])} chamadas encontradas")
     
+    def receber_resultado(self, lista, resultado):
+        """Recebe um edital de um processo de fonte e grava no stream NDJSON"""
+        self.resultados[lista].append(resultado)
+        self.saida.escrever(lista, resultado)
+    
     def salvar_resultados(self):
         """Salva os resultados rapidamente"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nome_arquivo = f"editais_rapidos_{timestamp}.json"
-            
-            with open(nome_arquivo, 'w', encoding='utf-8') as f:
-                json.dump(self.resultados, f, ensure_ascii=False, indent=2)
+            # Fecha o stream NDJSON e gera o JSON formatado a partir dele
+            self.saida.finalizar(self.resultados)
+            dados, nome_arquivo = gerar_json_formatado(self.saida.caminho)
             
             print(f"💾 Resultados salvos em: {nome_arquivo}")
+            salvar_execucao('editais_rapidos', dados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -255,17 +299,22 @@ class ScraperRapido:
         print("🚀 INICIANDO EXTRAÇÃO RÁPIDA")
         print(f"⏰ Início: {datetime.now().strftime('%H:%M:%S')}")
         
-        if not self.configurar_navegador():
-            return False
-        
         try:
-            # ⚡ EXECUÇÃO RÁPIDA
-            self.extrair_ufmg_rapido()
-            self.extrair_fapemig_rapido()
-            self.extrair_cnpq_rapido()
+            # ⚡ EXECUÇÃO RÁPIDA: cada fonte em um processo com navegador e prazo próprios
+            checkpoint = Checkpoint('editais_rapidos')
+            _, situacao = executar_fontes_em_paralelo(ScraperRapido, {
+                'ufmg': 'extrair_ufmg_rapido',
+                'fapemig': 'extrair_fapemig_rapido',
+                'cnpq': 'extrair_cnpq_rapido'
+            }, ao_receber=self.receber_resultado, checkpoint=checkpoint)
+            self.resultados['situacao_fontes'] = situacao
+            # Fonte interrompida pelo prazo: o que chegou é salvo, marcado como parcial
+            self.resultados['parcial'] = bool(fontes_parciais(situacao))
             
             # Salvar resultados
             arquivo_salvo = self.salvar_resultados()
+            if arquivo_salvo and not self.resultados['parcial']:
+                checkpoint.limpar()
             
             # Resumo rápido
             total = len(self.resultados['ufmg']) + len(self.resultados['fapemig']) + len(self.resultados['cnpq'])
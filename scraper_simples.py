@@ -19,6 +19,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 
+from armazenamento import salvar_execucao
+
 class ScraperSimples:
     def __init__(self):
         self.driver = None
@@ -257,6 +259,7 @@ class ScraperSimples:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"\n💾 Resultados salvos em: {nome_arquivo}")
+            salvar_execucao('oportunidades', self.resultados, nome_arquivo)
             return nome_arquivo
         except Exception as e:
             print(f"❌ Erro ao salvar resultados: {e}")
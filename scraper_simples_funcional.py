@@ -14,6 +14,8 @@ from urllib.request import urlopen, Request
 from urllib.parse import urljoin
 from html.parser import HTMLParser
 
+from armazenamento import salvar_execucao
+
 class SimpleHTMLParser(HTMLParser):
     def __init__(self):
         super().__init__()
@@ -288,6 +290,7 @@ def salvar_resultados(resultados):
             json.dump(resultados, f, ensure_ascii=False, indent=2)
         
         print(f"✅ Resultados salvos em: {filename}")
+        salvar_execucao('dados_reais_simples', resultados, filename)
         return filename
         
     except Exception as e:
@@ -7,7 +7,6 @@ Versão que acessa os sites reais e extrai informações detalhadas
 de todas as fontes: FAPEMIG, UFMG e CNPq.
 """
 
-import time
 import json
 import re
 from datetime import datetime
@@ -20,6 +19,11 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import chromedriver_autoinstaller
 import os
 
+from armazenamento import salvar_execucao
+from execucao_paralela import executar_fontes_em_paralelo, fontes_parciais
+from prazos import prazo_da_etapa
+from checkpoints import Checkpoint
+
 class ScraperUnificadoReal:
     def __init__(self):
         self.driver = None
@@ -30,6 +34,8 @@ class ScraperUnificadoReal:
             'timestamp': datetime.now().isoformat()
         }
         self.wait = None
+        # Prazo da etapa; no processo de cada fonte é trocado pelo prazo da fonte
+        self.prazo = prazo_da_etapa()
         
     def configurar_navegador(self):
         """Configura o navegador Chrome para extração real"""
@@ -51,8 +57,8 @@ class ScraperUnificadoReal:
             options.add_argument('--allow-insecure-localhost')
             
             self.driver = webdriver.Chrome(options=options)
-            self.driver.implicitly_wait(15)
-            self.wait = WebDriverWait(self.driver, 20)
+            self.prazo.aplicar(self.driver, 15)
+            self.wait = WebDriverWait(self.driver, self.prazo.limitar(20))
             
             print("✅ Navegador configurado para extração real!")
             return True
@@ -66,8 +72,10 @@ class ScraperUnificadoReal:
         
         try:
             url = "http://www.fapemig.br/pt/chamadas_abertas_oportunidades_fapemig/"
-            self.driver.get(url)
-            time.sleep(8)  # Aguardar carregamento completo
+            if not self.prazo.carregar(self.driver, url):
+                print("⏰ FAPEMIG: prazo esgotado")
+                return
+            self.prazo.dormir(8)  # Aguardar carregamento completo
             
             print(f"   Título: {self.driver.title}")
             print(f"   URL atual: {self.driver.current_url}")
@@ -76,6 +84,9 @@ class ScraperUnificadoReal:
             chamadas = self.driver.find_elements(By.CSS_SELECTOR, 'h5')
             
             for chamada in chamadas:
+                if self.prazo.esgotado():
+                    print("⏰ FAPEMIG: prazo esgotado, mantendo as chamadas já extraídas")
+                    break
                 try:
                     texto = chamada.text.strip()
                     
@@ -165,8 +176,10 @@ class ScraperUnificadoReal:
         
         try:
             url = "https://www.ufmg.br/prograd/editais-chamadas/?o=aberto"
-            self.driver.get(url)
-            time.sleep(8)  # Aguardar carregamento completo
+            if not self.prazo.carregar(self.driver, url):
+                print("⏰ UFMG: prazo esgotado")
+                return
+            self.prazo.dormir(8)  # Aguardar carregamento completo
             
             print(f"   Título: {self.driver.title}")
             print(f"   URL atual: {self.driver.current_url}")
@@ -183,11 +196,16 @@ class ScraperUnificadoReal:
             editais_encontrados = []
             
             for seletor in seletores_teste:
+                if self.prazo.esgotado():
+                    print("⏰ UFMG: prazo esgotado, mantendo os editais já extraídos")
+                    break
                 try:
                     elementos = self.driver.find_elements(By.CSS_SELECTOR, seletor)
                     print(f"   Testando seletor '{seletor}': {len(elementos)} elementos")
                     
                     for elem in elementos:
+                        if self.prazo.esgotado():
+                            break
                         try:
                             texto = elem.text.strip()
                             
@@ -214,7 +232,7 @@ class ScraperUnificadoReal:
                     continue
             
             # Se não encontrou nada, tentar buscar por texto específico
-            if not editais_encontrados:
+            if not editais_encontrados and not self.prazo.esgotado():
                 print("   ⚠️  Nenhum edital encontrado, buscando por texto específico...")
                 self.buscar_editais_ufmg_por_texto()
             else:
@@ -293,6 +311,8 @@ class ScraperUnificadoReal:
         editais_encontrados = []
         
         for texto_busca in textos_editais:
+            if self.prazo.esgotado():
+                break
             try:
                 # Buscar por texto na página
                 elementos = self.driver.find_elements(By.XPATH, f"//*[contains(text(), '{texto_busca[:20]}')]")
@@ -381,6 +401,7 @@ class ScraperUnificadoReal:
                 json.dump(self.resultados, f, ensure_ascii=False, indent=2)
             
             print(f"💾 Resultados unificados salvos em: {nome_arquivo}")
+            salvar_execucao('scraper_unificado_real', self.resultados, nome_arquivo)
             return nome_arquivo
             
         except Exception as e:
@@ -392,21 +413,23 @@ class ScraperUnificadoReal:
         print("🚀 INICIANDO EXTRAÇÃO UNIFICADA REAL")
         print(f"⏰ Início: {datetime.now().strftime('%H:%M:%S')}")
         
-        if not self.configurar_navegador():
-            return False
-        
         try:
-            # Extrair FAPEMIG (site real)
-            self.extrair_fapemig_real()
-            
-            # Extrair UFMG (site real)
-            self.extrair_ufmg_real()
-            
-            # Extrair CNPq (fallback)
-            self.extrair_cnpq_fallback()
+            # FAPEMIG e UFMG (sites reais) e CNPq (fallback), cada um no seu processo
+            checkpoint = Checkpoint('scraper_unificado_real')
+            resultados, situacao = executar_fontes_em_paralelo(ScraperUnificadoReal, {
+                'fapemig': 'extrair_fapemig_real',
+                'ufmg': 'extrair_ufmg_real',
+                'cnpq': 'extrair_cnpq_fallback'
+            }, checkpoint=checkpoint)
+            for lista, registros in resultados.items():
+                self.resultados[lista] = registros
+            self.resultados['situacao_fontes'] = situacao
+            self.resultados['parcial'] = bool(fontes_parciais(situacao))
             
             # Salvar resultados
             arquivo_salvo = self.salvar_resultados()
+            if arquivo_salvo and not self.resultados['parcial']:
+                checkpoint.limpar()
             
             # Resumo
             total_fapemig = len(self.resultados['fapemig'])
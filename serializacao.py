@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+🔄 SERIALIZAÇÃO DOS DADOS ENTRE ETAPAS
+======================================
+
+As etapas (scraper → reorganização → relatório → email) passavam os dados por
+json.dump(indent=2) + json.load do arquivo inteiro, a codificação mais lenta e maior:
+✅ Formato interno compacto para as passagens entre etapas:
+   msgpack (binário) se instalado, senão JSON compacto via orjson, senão json da stdlib
+✅ JSON formatado (indent=2) só para os artefatos publicados
+✅ Leitura escolhe o decodificador pela extensão do arquivo
+✅ SCRAPER_SERIALIZADOR=msgpack|orjson|json força um formato
+✅ Comparação de desempenho: python benchmark_serializacao.py
+"""
+
+import os
+import json
+
+from importacao import preguicoso
+
+# Opcionais, carregados só quando um dado é codificado/decodificado com eles
+msgpack = preguicoso('msgpack')
+orjson = preguicoso('orjson')
+
+
+def _json_codificar(dados):
+    return json.dumps(dados, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_decodificar(conteudo):
+    return json.loads(conteudo)
+
+
+# nome -> (extensão do arquivo interno, codificar, decodificar); em ordem de preferência
+FORMATOS = {}
+if msgpack:
+    FORMATOS['msgpack'] = ('.msgpack', lambda dados: msgpack.packb(dados, use_bin_type=True),
+                           lambda conteudo: msgpack.unpackb(conteudo, raw=False))
+if orjson:
+    FORMATOS['orjson'] = ('.cjson', lambda dados: orjson.dumps(dados), lambda conteudo: orjson.loads(conteudo))
+FORMATOS['json'] = ('.cjson', _json_codificar, _json_decodificar)
+
+
+def formato_interno():
+    """Formato usado nas passagens entre etapas (o mais rápido disponível)"""
+    escolhido = os.getenv('SCRAPER_SERIALIZADOR')
+    if escolhido:
+        if escolhido not in FORMATOS:
+            print(f"⚠️ Serializador {escolhido} indisponível, usando {next(iter(FORMATOS))}")
+        else:
+            return escolhido
+    return next(iter(FORMATOS))
+
+
+def codificar(dados, formato=None):
+    """Dados -> bytes no formato interno"""
+    return FORMATOS[formato or formato_interno()][1](dados)
+
+
+def decodificar(conteudo, formato=None):
+    """Bytes no formato interno -> dados"""
+    return FORMATOS[formato or formato_interno()][2](conteudo)
+
+
+def caminho_interno(arquivo, formato=None):
+    """'resultado_X.json' -> 'resultado_X.msgpack' (ou '.cjson')"""
+    base = arquivo[:-len('.json')] if arquivo.endswith('.json') else arquivo
+    return base + FORMATOS[formato or formato_interno()][0]
+
+
+def salvar_interno(dados, arquivo, formato=None):
+    """Grava a cópia interna (compacta) de um artefato. Retorna o caminho gravado"""
+    formato = formato or formato_interno()
+    caminho = caminho_interno(arquivo, formato)
+    with open(caminho, 'wb') as f:
+        f.write(codificar(dados, formato))
+    return caminho
+
+
+def salvar_publicado(dados, caminho):
+    """Artefato publicado: JSON legível (indent=2, UTF-8)"""
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    return caminho
+
+
+def carregar_arquivo(caminho):
+    """Lê um artefato em qualquer formato, com o decodificador mais rápido disponível"""
+    with open(caminho, 'rb') as f:
+        conteudo = f.read()
+
+    if caminho.endswith('.msgpack'):
+        if 'msgpack' not in FORMATOS:
+            raise ValueError(f"{caminho}: msgpack não está instalado")
+        return decodificar(conteudo, 'msgpack')
+    # .json formatado e .cjson compacto: orjson se houver, senão json
+    return decodificar(conteudo, 'orjson' if 'orjson' in FORMATOS else 'json')
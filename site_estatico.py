@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+"""
+🗂️ SITE ESTÁTICO DO RELATÓRIO COM BUSCA NO NAVEGADOR
+====================================================
+
+O relatorio_completo_*.html é um arquivo só: com o histórico e mais agências fica
+pesado demais para abrir. Este modo escreve um site estático em DIRETORIO_SITE:
+✅ Páginas de índice por fonte, paginadas (POR_PAGINA chamadas cada)
+✅ Uma página por chamada (chamadas/<identificador>.html, estável entre execuções)
+✅ Índice de busca invertido (token -> ids) pré-calculado e dividido em fragmentos
+   JSON pelo hash do token: o navegador só baixa os fragmentos dos termos buscados
+✅ Títulos e links dos resultados em fragmentos por faixa de ids, também sob demanda
+✅ Arquivos iguais aos da execução anterior não são regravados; páginas de chamadas
+   que saíram do site são removidas
+✅ --historico inclui as chamadas que só aparecem no arquivo histórico
+
+Uso: python site_estatico.py [--historico] [--saida DIRETORIO]
+     (a busca usa fetch: sirva o diretório, ex. python -m http.server -d site_relatorio)
+"""
+
+import os
+import sys
+import json
+import math
+import hashlib
+from html import escape
+from datetime import datetime
+
+from renderizacao import ModeloCompilado
+from armazenamento import carregar_mais_recente
+from manifesto import registrar_artefato
+from deduplicacao import normalizar_texto, chave_canonica
+from modelos import Chamada
+from arquivo_historico import ArquivoHistorico
+from indice_historico import abrir_indice, etiqueta_situacao
+from gerar_relatorios_dados_reais import limpar_texto, FONTES_RELATORIO
+
+DIRETORIO_SITE = os.getenv('SCRAPER_SITE', 'site_relatorio')
+POR_PAGINA = 50
+# Pares (token, id) por fragmento do índice de busca: o número de fragmentos cresce com o site
+POSTAGENS_POR_FRAGMENTO = 20000
+DOCUMENTOS_POR_FRAGMENTO = 500
+TAMANHO_MINIMO_TOKEN = 2
+PALAVRAS_VAZIAS = ('a', 'ao', 'aos', 'as', 'com', 'da', 'das', 'de', 'do', 'dos', 'e', 'em',
+                   'na', 'nas', 'no', 'nos', 'o', 'os', 'para', 'por', 'um', 'uma')
+# Pastas inteiramente geradas aqui (arquivos que não foram escritos na execução são removidos)
+SUBDIRETORIOS = ('chamadas', 'fontes', 'busca')
+
+MODELOS = {nome: ModeloCompilado(texto) for nome, texto in {
+    'pagina': """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{titulo}</title>
+    <link rel="stylesheet" href="{raiz}estilo.css">
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1><a href="{raiz}index.html">🎯 Chamadas e Oportunidades</a></h1>
+            <form class="busca" action="{raiz}busca.html">
+                <input type="search" name="q" placeholder="Buscar chamadas (título, número...)">
+            </form>
+        </div>
+        <div class="content">
+{conteudo}
+        </div>
+        <div class="footer">
+            📋 Fontes: 🔬 <a href="http://www.cnpq.br/">CNPq</a> · 🏛️ <a href="http://www.fapemig.br/">FAPEMIG</a> · 🎓 <a href="https://www.ufmg.br/">UFMG</a>{rodape}
+        </div>
+    </div>{scripts}
+</body>
+</html>
+""",
+    'inicio': """            <div class="stats">
+                <div class="stat-item">
+                    <div class="stat-number">{total_geral}</div>
+                    <div class="stat-label">Total de Chamadas</div>
+                </div>
+{cartoes}            </div>
+""",
+    'cartao': """                <a class="stat-item {classe}" href="fontes/{chave}-1.html">
+                    <div class="stat-number">{total}</div>
+                    <div class="stat-label">{emoji} {sigla}</div>
+                </a>
+""",
+    'lista': """            <div class="fonte-header">
+                <h2>{emoji} {sigla} - {nome}</h2>
+                <div class="total">📊 {total} chamadas · página {pagina} de {paginas}</div>
+            </div>
+            <ol class="lista" start="{primeira}">
+{itens}            </ol>
+{navegacao}""",
+    'item': """                <li class="{classe}"><a href="../chamadas/{arquivo}.html">{titulo}</a>{etiqueta}<div class="resumo">{resumo}</div></li>
+""",
+    'chamada': """            <div class="chamada {classe}">
+                <h2>{titulo}{etiqueta}</h2>
+                <div class="meta">
+{itens}                </div>
+{descricao}                <p><a href="../fontes/{chave}-{pagina}.html">← {emoji} {sigla}, página {pagina}</a></p>
+            </div>
+""",
+    'meta_item': """                    <div class="meta-item">
+                        <div class="label">{rotulo}</div>
+                        <div class="value">{valor}</div>
+                    </div>
+""",
+    'busca': """            <div class="fonte-header">
+                <h2>🔎 Busca</h2>
+                <div class="total" id="situacao">Carregando...</div>
+            </div>
+            <ol class="lista" id="resultados"></ol>
+            <p><button id="mais" hidden>Mostrar mais</button></p>
+""",
+}.items()}
+
+ESTILO = """body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    margin: 0;
+    padding: 20px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: #333;
+}
+.container {
+    max-width: 1100px;
+    margin: 0 auto;
+    background: white;
+    border-radius: 15px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+.header {
+    background: linear-gradient(135deg, #2c3e50 0%, #3498db 100%);
+    color: white;
+    padding: 25px 30px;
+}
+.header h1 { margin: 0 0 15px 0; font-weight: 300; }
+.header h1 a { color: white; text-decoration: none; }
+.busca input { width: 100%; box-sizing: border-box; padding: 10px 15px; border: 0; border-radius: 8px; font-size: 1.1em; }
+.stats { text-align: center; }
+.stat-item {
+    display: inline-block;
+    margin: 10px;
+    padding: 15px 25px;
+    background: #f8f9fa;
+    border-radius: 10px;
+    border-bottom: 4px solid #3498db;
+    color: inherit;
+    text-decoration: none;
+}
+.stat-number { font-size: 2em; font-weight: bold; color: #3498db; }
+.stat-label { color: #666; font-size: 0.9em; }
+.content { padding: 30px; }
+.fonte-header {
+    background: linear-gradient(135deg, #34495e 0%, #2c3e50 100%);
+    color: white;
+    padding: 20px;
+    border-radius: 10px;
+    margin-bottom: 20px;
+}
+.fonte-header h2 { margin: 0; }
+.fonte-header .total { opacity: 0.9; margin-top: 5px; }
+.lista li { margin: 10px 0; padding: 10px 15px; background: #f8f9fa; border-left: 5px solid #3498db; border-radius: 6px; }
+.lista a { color: #2c3e50; font-weight: 600; text-decoration: none; }
+.resumo { color: #666; font-size: 0.9em; margin-top: 4px; }
+.paginas { text-align: center; margin: 20px 0; }
+.paginas a, .paginas span { display: inline-block; margin: 2px; padding: 6px 12px; border-radius: 6px; background: #f8f9fa; }
+.paginas span { background: #3498db; color: white; }
+.chamada { background: #f8f9fa; padding: 25px; border-radius: 10px; border-left: 5px solid #3498db; }
+.chamada h2 { margin-top: 0; color: #2c3e50; }
+.meta { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 15px 0; }
+.meta-item { background: white; padding: 10px 15px; border-radius: 8px; border: 1px solid #e9ecef; }
+.meta-item .label { font-weight: bold; color: #666; font-size: 0.8em; text-transform: uppercase; }
+.meta-item .value { color: #2c3e50; margin-top: 5px; word-break: break-word; }
+.footer { background: #2c3e50; color: white; text-align: center; padding: 20px; font-size: 0.9em; }
+.footer a { color: #3498db; }
+.cnpq { border-left-color: #e67e22 !important; border-bottom-color: #e67e22 !important; }
+.fapemig { border-left-color: #9b59b6 !important; border-bottom-color: #9b59b6 !important; }
+.ufmg { border-left-color: #27ae60 !important; border-bottom-color: #27ae60 !important; }
+"""
+
+# Mesmas regras de tokens_de() e hash_token(); lê as palavras vazias de busca/meta.json
+SCRIPT_BUSCA = """// Busca do site: só os fragmentos do índice com os termos digitados são baixados
+(function () {
+    'use strict';
+    var POR_VEZ = 50;
+    var baixados = {};
+
+    function baixar(url) {
+        if (!(url in baixados)) {
+            baixados[url] = fetch(url).then(function (resposta) {
+                if (!resposta.ok) throw new Error(url + ': HTTP ' + resposta.status);
+                return resposta.json();
+            });
+        }
+        return baixados[url];
+    }
+
+    // FNV-1a de 32 bits, igual a hash_token() em site_estatico.py (os tokens são ASCII)
+    function hashToken(token) {
+        var h = 0x811c9dc5;
+        for (var i = 0; i < token.length; i++) {
+            h ^= token.charCodeAt(i);
+            h = Math.imul(h, 0x01000193);
+        }
+        return h >>> 0;
+    }
+
+    function tokens(texto, meta) {
+        var normalizado = texto.normalize('NFKD').replace(/\\p{M}/gu, '').toLowerCase()
+            .replace(/[^a-z0-9]+/g, ' ').trim();
+        var vistos = [];
+        normalizado.split(' ').forEach(function (token) {
+            if (/^[0-9]+$/.test(token)) token = token.replace(/^0+(?=.)/, '');
+            else if (token.length < meta.tamanho_minimo_token) return;
+            if (token && meta.palavras_vazias.indexOf(token) < 0 && vistos.indexOf(token) < 0) vistos.push(token);
+        });
+        return vistos;
+    }
+
+    function idsDoToken(token, meta) {
+        var fragmento = hashToken(token) % meta.fragmentos;
+        return baixar('busca/indice-' + fragmento + '.json?v=' + meta.versao).then(function (indice) {
+            var ids = [], atual = 0;
+            (indice[token] || []).forEach(function (delta) { atual += delta; ids.push(atual); });
+            return ids;
+        });
+    }
+
+    function intersecao(listas) {
+        listas.sort(function (a, b) { return a.length - b.length; });
+        var conjuntos = listas.slice(1).map(function (ids) { return new Set(ids); });
+        return listas[0].filter(function (id) {
+            return conjuntos.every(function (conjunto) { return conjunto.has(id); });
+        });
+    }
+
+    function documentos(ids, meta) {
+        return Promise.all(ids.map(function (id) {
+            var fragmento = Math.floor(id / meta.documentos_por_fragmento);
+            return baixar('busca/docs-' + fragmento + '.json?v=' + meta.versao).then(function (docs) {
+                return docs[id - fragmento * meta.documentos_por_fragmento];
+            });
+        }));
+    }
+
+    var lista = document.getElementById('resultados');
+    var situacao = document.getElementById('situacao');
+    var mais = document.getElementById('mais');
+    var consulta = new URLSearchParams(location.search).get('q') || '';
+    document.querySelector('.busca input').value = consulta;
+
+    // documento: [título, sigla, prazo, arquivo, etiqueta, classe]
+    function adicionar(documento) {
+        var item = document.createElement('li');
+        item.className = documento[5];
+        var link = document.createElement('a');
+        link.href = 'chamadas/' + documento[3] + '.html';
+        link.textContent = documento[0];
+        var resumo = document.createElement('div');
+        resumo.className = 'resumo';
+        resumo.textContent = documento[1] + (documento[2] ? ' · ⏰ ' + documento[2] : '');
+        item.appendChild(link);
+        item.appendChild(document.createTextNode(documento[4]));
+        item.appendChild(resumo);
+        lista.appendChild(item);
+    }
+
+    if (!consulta.trim()) {
+        situacao.textContent = 'Digite um termo para buscar.';
+        return;
+    }
+    fetch('busca/meta.json', {cache: 'no-cache'}).then(function (resposta) {
+        return resposta.json();
+    }).then(function (meta) {
+        var termos = tokens(consulta, meta);
+        if (!termos.length) {
+            situacao.textContent = 'Nenhum termo pesquisável em "' + consulta + '".';
+            return;
+        }
+        return Promise.all(termos.map(function (termo) { return idsDoToken(termo, meta); })).then(function (listas) {
+            var ids = intersecao(listas);
+            var exibidos = 0;
+            situacao.textContent = '📊 ' + ids.length + ' chamada(s) para "' + consulta + '"';
+            function exibir() {
+                var lote = ids.slice(exibidos, exibidos + POR_VEZ);
+                exibidos += lote.length;
+                mais.hidden = exibidos >= ids.length;
+                return documentos(lote, meta).then(function (docs) { docs.forEach(adicionar); });
+            }
+            mais.onclick = exibir;
+            return exibir();
+        });
+    }).catch(function (erro) {
+        situacao.textContent = '❌ Erro na busca: ' + erro.message;
+    });
+})();
+"""
+
+
+def hash_token(token):
+    """FNV-1a de 32 bits (o mesmo do busca.js): escolhe o fragmento do índice de um token"""
+    valor = 0x811c9dc5
+    for byte in token.encode('utf-8'):
+        valor = ((valor ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return valor
+
+
+def tokens_de(texto):
+    """Tokens pesquisáveis: texto normalizado, sem palavras vazias; '011' e '11' são o mesmo número"""
+    tokens = set()
+    for token in normalizar_texto(texto).split():
+        if token.isdigit():
+            token = token.lstrip('0') or '0'
+        elif len(token) < TAMANHO_MINIMO_TOKEN:
+            continue
+        if token not in PALAVRAS_VAZIAS:
+            tokens.add(token)
+    return tokens
+
+
+def identificador_pagina(registro, sigla):
+    """Nome da página da chamada: hash da identidade canônica, o mesmo enquanto a chamada existir"""
+    identidade = json.dumps(chave_canonica(registro, sigla), ensure_ascii=False)
+    return hashlib.sha1(identidade.encode('utf-8')).hexdigest()[:12]
+
+
+def chamadas_do_site(chamadas_por_fonte, historico=None):
+    """{chave da fonte: [(registro, vista_em)]}: as chamadas atuais (vista_em None) na ordem do
+    relatório e, com 'historico' (ArquivoHistorico), as que só existem em execuções anteriores,
+    da vista mais recentemente para a mais antiga"""
+    site = {}
+    for chave, sigla, *_ in FONTES_RELATORIO:
+        atuais = chamadas_por_fonte.get(chave) or []
+        vistas = {chave_canonica(registro, sigla) for registro in atuais}
+        anteriores = {}
+        if historico is not None:
+            for entrada, registro in historico.consultar(fonte=sigla):
+                identidade = chave_canonica(registro, sigla)
+                if identidade in vistas:
+                    continue
+                # A versão da execução mais recente prevalece
+                if identidade not in anteriores or entrada['data'] >= anteriores[identidade][1]:
+                    anteriores[identidade] = (registro, entrada['data'])
+        site[chave] = ([(registro, None) for registro in atuais]
+                       + sorted(anteriores.values(), key=lambda item: item[1], reverse=True))
+    return site
+
+
+class EscritorSite:
+    """Grava os arquivos sob 'diretorio' pulando os que não mudaram (o deploy só envia o que
+    mudou) e, no fim, remove dos SUBDIRETORIOS o que não foi escrito nesta execução"""
+
+    def __init__(self, diretorio):
+        self.diretorio = diretorio
+        self.escritos = set()
+        self.gravados = 0
+        self.iguais = 0
+
+    def gravar(self, caminho_relativo, texto):
+        caminho = os.path.normpath(os.path.join(self.diretorio, caminho_relativo))
+        dados = texto.encode('utf-8')
+        self.escritos.add(caminho)
+        try:
+            with open(caminho, 'rb') as arquivo:
+                if arquivo.read() == dados:
+                    self.iguais += 1
+                    return
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(dados)
+        self.gravados += 1
+
+    def limpar(self):
+        removidos = 0
+        for subdiretorio in SUBDIRETORIOS:
+            pasta = os.path.join(self.diretorio, subdiretorio)
+            if not os.path.isdir(pasta):
+                continue
+            for nome in os.listdir(pasta):
+                caminho = os.path.normpath(os.path.join(pasta, nome))
+                if caminho not in self.escritos and os.path.isfile(caminho):
+                    os.remove(caminho)
+                    removidos += 1
+        return removidos
+
+
+def _pagina(titulo, conteudo, raiz='', rodape='', scripts=''):
+    return MODELOS['pagina'].renderizar({'titulo': escape(titulo), 'conteudo': conteudo, 'raiz': raiz,
+                                         'rodape': rodape, 'scripts': scripts})
+
+
+def _navegacao(chave, pagina, paginas):
+    if paginas == 1:
+        return ''
+    links = []
+    for numero in range(1, paginas + 1):
+        # Primeira, última e as vizinhas da atual; o resto vira '…'
+        if numero in (1, paginas) or abs(numero - pagina) <= 2:
+            links.append(f"<span>{numero}</span>" if numero == pagina
+                         else f'<a href="{chave}-{numero}.html">{numero}</a>')
+        elif links[-1] != '…':
+            links.append('…')
+    return f'            <nav class="paginas">{" ".join(links)}</nav>\n'
+
+
+def _pagina_da_chamada(chamada, valores):
+    itens = []
+    for rotulo, valor in (('Número', f"🔢 {chamada.numero}" if chamada.numero else ''),
+                          ('Prazo Final', f"⏰ {chamada.periodo}" if chamada.periodo else ''),
+                          ('Status', chamada.status),
+                          ('Coletada em', chamada.data_coleta[:10])):
+        if valor:
+            itens.append(MODELOS['meta_item'].renderizar({'rotulo': rotulo, 'valor': escape(valor)}))
+    for rotulo, link in (('Link', chamada.link), ('Link alternativo', chamada.link_alternativo)):
+        if link:
+            valor = f'🔗 <a href="{escape(link)}" target="_blank">{escape(link)}</a>'
+            itens.append(MODELOS['meta_item'].renderizar({'rotulo': rotulo, 'valor': valor}))
+    for anexo in chamada.anexos:
+        if anexo.url:
+            valor = f'📄 <a href="{escape(anexo.url)}" target="_blank">{escape(anexo.nome or anexo.url)}</a>'
+            itens.append(MODELOS['meta_item'].renderizar({'rotulo': 'Anexo', 'valor': valor}))
+
+    descricao = limpar_texto(chamada.descricao)
+    conteudo = MODELOS['chamada'].renderizar(dict(
+        valores,
+        itens=''.join(itens),
+        descricao=f"                <p>{escape(descricao)}</p>\n" if descricao else ''
+    ))
+    return _pagina(valores['titulo_puro'], conteudo, raiz='../')
+
+
+def escrever_indice_busca(escritor, postagens, documentos):
+    """busca/indice-<k>.json ({token: ids em deltas}), busca/docs-<k>.json e busca/meta.json.
+    Retorna o número de fragmentos do índice"""
+    total_postagens = sum(len(ids) for ids in postagens.values())
+    fragmentos = max(1, math.ceil(total_postagens / POSTAGENS_POR_FRAGMENTO))
+    divididos = [{} for _ in range(fragmentos)]
+    for token in sorted(postagens):
+        ids = postagens[token]
+        # ids crescentes: as diferenças são números pequenos e o JSON fica compacto
+        divididos[hash_token(token) % fragmentos][token] = [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+
+    compacto = {'ensure_ascii': False, 'separators': (',', ':')}
+    arquivos = [(f"busca/indice-{k}.json", json.dumps(fragmento, **compacto))
+                for k, fragmento in enumerate(divididos)]
+    arquivos += [(f"busca/docs-{k // DOCUMENTOS_POR_FRAGMENTO}.json",
+                  json.dumps(documentos[k:k + DOCUMENTOS_POR_FRAGMENTO], **compacto))
+                 for k in range(0, len(documentos), DOCUMENTOS_POR_FRAGMENTO)]
+
+    # A versão entra na URL dos fragmentos: o navegador não usa um fragmento velho do cache
+    versao = hashlib.sha1(''.join(texto for _, texto in arquivos).encode('utf-8')).hexdigest()[:12]
+    for caminho, texto in arquivos:
+        escritor.gravar(caminho, texto)
+    escritor.gravar('busca/meta.json', json.dumps({
+        'versao': versao,
+        'fragmentos': fragmentos,
+        'documentos_por_fragmento': DOCUMENTOS_POR_FRAGMENTO,
+        'tamanho_minimo_token': TAMANHO_MINIMO_TOKEN,
+        'palavras_vazias': list(PALAVRAS_VAZIAS),
+        'total': len(documentos),
+    }, **compacto))
+    return fragmentos
+
+
+def gerar_site(chamadas_por_fonte, diretorio=DIRETORIO_SITE, indice=None, historico=None):
+    """Escreve o site estático em 'diretorio' a partir de {'cnpq'|'fapemig'|'ufmg': [registros]}.
+    Com 'historico' (ArquivoHistorico) inclui as chamadas de execuções anteriores. Retorna um resumo"""
+    agora = datetime.now()
+    escritor = EscritorSite(diretorio)
+    postagens = {}
+    documentos = []
+    cartoes = []
+    paginas_escritas = 0
+    site = chamadas_do_site(chamadas_por_fonte, historico)
+
+    for chave, sigla, emoji, nome, classe in FONTES_RELATORIO:
+        chamadas = site[chave]
+        if not chamadas:
+            continue
+
+        paginas = math.ceil(len(chamadas) / POR_PAGINA)
+        arquivos_usados = {}
+        itens = []
+        for posicao, (registro, vista_em) in enumerate(chamadas):
+            chamada = Chamada.from_dict(registro, fonte=sigla)
+            pagina = posicao // POR_PAGINA + 1
+            titulo = limpar_texto(chamada.titulo) or 'Chamada sem título'
+            if vista_em is None:
+                etiqueta = etiqueta_situacao(indice, registro, sigla)
+            else:
+                etiqueta = f" 📜 (vista até {datetime.fromisoformat(vista_em[:19]).strftime('%d/%m/%Y')})"
+
+            # Registros repetidos na mesma lista ganham um sufixo em vez de sobrescrever a página
+            arquivo = identificador_pagina(registro, sigla)
+            arquivos_usados[arquivo] = arquivos_usados.get(arquivo, 0) + 1
+            if arquivos_usados[arquivo] > 1:
+                arquivo = f"{arquivo}-{arquivos_usados[arquivo]}"
+
+            valores = {'chave': chave, 'sigla': sigla, 'emoji': emoji, 'classe': classe, 'pagina': pagina,
+                       'arquivo': arquivo, 'titulo': escape(titulo), 'titulo_puro': titulo,
+                       'etiqueta': escape(etiqueta)}
+            escritor.gravar(f"chamadas/{arquivo}.html", _pagina_da_chamada(chamada, valores))
+
+            resumo = ' · '.join(parte for parte in (f"🔢 {chamada.numero}" if chamada.numero else '',
+                                                    f"⏰ {chamada.periodo}" if chamada.periodo else '') if parte)
+            itens.append(MODELOS['item'].renderizar(dict(valores, resumo=escape(resumo))))
+
+            identificador = len(documentos)
+            for token in tokens_de(' '.join((titulo, chamada.numero, sigla, limpar_texto(chamada.descricao)))):
+                postagens.setdefault(token, []).append(identificador)
+            documentos.append([titulo, f"{emoji} {sigla}", chamada.periodo, arquivo, etiqueta, classe])
+
+            # Página da lista completa (ou a última): escrita e descartada, a memória não acumula as listas
+            if len(itens) == POR_PAGINA or posicao == len(chamadas) - 1:
+                conteudo = MODELOS['lista'].renderizar({
+                    'emoji': emoji, 'sigla': sigla, 'nome': nome, 'total': len(chamadas),
+                    'pagina': pagina, 'paginas': paginas, 'primeira': (pagina - 1) * POR_PAGINA + 1,
+                    'itens': ''.join(itens), 'navegacao': _navegacao(chave, pagina, paginas)
+                })
+                escritor.gravar(f"fontes/{chave}-{pagina}.html",
+                                _pagina(f"{sigla} - página {pagina} de {paginas}", conteudo, raiz='../'))
+                paginas_escritas += 1
+                itens = []
+
+        cartoes.append(MODELOS['cartao'].renderizar({'classe': classe, 'chave': chave, 'total': len(chamadas),
+                                                     'emoji': emoji, 'sigla': sigla}))
+
+    fragmentos = escrever_indice_busca(escritor, postagens, documentos)
+    escritor.gravar('estilo.css', ESTILO)
+    escritor.gravar('busca.js', SCRIPT_BUSCA)
+    escritor.gravar('busca.html', _pagina('Busca de chamadas', MODELOS['busca'].renderizar({}),
+                                          scripts='\n    <script src="busca.js"></script>'))
+    # Só a página inicial tem a data: as demais ficam iguais enquanto as chamadas não mudarem
+    escritor.gravar('index.html', _pagina(
+        'Relatório de Chamadas e Oportunidades',
+        MODELOS['inicio'].renderizar({'total_geral': len(documentos), 'cartoes': ''.join(cartoes)}),
+        rodape=f"<br>\n            📅 Gerado em: {agora.strftime('%d/%m/%Y às %H:%M')}"
+    ))
+
+    return {
+        'chamadas': len(documentos),
+        'paginas': paginas_escritas,
+        'fragmentos': fragmentos,
+        'tokens': len(postagens),
+        'gravados': escritor.gravados,
+        'iguais': escritor.iguais,
+        'removidos': escritor.limpar(),
+    }
+
+
+def main():
+    print("🗂️ SITE ESTÁTICO DO RELATÓRIO")
+    print("=" * 50)
+
+    argumentos = sys.argv[1:]
+    diretorio = argumentos[argumentos.index('--saida') + 1] if '--saida' in argumentos else DIRETORIO_SITE
+
+    dados, origem = carregar_mais_recente('dados_reais_simples')
+    if dados is None:
+        print("❌ Arquivo de dados não encontrado!")
+        print("💡 Execute primeiro o scraper para obter dados reais")
+        return 1
+    print(f"✅ Dados carregados de {origem}")
+
+    historico = ArquivoHistorico() if '--historico' in argumentos else None
+    resumo = gerar_site(dados, diretorio, abrir_indice(), historico)
+    registrar_artefato('site_relatorio', os.path.join(diretorio, 'index.html'), registros=resumo['chamadas'])
+
+    print(f"✅ Site em {diretorio}/: {resumo['chamadas']} chamadas em {resumo['paginas']} página(s) de índice")
+    print(f"🔎 Busca: {resumo['tokens']} termos em {resumo['fragmentos']} fragmento(s)")
+    print(f"💾 {resumo['gravados']} arquivo(s) gravado(s), {resumo['iguais']} sem mudança, "
+          f"{resumo['removidos']} removido(s)")
+    print(f"💡 Para navegar: python -m http.server -d {diretorio}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
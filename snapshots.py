@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+📸 SNAPSHOTS INCREMENTAIS ENTRE EXECUÇÕES
+=========================================
+
+Cada execução salvava de novo o conjunto inteiro de chamadas, mesmo sem mudança.
+Aqui cada execução guarda só o que mudou em relação à anterior:
+✅ Hash de conteúdo estável por chamada (ignora campos voláteis como data_coleta)
+✅ Delta com adicionadas, alteradas e removidas
+✅ Título alterado (quase-duplicata SimHash) vira "alterada", não remoção + adição
+✅ Snapshot completo a cada INTERVALO_COMPLETO execuções limita o replay
+✅ Reconstrução do estado completo de qualquer execução passada, na ordem original
+   dos registros e dos campos (cada snapshot guarda a ordem das chaves)
+"""
+
+import os
+import sys
+import json
+import hashlib
+from datetime import datetime
+
+from deduplicacao import CAMPOS_VOLATEIS, chave_canonica, mesma_chamada, texto_do_registro
+from modelos import CHAVES_LISTAS
+from quase_duplicatas import IndiceQuaseDuplicatas
+
+DIRETORIO_PADRAO = os.getenv('SCRAPER_SNAPSHOTS', 'snapshots')
+INTERVALO_COMPLETO = 30
+
+
+def hash_conteudo(registro):
+    """SHA-256 do registro em JSON canônico, sem os campos voláteis"""
+    estavel = {chave: valor for chave, valor in registro.items() if chave not in CAMPOS_VOLATEIS}
+    texto = json.dumps(estavel, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def estado_de_dados(dados):
+    """Divide o JSON de uma execução em registros por chave e metadados
+
+    A chave é 'lista|fonte|número|hash do título'; registros repetidos na mesma
+    lista recebem um sufixo '#2', '#3'...
+    """
+    registros = {}
+    metadados = {}
+    itens = {'': dados} if isinstance(dados, list) else dados
+
+    for nome, valor in itens.items():
+        if (nome in CHAVES_LISTAS or nome == '') and isinstance(valor, list) and valor \
+                and all(isinstance(item, dict) for item in valor):
+            fonte = CHAVES_LISTAS.get(nome)
+            for registro in valor:
+                chave = f"{nome}|" + '|'.join(chave_canonica(registro, fonte.value if fonte else None))
+                base, repeticao = chave, 1
+                while chave in registros:
+                    repeticao += 1
+                    chave = f"{base}#{repeticao}"
+                registros[chave] = registro
+        else:
+            metadados[nome] = valor
+
+    return registros, metadados
+
+
+def dados_de_estado(registros, metadados, campos=None):
+    """Monta de volta o JSON da execução a partir dos registros e metadados
+
+    campos: ordem dos campos do JSON original (listas e metadados intercalados)
+    """
+    if list(metadados) == [] and all(chave.startswith('|') for chave in registros):
+        return list(registros.values())
+
+    listas = {}
+    for chave, registro in registros.items():
+        listas.setdefault(chave.split('|', 1)[0], []).append(registro)
+
+    dados = {}
+    for nome in list(campos or []) + list(metadados) + list(listas):
+        if nome in dados:
+            continue
+        if nome in metadados:
+            dados[nome] = metadados[nome]
+        elif nome in listas:
+            dados[nome] = listas[nome]
+    return dados
+
+
+def campos_de_dados(dados):
+    """Ordem dos campos do JSON de uma execução (vazia para uma lista solta)"""
+    return list(dados) if isinstance(dados, dict) else []
+
+
+def ordenar(registros, ordem):
+    """Estado {chave: registro} na ordem de chaves gravada no snapshot"""
+    if not ordem:
+        return registros
+    ordenados = {chave: registros[chave] for chave in ordem if chave in registros}
+    ordenados.update((chave, registro) for chave, registro in registros.items() if chave not in ordenados)
+    return ordenados
+
+
+def calcular_delta(anteriores, atuais):
+    """Delta entre dois estados {chave: registro}"""
+    hashes_anteriores = {chave: hash_conteudo(registro) for chave, registro in anteriores.items()}
+
+    adicionados = {}
+    alterados = {}
+    for chave, registro in atuais.items():
+        if chave not in anteriores:
+            adicionados[chave] = registro
+        elif hash_conteudo(registro) != hashes_anteriores[chave]:
+            alterados[chave] = registro
+    removidos = [chave for chave in anteriores if chave not in atuais]
+
+    # Título/número reescritos mudam a chave: pareia removidas e adicionadas quase-duplicadas
+    renomeados = {}
+    if removidos and adicionados:
+        similares = IndiceQuaseDuplicatas()
+        for chave in removidos:
+            similares.adicionar(chave, texto_do_registro(anteriores[chave]))
+        for chave, registro in list(adicionados.items()):
+            lista = chave.split('|', 1)[0]
+            for chave_antiga, _ in similares.candidatos(texto_do_registro(registro)):
+                if chave_antiga in renomeados.values() or not chave_antiga.startswith(f"{lista}|"):
+                    continue
+                if mesma_chamada(anteriores[chave_antiga], registro):
+                    renomeados[chave] = chave_antiga
+                    alterados[chave] = adicionados.pop(chave)
+                    break
+        removidos = [chave for chave in removidos if chave not in renomeados.values()]
+
+    return {
+        'adicionados': adicionados,
+        'alterados': alterados,
+        'removidos': removidos,
+        'renomeados': renomeados
+    }
+
+
+def aplicar_delta(registros, delta):
+    """Aplica um delta a um estado {chave: registro}, preservando a ordem"""
+    antigas = {antiga: nova for nova, antiga in delta.get('renomeados', {}).items()}
+    removidos = set(delta.get('removidos', []))
+    alterados = delta.get('alterados', {})
+
+    novo = {}
+    for chave, registro in registros.items():
+        if chave in removidos:
+            continue
+        chave = antigas.get(chave, chave)
+        novo[chave] = alterados.get(chave, registro)
+    novo.update(delta.get('adicionados', {}))
+    return novo
+
+
+class RepositorioSnapshots:
+    """Diretório com um arquivo por execução: snapshots/<tipo>/<seq>_<timestamp>.json"""
+
+    def __init__(self, diretorio=DIRETORIO_PADRAO, intervalo_completo=INTERVALO_COMPLETO):
+        self.diretorio = diretorio
+        self.intervalo_completo = intervalo_completo
+
+    def _pasta(self, tipo):
+        return os.path.join(self.diretorio, tipo)
+
+    def listar(self, tipo):
+        """[(seq, caminho)] das execuções registradas de um tipo, em ordem"""
+        pasta = self._pasta(tipo)
+        if not os.path.isdir(pasta):
+            return []
+        execucoes = []
+        for nome in os.listdir(pasta):
+            if nome.endswith('.json') and nome.split('_', 1)[0].isdigit():
+                execucoes.append((int(nome.split('_', 1)[0]), os.path.join(pasta, nome)))
+        return sorted(execucoes)
+
+    def _ler(self, caminho):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def estado(self, tipo, seq=None):
+        """(registros, metadados) da execução 'seq' (padrão: a última)"""
+        registros, metadados, _ = self._estado(tipo, seq)
+        return registros, metadados
+
+    def _estado(self, tipo, seq=None):
+        execucoes = self.listar(tipo)
+        if seq is not None:
+            execucoes = [(s, c) for s, c in execucoes if s <= seq]
+        if not execucoes:
+            return {}, {}, []
+
+        # Começa do snapshot completo mais recente e aplica os deltas seguintes
+        inicio = 0
+        for posicao, (_, caminho) in enumerate(execucoes):
+            if caminho.endswith('_completo.json'):
+                inicio = posicao
+
+        registros = {}
+        metadados = {}
+        for _, caminho in execucoes[inicio:]:
+            snapshot = self._ler(caminho)
+            if snapshot.get('completo'):
+                registros = snapshot['registros']
+            else:
+                registros = aplicar_delta(registros, snapshot)
+            # Snapshots antigos não têm 'ordem': ficam com a ordem do aplicar_delta
+            registros = ordenar(registros, snapshot.get('ordem'))
+            metadados = snapshot['metadados']
+        return registros, metadados, snapshot.get('campos', [])
+
+    def reconstruir(self, tipo, seq=None):
+        """JSON completo da execução 'seq' (padrão: a última), como foi salvo pelo script"""
+        return dados_de_estado(*self._estado(tipo, seq))
+
+    def registrar(self, tipo, dados):
+        """Grava o delta da execução em relação à anterior. Retorna um resumo"""
+        os.makedirs(self._pasta(tipo), exist_ok=True)
+        execucoes = self.listar(tipo)
+        seq = execucoes[-1][0] + 1 if execucoes else 1
+        completo = (seq - 1) % self.intervalo_completo == 0
+
+        anteriores, _ = self.estado(tipo)
+        atuais, metadados = estado_de_dados(dados)
+        delta = calcular_delta(anteriores, atuais)
+
+        resumo = {campo: len(delta[campo]) for campo in ('adicionados', 'alterados', 'removidos')}
+        gravados = atuais if completo else {**delta['adicionados'], **delta['alterados']}
+
+        snapshot = {
+            'seq': seq,
+            'tipo': tipo,
+            'criado_em': datetime.now().isoformat(),
+            'completo': completo,
+            'resumo': resumo,
+            'metadados': metadados,
+            'campos': campos_de_dados(dados),
+            'ordem': list(atuais),
+            'hashes': {chave: hash_conteudo(registro) for chave, registro in gravados.items()}
+        }
+        # O snapshot completo já traz todos os registros; os demais só o delta
+        if completo:
+            snapshot['registros'] = atuais
+        else:
+            snapshot.update(delta)
+
+        sufixo = '_completo' if completo else ''
+        nome = f"{seq:06d}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{sufixo}.json"
+        caminho = os.path.join(self._pasta(tipo), nome)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+
+        return {'seq': seq, 'caminho': caminho, 'completo': completo, **resumo}
+
+
+def registrar_snapshot(tipo, dados, diretorio=DIRETORIO_PADRAO):
+    """Registra o delta da execução sem interromper o script em caso de erro"""
+    try:
+        resumo = RepositorioSnapshots(diretorio).registrar(tipo, dados)
+        print(f"📸 Snapshot {resumo['seq']} de {tipo}: +{resumo['adicionados']} "
+              f"~{resumo['alterados']} -{resumo['removidos']}")
+        return resumo
+    except Exception as e:
+        print(f"❌ Erro ao registrar snapshot: {e}")
+        return None
+
+
+def main():
+    """Uso: python snapshots.py <tipo> [seq] — reconstrói a execução e salva em JSON"""
+    print("📸 RECONSTRUÇÃO DE SNAPSHOT")
+    print("=" * 50)
+
+    if len(sys.argv) < 2:
+        print("💡 Uso: python snapshots.py <tipo> [seq]")
+        return
+
+    tipo = sys.argv[1]
+    seq = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    repositorio = RepositorioSnapshots()
+    execucoes = repositorio.listar(tipo)
+    if not execucoes:
+        print(f"❌ Nenhum snapshot de {tipo} em {repositorio.diretorio}")
+        return
+
+    seq = seq or execucoes[-1][0]
+    dados = repositorio.reconstruir(tipo, seq)
+    nome_arquivo = f"{tipo}_snapshot_{seq:06d}.json"
+    with open(nome_arquivo, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ Execução {seq} de {tipo} reconstruída ({len(execucoes)} snapshots disponíveis)")
+    print(f"💾 Resultado salvo em: {nome_arquivo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+👀 VIGIA DAS FONTES COM INTERVALO ADAPTATIVO
+===========================================
+
+O cron roda uma vez por dia (08:00 UTC): uma chamada publicada às 09:00 só era
+vista ~23h depois, e rodar o Selenium completo várias vezes por dia seria
+desperdício:
+✅ Processo de longa duração que verifica cada fonte no seu próprio intervalo
+✅ Sonda barata: HEAD (ETag/Last-Modified) e, se precisar, hash do texto da página
+✅ Coleta completa (coletar.py <fonte>) só quando a sonda detecta mudança
+✅ Intervalo aprendido com a frequência real de mudanças de cada fonte (média
+   móvel), com recuo exponencial enquanto nada muda
+✅ Jitter nos horários e horário de silêncio (SCRAPER_SILENCIO=22-6, horário de Brasília)
+✅ Estado em .vigia/estado.json, preservado entre reinícios
+
+Uso: python vigia.py [--uma-vez] [--estado]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import signal
+import hashlib
+import subprocess
+from datetime import datetime, timedelta, timezone
+from urllib.request import urlopen, Request
+from urllib.error import HTTPError
+
+# Fontes vigiadas: página de listagem que a coleta lê
+FONTES = {
+    'ufmg': 'https://www.ufmg.br/prograd/editais-chamadas/',
+    'fapemig': 'https://fapemig.br/pt/chamadas_abertas_oportunidades_fapemig/',
+    'cnpq': 'http://memoria2.cnpq.br/web/guest/chamadas-publicas',
+}
+
+CAMINHO_ESTADO = os.path.join(os.getenv('SCRAPER_VIGIA', '.vigia'), 'estado.json')
+INTERVALO_INICIAL = 3600
+INTERVALO_MINIMO = float(os.getenv('SCRAPER_VIGIA_MINIMO', 15 * 60))
+INTERVALO_MAXIMO = float(os.getenv('SCRAPER_VIGIA_MAXIMO', 12 * 3600))
+# Verifica ~4 vezes dentro do intervalo médio entre mudanças da fonte
+FRACAO_DA_MEDIA = 0.25
+PESO_MEDIA = 0.3
+RECUO = 1.5
+JITTER = 0.15
+TEMPO_SONDA = 20
+
+# O Brasil não tem horário de verão desde 2019
+FUSO_BRASILIA = timezone(timedelta(hours=-3), 'BRT')
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+PADRAO_SCRIPT = re.compile(r'<(script|style|noscript)\b.*?</\1>', re.S | re.I)
+PADRAO_TAG = re.compile(r'<[^>]+>')
+PADRAO_HREF = re.compile(r'href=["\']([^"\']+)["\']', re.I)
+
+
+def agora():
+    return datetime.now(FUSO_BRASILIA)
+
+
+def horario_silencio():
+    """(hora inicial, hora final) de SCRAPER_SILENCIO='22-6', ou None"""
+    valor = os.getenv('SCRAPER_SILENCIO', '')
+    if not valor:
+        return None
+    inicio, _, fim = valor.partition('-')
+    return int(inicio), int(fim)
+
+
+def fora_do_silencio(momento, silencio=None):
+    """O próprio momento, ou o fim do horário de silêncio em que ele cai"""
+    silencio = silencio if silencio is not None else horario_silencio()
+    if not silencio:
+        return momento
+    inicio, fim = silencio
+    hora = momento.hour
+    dentro = inicio <= hora < fim if inicio < fim else hora >= inicio or hora < fim
+    if not dentro:
+        return momento
+    fim_silencio = momento.replace(hour=fim, minute=0, second=0, microsecond=0)
+    if fim_silencio <= momento:
+        fim_silencio += timedelta(days=1)
+    # Espalha as fontes nos primeiros minutos depois do silêncio
+    return fim_silencio + timedelta(seconds=random.uniform(0, 10 * 60))
+
+
+def impressao_pagina(html):
+    """Hash do texto visível e dos links da página (ignora scripts, estilos e espaços)"""
+    sem_scripts = PADRAO_SCRIPT.sub(' ', html)
+    texto = ' '.join(PADRAO_TAG.sub(' ', sem_scripts).split())
+    hrefs = sorted(set(PADRAO_HREF.findall(sem_scripts)))
+    return hashlib.sha1((texto + '\n' + '\n'.join(hrefs)).encode('utf-8')).hexdigest()
+
+
+def _requisitar(url, metodo):
+    requisicao = Request(url, method=metodo, headers={'User-Agent': USER_AGENT})
+    return urlopen(requisicao, timeout=TEMPO_SONDA)
+
+
+def sondar(url, anteriores):
+    """Validadores atuais da página: HEAD primeiro; o corpo só é baixado e hasheado se o
+    servidor não mandar ETag/Last-Modified ou se eles mudaram"""
+    validadores = {}
+    try:
+        with _requisitar(url, 'HEAD') as resposta:
+            validadores['etag'] = resposta.headers.get('ETag')
+            validadores['last_modified'] = resposta.headers.get('Last-Modified')
+    except HTTPError as e:
+        # Servidores que não aceitam HEAD (405, 403...) caem no GET
+        if e.code < 400 or e.code >= 500:
+            raise
+
+    tem_cabecalhos = validadores.get('etag') or validadores.get('last_modified')
+    mesmos_cabecalhos = tem_cabecalhos and all(
+        validadores.get(chave) == anteriores.get(chave) for chave in ('etag', 'last_modified'))
+    if mesmos_cabecalhos and anteriores.get('hash'):
+        validadores['hash'] = anteriores['hash']
+        return validadores
+
+    with _requisitar(url, 'GET') as resposta:
+        html = resposta.read().decode(resposta.headers.get_content_charset() or 'utf-8', errors='replace')
+    validadores['hash'] = impressao_pagina(html)
+    return validadores
+
+
+class EstadoFonte:
+    """Validadores, intervalo e média entre mudanças de uma fonte"""
+
+    def __init__(self, fonte, dados=None):
+        dados = dados or {}
+        self.fonte = fonte
+        self.validadores = dados.get('validadores', {})
+        self.intervalo = dados.get('intervalo', INTERVALO_INICIAL)
+        self.media_entre_mudancas = dados.get('media_entre_mudancas')
+        self.ultima_mudanca = dados.get('ultima_mudanca')
+        self.proxima_verificacao = dados.get('proxima_verificacao')
+        self.verificacoes = dados.get('verificacoes', 0)
+        self.mudancas = dados.get('mudancas', 0)
+        self.erros = dados.get('erros', 0)
+
+    def para_dict(self):
+        return {
+            'validadores': self.validadores,
+            'intervalo': self.intervalo,
+            'media_entre_mudancas': self.media_entre_mudancas,
+            'ultima_mudanca': self.ultima_mudanca,
+            'proxima_verificacao': self.proxima_verificacao,
+            'verificacoes': self.verificacoes,
+            'mudancas': self.mudancas,
+            'erros': self.erros,
+        }
+
+    def vencida(self, momento):
+        return not self.proxima_verificacao or datetime.fromisoformat(self.proxima_verificacao) <= momento
+
+    def registrar_mudanca(self, momento):
+        """Aprende com o tempo desde a mudança anterior e encurta o intervalo"""
+        if self.ultima_mudanca:
+            desde_anterior = (momento - datetime.fromisoformat(self.ultima_mudanca)).total_seconds()
+            if self.media_entre_mudancas is None:
+                self.media_entre_mudancas = desde_anterior
+            else:
+                self.media_entre_mudancas = (PESO_MEDIA * desde_anterior
+                                             + (1 - PESO_MEDIA) * self.media_entre_mudancas)
+        self.ultima_mudanca = momento.isoformat()
+        self.mudancas += 1
+        if self.media_entre_mudancas:
+            self.intervalo = self.media_entre_mudancas * FRACAO_DA_MEDIA
+        else:
+            self.intervalo /= 2
+        self.intervalo = min(max(self.intervalo, INTERVALO_MINIMO), INTERVALO_MAXIMO)
+
+    def registrar_sem_mudanca(self):
+        """Recuo exponencial, limitado a metade da média entre mudanças (quando já conhecida)"""
+        limite = INTERVALO_MAXIMO
+        if self.media_entre_mudancas:
+            limite = min(limite, max(self.media_entre_mudancas / 2, INTERVALO_MINIMO))
+        self.intervalo = min(self.intervalo * RECUO, limite)
+
+    def agendar(self, momento, intervalo=None):
+        atraso = (intervalo or self.intervalo) * random.uniform(1 - JITTER, 1 + JITTER)
+        self.proxima_verificacao = fora_do_silencio(momento + timedelta(seconds=atraso)).isoformat()
+
+
+def carregar_estado(caminho=CAMINHO_ESTADO):
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+    except FileNotFoundError:
+        dados = {}
+    except json.JSONDecodeError as e:
+        print(f"⚠️ Estado do vigia inválido ({e}), começando do zero")
+        dados = {}
+    return {fonte: EstadoFonte(fonte, dados.get(fonte)) for fonte in FONTES}
+
+
+def salvar_estado(estados, caminho=CAMINHO_ESTADO):
+    os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+    temporario = f"{caminho}.tmp"
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump({fonte: estado.para_dict() for fonte, estado in estados.items()}, f,
+                  ensure_ascii=False, indent=2)
+    os.replace(temporario, caminho)
+
+
+def coletar_fonte(fonte):
+    """Coleta completa de uma fonte num processo separado (o Chrome não fica aberto entre coletas)"""
+    print(f"🕷️ {fonte}: executando coletar.py {fonte}")
+    processo = subprocess.run([sys.executable, 'coletar.py', fonte],
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+    return processo.returncode == 0
+
+
+def verificar_fonte(estado, coletar=coletar_fonte, sonda=sondar):
+    """Sonda a fonte, coleta se mudou e agenda a próxima verificação"""
+    momento = agora()
+    estado.verificacoes += 1
+    try:
+        validadores = sonda(FONTES[estado.fonte], estado.validadores)
+    except Exception as e:
+        # Erro de rede: tenta de novo no mesmo intervalo, sem mexer nos validadores
+        estado.erros += 1
+        print(f"⚠️ {estado.fonte}: sonda falhou ({e})")
+        estado.agendar(momento)
+        return False
+
+    if not estado.validadores:
+        # Primeira verificação: só registra a página como referência
+        print(f"📌 {estado.fonte}: referência registrada")
+        estado.validadores = validadores
+    elif validadores['hash'] == estado.validadores.get('hash'):
+        estado.validadores = validadores
+        estado.registrar_sem_mudanca()
+        print(f"💤 {estado.fonte}: sem mudança")
+    else:
+        print(f"🔔 {estado.fonte}: página mudou")
+        if not coletar(estado.fonte):
+            # Sem atualizar os validadores: a próxima sonda, em pouco tempo, dispara a coleta de novo
+            print(f"❌ {estado.fonte}: coleta falhou")
+            estado.agendar(momento, INTERVALO_MINIMO)
+            return False
+        estado.validadores = validadores
+        estado.registrar_mudanca(momento)
+
+    estado.agendar(momento)
+    print(f"   ⏭️ próxima verificação em {estado.proxima_verificacao[:16]} "
+          f"(intervalo {estado.intervalo / 60:.0f} min)")
+    return True
+
+
+def mostrar_estado(estados):
+    for fonte, estado in estados.items():
+        media = (f"{estado.media_entre_mudancas / 3600:.1f}h" if estado.media_entre_mudancas else '-')
+        print(f"👀 {fonte}: {estado.verificacoes} verificações, {estado.mudancas} mudanças, "
+              f"{estado.erros} erros")
+        print(f"   Intervalo: {estado.intervalo / 60:.0f} min | média entre mudanças: {media} | "
+              f"próxima: {(estado.proxima_verificacao or '-')[:16]}")
+
+
+def main():
+    print("👀 VIGIA DAS FONTES")
+    print("=" * 50)
+
+    estados = carregar_estado()
+    if '--estado' in sys.argv:
+        mostrar_estado(estados)
+        return 0
+
+    parar = []
+    signal.signal(signal.SIGTERM, lambda *args: parar.append(True))
+
+    uma_vez = '--uma-vez' in sys.argv
+    try:
+        while not parar:
+            momento = agora()
+            for estado in estados.values():
+                if estado.vencida(momento) or uma_vez:
+                    verificar_fonte(estado)
+                    salvar_estado(estados)
+            if uma_vez:
+                break
+
+            proxima = min(datetime.fromisoformat(estado.proxima_verificacao) for estado in estados.values())
+            espera = max((proxima - agora()).total_seconds(), 1)
+            print(f"⏳ Aguardando até {proxima.strftime('%d/%m %H:%M')}")
+            # Em passos curtos para atender o SIGTERM
+            fim = time.monotonic() + espera
+            while not parar and time.monotonic() < fim:
+                time.sleep(max(0, min(30, fim - time.monotonic())))
+    except KeyboardInterrupt:
+        pass
+
+    salvar_estado(estados)
+    print("🛑 Vigia encerrado")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())